@@ -0,0 +1,156 @@
+"""Benchmark updating and deleting many schedules.
+
+Compares loading the rows and updating or deleting them one by one, with a
+commit per row (the previous behaviour), against CRUDMixin.bulk_update and
+CRUDMixin.bulk_delete, which issue a single statement per chunk of ids and
+commit once. Every row gets its own status, like a batch of status reports
+coming back from the clusters. The per row path takes minutes for 10k rows,
+so it only runs on the first n_per_row rows and throughputs are compared.
+Runs against a temporary SQLite database, pass a database uri to run it
+against another database.
+
+usage: BLACKCAP_CONFIG=TESTING python benchmarks/bulk_update.py [n_rows] [n_per_row] [db_uri] # noqa: B950
+"""
+
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from blackcap.models.meta.mixins import DBModel
+from blackcap.models.schedule import ScheduleDB
+
+STATUS_LIST = ["RUNNING", "COMPLETED", "FAILED"]
+
+
+def insert_schedules(DBSession: Any, n_rows: int) -> List[Any]:
+    """Insert schedules.
+
+    Args:
+        DBSession (Any): Session factory
+        n_rows (int): Number of schedules to insert
+
+    Returns:
+        List[Any]: Ids of the inserted schedules
+    """
+    job_id, cluster_id, protagonist_id = uuid4(), uuid4(), uuid4()
+    schedule_db_list = [
+        ScheduleDB(
+            id=uuid4(),
+            job_id=job_id,
+            assigned_cluster_id=cluster_id,
+            protagonist_id=protagonist_id,
+        )
+        for _ in range(n_rows)
+    ]
+    with DBSession() as session:
+        ScheduleDB.bulk_create(schedule_db_list, session)
+        return session.execute(select(ScheduleDB.id)).scalars().all()
+
+
+def status_updates(id_list: List[Any]) -> List[Dict[str, Any]]:
+    """Build one status update per schedule.
+
+    Args:
+        id_list (List[Any]): Ids of the schedules
+
+    Returns:
+        List[Dict[str, Any]]: Values to set per schedule
+    """
+    return [
+        {"id": schedule_id, "status": STATUS_LIST[index % len(STATUS_LIST)]}
+        for index, schedule_id in enumerate(id_list)
+    ]
+
+
+def update_per_row(DBSession: Any, values_list: List[Dict[str, Any]]) -> None:
+    """Update schedules one by one, as previously done.
+
+    Args:
+        DBSession (Any): Session factory
+        values_list (List[Dict[str, Any]]): Values to set per schedule
+    """
+    stmt = select(ScheduleDB).where(
+        ScheduleDB.id.in_([values["id"] for values in values_list])
+    )
+    with DBSession() as session:
+        for schedule in session.execute(stmt).scalars().all():
+            for values in values_list:
+                if values["id"] == schedule.id:
+                    schedule.update(session, status=values["status"])
+
+
+def delete_per_row(DBSession: Any, id_list: List[Any]) -> None:
+    """Delete schedules one by one, as previously done.
+
+    Args:
+        DBSession (Any): Session factory
+        id_list (List[Any]): Ids of the schedules
+    """
+    stmt = select(ScheduleDB).where(ScheduleDB.id.in_(id_list))
+    with DBSession() as session:
+        for schedule in session.execute(stmt).scalars().all():
+            schedule.delete(session)
+
+
+def main(n_rows: int, n_per_row: int, db_uri: str) -> None:
+    """Run the benchmark.
+
+    Args:
+        n_rows (int): Number of schedules to update and delete in bulk
+        n_per_row (int): Number of schedules to update and delete one by one
+        db_uri (str): Database to run against
+    """
+    engine = create_engine(db_uri)
+    DBModel.metadata.drop_all(engine)
+    DBModel.metadata.create_all(engine)
+    DBSession = sessionmaker(engine)
+    throughputs = {}
+
+    id_list = insert_schedules(DBSession, n_per_row)
+    start = time.perf_counter()
+    update_per_row(DBSession, status_updates(id_list))
+    throughputs["update, per row"] = n_per_row / (time.perf_counter() - start)
+    start = time.perf_counter()
+    delete_per_row(DBSession, id_list)
+    throughputs["delete, per row"] = n_per_row / (time.perf_counter() - start)
+
+    id_list = insert_schedules(DBSession, n_rows)
+    start = time.perf_counter()
+    with DBSession() as session:
+        updated_row_list = ScheduleDB.bulk_update(status_updates(id_list), session)
+    throughputs["update, bulk"] = n_rows / (time.perf_counter() - start)
+    assert len(updated_row_list) == n_rows
+    start = time.perf_counter()
+    with DBSession() as session:
+        deleted_row_list = ScheduleDB.bulk_delete(id_list, session)
+    throughputs["delete, bulk"] = n_rows / (time.perf_counter() - start)
+    assert len(deleted_row_list) == n_rows
+
+    print(f"{engine.dialect.name}, per row: {n_per_row} rows, bulk: {n_rows} rows")
+    for name, rows_per_second in throughputs.items():
+        print(f"{name + ':':26}{rows_per_second:12.0f} rows/s")
+    for operation in ["update", "delete"]:
+        speedup = (
+            throughputs[f"{operation}, bulk"] / throughputs[f"{operation}, per row"]
+        )
+        print(f"{operation + ' speedup:':26}{speedup:12.1f}x")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+            (
+                sys.argv[3]
+                if len(sys.argv) > 3
+                else f"sqlite:///{os.path.join(tmp_dir, 'bulk_update.db')}"
+            ),
+        )
@@ -0,0 +1,103 @@
+"""Benchmark failure throughput of the flow engine.
+
+Every failing step builds FlowExecErrors through get_outer_function. Compares
+looking the caller up with inspect.getframeinfo, which reads source lines
+(the previous behaviour), against reading the code object of the frame.
+Both the bare lookup and whole failing flows are timed.
+
+usage: BLACKCAP_CONFIG=TESTING python benchmarks/flow_failure.py [n_flows]
+"""
+
+import inspect
+import sys
+import time
+from typing import Callable, List
+from unittest import mock
+
+from blackcap.flow import Executor, executor, Flow, FlowExecError, Prop, Step
+from blackcap.flow.flow import get_outer_function
+from blackcap.flow.step import dummy_backward
+
+
+def getframeinfo_outer_function() -> str:
+    """Return name of the outer function, as previously done.
+
+    Returns:
+        str: Name of the outer function
+    """
+    return inspect.getframeinfo(inspect.currentframe().f_back).function
+
+
+def failing_step(inputs: List[Prop]) -> List[Prop]:
+    """Step failing like a bloc does when the DB is down.
+
+    Args:
+        inputs (List[Prop]): Ignored
+
+    Raises:
+        FlowExecError: Always
+    """
+    # get_outer_function is looked up on the executor module so that both
+    # the executor and this step use the implementation under test
+    try:
+        raise ConnectionError("DB is down")
+    except ConnectionError as e:
+        raise FlowExecError(
+            human_description="Creating DB object failed",
+            error=e,
+            error_type=type(e),
+            is_user_facing=False,
+            error_in_function=executor.get_outer_function(),
+        ) from e
+
+
+def run_failing_flow() -> None:
+    """Run a flow of two passing steps and a failing one."""
+    flow = Flow()
+    for _ in range(2):
+        flow.add_step(
+            Step(dummy_backward, dummy_backward), [Prop(data={}, description="")]
+        )
+    flow.add_step(Step(failing_step, dummy_backward), [])
+    Executor(flow, {}, hooks=[]).run()
+
+
+def time_calls(func: Callable[[], None], n_calls: int) -> float:
+    """Time calls of a function.
+
+    Args:
+        func (Callable[[], None]): Function to call
+        n_calls (int): Number of calls
+
+    Returns:
+        float: Calls per second
+    """
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        func()
+    return n_calls / (time.perf_counter() - start)
+
+
+def main(n_flows: int) -> None:
+    """Run the benchmark.
+
+    Args:
+        n_flows (int): Number of failing flows per mode
+    """
+    lookup_before = time_calls(getframeinfo_outer_function, n_flows * 10)
+    lookup_after = time_calls(get_outer_function, n_flows * 10)
+
+    with mock.patch.object(executor, "get_outer_function", getframeinfo_outer_function):
+        flows_before = time_calls(run_failing_flow, n_flows)
+    flows_after = time_calls(run_failing_flow, n_flows)
+
+    print(f"python {sys.version.split()[0]}, flows per mode: {n_flows}")
+    print(f"lookup, getframeinfo:     {lookup_before:12.0f} calls/s")
+    print(f"lookup, code object:      {lookup_after:12.0f} calls/s")
+    print(f"failing flows, before:    {flows_before:12.0f} flows/s")
+    print(f"failing flows, after:     {flows_after:12.0f} flows/s")
+    print(f"speedup:                  {flows_after / flows_before:12.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
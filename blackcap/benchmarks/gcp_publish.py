@@ -0,0 +1,114 @@
+"""Benchmark per-publish latency of the GCP messenger.
+
+Compares rebuilding credentials and the publisher client for every message
+(the previous behaviour) against the cached clients. The network call is
+replaced by an already resolved future so only client side overhead is timed.
+
+usage: BLACKCAP_CONFIG=TESTING python benchmarks/gcp_publish.py [n_msgs]
+"""
+
+from concurrent.futures import Future
+import json
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import time
+from typing import Any, Callable
+from unittest import mock
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from google.cloud import pubsub_v1
+
+from blackcap.configs import config_registry
+from blackcap.messenger.gcp_messenger import GCPMessenger
+
+
+def write_fake_service_account(path: Path) -> None:
+    """Write a service account json with a freshly generated private key.
+
+    Args:
+        path (Path): Path of the json file
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+    info = {
+        "type": "service_account",
+        "client_email": "bench@orchestra.iam.gserviceaccount.com",
+        "private_key_id": "bench",
+        "private_key": pem,
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+    path.write_text(json.dumps(info))
+
+
+def resolved_publish(*args: Any, **kwargs: Any) -> Future:
+    """Stand in for PublisherClient.publish.
+
+    Args:
+        *args (Any): Ignored
+        **kwargs (Any): Ignored
+
+    Returns:
+        Future: Resolved future
+    """
+    future = Future()
+    future.set_result("msg-id")
+    return future
+
+
+def time_publish(publish: Callable[[], None], n_msgs: int) -> float:
+    """Time publish calls.
+
+    Args:
+        publish (Callable[[], None]): Function publishing a single msg
+        n_msgs (int): Number of msgs to publish
+
+    Returns:
+        float: Mean latency per msg in milliseconds
+    """
+    start = time.perf_counter()
+    for _ in range(n_msgs):
+        publish()
+    return (time.perf_counter() - start) * 1000 / n_msgs
+
+
+def main(n_msgs: int) -> None:
+    """Run the benchmark.
+
+    Args:
+        n_msgs (int): Number of msgs to publish per mode
+    """
+    config = config_registry.get_config().copy()
+    msg = {"msg_type": "to_demon_schedule_msg", "data": {}, "timestamp": ""}
+    with TemporaryDirectory() as tmp_dir:
+        creds_path = Path(tmp_dir) / "keys.json"
+        write_fake_service_account(creds_path)
+        config.GOOGLE_APPLICATION_CREDENTIALS = str(creds_path)
+        messenger = GCPMessenger(config)
+
+        def uncached() -> None:
+            messenger.reset_clients()
+            messenger._service_account_info = None
+            messenger.publish(msg, "bench-topic")
+
+        def cached() -> None:
+            messenger.publish(msg, "bench-topic")
+
+        with mock.patch.object(pubsub_v1.PublisherClient, "publish", resolved_publish):
+            before = time_publish(uncached, n_msgs)
+            messenger.publisher  # warm up the cache
+            after = time_publish(cached, n_msgs)
+
+    print(f"msgs per mode:        {n_msgs}")
+    print(f"new client per msg:   {before:.3f} ms/msg")
+    print(f"cached client:        {after:.3f} ms/msg")
+    print(f"speedup:              {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,155 @@
+"""Benchmark assigning large schedule batches to clusters.
+
+Compares scheduling each request independently with the random scheduler
+(the previous behaviour) against the batch schedulers. The cluster
+inventory and the job requirements are served from memory so only the
+assignment is timed. Max backlog is the highest expected backlog per unit
+of capacity of the clusters that received jobs, once the batch is placed.
+It bounds how long the unluckiest job of the batch waits, lower is better.
+
+usage: BLACKCAP_CONFIG=TESTING python benchmarks/schedule_batch.py [n_jobs] [n_clusters] # noqa: B950
+"""
+
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+from unittest import mock
+from uuid import UUID, uuid4
+
+from blackcap.observer.base import BaseObserver
+from blackcap.scheduler.base import BaseScheduler
+from blackcap.scheduler.bin_packing_scheduler import BinPackingScheduler
+from blackcap.scheduler.capabilities import CapabilityIndex
+from blackcap.scheduler.inventory import cluster_inventory
+from blackcap.scheduler.least_loaded_scheduler import LeastLoadedScheduler
+from blackcap.scheduler.random_scheduler import RandomScheduler
+from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
+from blackcap.schemas.metrics import Metrics
+
+
+class StaticObserver(BaseObserver):
+    """Observer returning fixed metrics."""
+
+    def __init__(self: "StaticObserver", metrics_list: List[Metrics]) -> None:
+        """Initialize observer.
+
+        Args:
+            metrics_list (List[Metrics]): Metrics to return
+        """
+        self.metrics_list = metrics_list
+
+    def get_metrics(self: "StaticObserver", range: str) -> List[Metrics]:
+        """Get cluster metrics.
+
+        Args:
+            range (str): Ignored
+
+        Returns:
+            List[Metrics]: Fixed metrics
+        """
+        return self.metrics_list
+
+
+def max_backlog(
+    schedule_create_list: List[ScheduleCreate], metrics: Dict[UUID, Metrics]
+) -> float:
+    """Highest expected backlog per unit of capacity of the clusters used.
+
+    Args:
+        schedule_create_list (List[ScheduleCreate]): Scheduled requests
+        metrics (Dict[UUID, Metrics]): Metrics by cluster ID
+
+    Returns:
+        float: Max backlog per unit of capacity
+    """
+    assigned = {cluster_id: 0 for cluster_id in metrics}
+    for schedule_create in schedule_create_list:
+        assigned[schedule_create.assigned_cluster_id] += 1
+    return max(
+        (m.queued_jobs + assigned[cluster_id]) / max(m.free_cores + m.completed_jobs, 1)
+        for cluster_id, m in metrics.items()
+        if assigned[cluster_id] > 0
+    )
+
+
+def time_schedule(
+    schedule: Callable[[List[ScheduleCreate]], List[ScheduleCreate]], n_jobs: int
+) -> (float, List[ScheduleCreate]):
+    """Time scheduling a batch.
+
+    Args:
+        schedule (Callable[[List[ScheduleCreate]], List[ScheduleCreate]]): Scheduling function # noqa: B950
+        n_jobs (int): Number of requests in the batch
+
+    Returns:
+        (float, List[ScheduleCreate]): Duration in milliseconds and scheduled requests
+    """
+    schedule_create_list = [ScheduleCreate(job_id=uuid4()) for _ in range(n_jobs)]
+    start = time.perf_counter()
+    scheduled = schedule(schedule_create_list)
+    return (time.perf_counter() - start) * 1000, scheduled
+
+
+def main(n_jobs: int, n_clusters: int) -> None:
+    """Run the benchmark.
+
+    Args:
+        n_jobs (int): Number of requests in the batch
+        n_clusters (int): Number of clusters
+    """
+    rng = random.Random(42)
+    clusters = [
+        Cluster(
+            cluster_id=uuid4(),
+            name=f"cluster-{i}",
+            cluster_type="SLURM",
+            cluster_caps="CPU",
+            messenger="NATS",
+            messenger_queue=f"cluster-{i}",
+        )
+        for i in range(n_clusters)
+    ]
+    metrics_list = [
+        Metrics(
+            cluster_id=cluster.cluster_id,
+            queued_jobs=rng.randint(0, 2000),
+            total_cores=4096,
+            free_cores=rng.randint(0, 4096),
+            completed_jobs=rng.randint(0, 500),
+        )
+        for cluster in clusters
+    ]
+    metrics = {m.cluster_id: m for m in metrics_list}
+    observer = StaticObserver(metrics_list)
+    random_scheduler = RandomScheduler()
+
+    modes = {
+        "random, per request": lambda batch: [
+            random_scheduler.schedule(schedule_create) for schedule_create in batch
+        ],
+        "random, batch": random_scheduler.schedule_batch,
+        "least loaded, batch": LeastLoadedScheduler(observer).schedule_batch,
+        "bin packing, batch": BinPackingScheduler(observer).schedule_batch,
+    }
+    index = CapabilityIndex(clusters)
+    with mock.patch.object(
+        cluster_inventory, "get_index", lambda: index
+    ), mock.patch.object(
+        BaseScheduler, "get_cluster_caps_reqs", lambda self, job_ids: {}
+    ):
+        print(f"jobs: {n_jobs}, clusters: {n_clusters}")
+        for name, schedule in modes.items():
+            duration, scheduled = time_schedule(schedule, n_jobs)
+            print(
+                f"{name:<22} {duration:9.1f} ms   "
+                f"max backlog {max_backlog(scheduled, metrics):8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
@@ -9,6 +9,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from blackcap.db import DBSession
 from blackcap.flow import Flow, FlowExecError, get_outer_function, Prop, Step
 from blackcap.models.cluster import ClusterDB
+from blackcap.scheduler.inventory import cluster_inventory
 from blackcap.schemas.api.cluster.delete import ClusterDelete
 from blackcap.schemas.api.cluster.get import (
     ClusterGetQueryParams,
@@ -42,6 +43,7 @@ def create_cluster(
                 for cluster_create in cluster_create_list
             ]
             ClusterDB.bulk_create(cluster_db_create_list, session)
+            cluster_inventory.invalidate()
             return [
                 Cluster(cluster_id=obj.id, **obj.to_dict())
                 for obj in cluster_db_create_list
@@ -126,6 +128,7 @@ def update_cluster(
                                 **updated_cluster.to_dict(),
                             )
                         )
+            cluster_inventory.invalidate()
             return updated_cluster_list
         except Exception as e:
             session.rollback()
@@ -166,6 +169,7 @@ def delete_cluster(
                 deleted_cluster_list.append(
                     Cluster(cluster_id=cluster.id, **cluster.to_dict())
                 )
+            cluster_inventory.invalidate()
             return deleted_cluster_list
         except Exception as e:
             session.rollback()
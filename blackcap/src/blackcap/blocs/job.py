@@ -1,14 +1,17 @@
 """Job BLoCs."""
 
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
 
 from logzero import logger
 from pydantic import ValidationError
 from pydantic.error_wrappers import ErrorWrapper
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
 
-from blackcap.db import DBSession
+from blackcap.db import DBSession, iter_scalars, QUERY_CHUNK_SIZE
 from blackcap.flow import Flow, FlowExecError, FuncProp, get_outer_function, Prop, Step
 from blackcap.flow.step import dummy_backward
 from blackcap.models.job import JobDB
@@ -16,8 +19,19 @@ from blackcap.schemas.api.job.delete import JobDelete
 from blackcap.schemas.api.job.get import JobGetQueryParams, JobQueryType
 from blackcap.schemas.api.job.post import JobCreate
 from blackcap.schemas.api.job.put import JobUpdate
-from blackcap.schemas.job import Job
+from blackcap.schemas.job import Job, JobSummary
 from blackcap.schemas.user import User
+from blackcap.utils.pagination import paginate, split_page
+
+# Columns loaded for job summaries, created_at is needed for pagination
+JOB_SUMMARY_COLUMNS = [
+    JobDB.id,
+    JobDB.created_at,
+    JobDB.name,
+    JobDB.description,
+    JobDB.job_type,
+    JobDB.cluster_caps_req,
+]
 
 ###
 # CRUD BLoCs
@@ -54,26 +68,47 @@ def create_job(job_create_list: List[JobCreate], user_creds: User) -> List[Job]:
             raise e
 
 
-def get_job(  # noqa: C901
-    query_params: JobGetQueryParams, user_creds: User
-) -> List[Job]:
+def get_job(query_params: JobGetQueryParams, user_creds: User) -> List[Job]:
     """Query DB for jobs.
 
+    Args:
+        query_params (JobGetQueryParams): Query params from request
+        user_creds (User): User credentials.
+
+    Returns:
+        List[Job]: List of jobs returned from DB
+    """
+    return get_job_page(query_params, user_creds)[0]
+
+
+def build_job_query(  # noqa: C901
+    query_params: JobGetQueryParams, user_creds: User
+) -> Select:
+    """Build the DB query of a job GET request.
+
     Args:
         query_params (JobGetQueryParams): Query params from request
         user_creds (User): User credentials.
 
     Raises:
         e: error
-        Exception: error
 
     Returns:
-        List[Job]: List of jobs returned from DB
+        Select: Query selecting the jobs
     """
-    job_list: List[JobDB] = []
-
     stmt = ""
 
+    if query_params.query_type in (
+        JobQueryType.GET_JOBS_BY_CREATE_TIMERANGE,
+        JobQueryType.GET_JOBS_BY_FINISHED_TIMERANGE,
+    ):
+        e = ValidationError(
+            errors=[
+                ErrorWrapper(ValueError("query type not supported"), "query_type"),
+            ],
+            model=JobGetQueryParams,
+        )
+        raise e
     if query_params.query_type == JobQueryType.GET_ALL_JOBS:
         stmt = select(JobDB).where(JobDB.protagonist_id == user_creds.user_id)
     if query_params.query_type == JobQueryType.GET_JOBS_BY_ID:
@@ -120,17 +155,174 @@ def get_job(  # noqa: C901
             .where(JobDB.protagonist_id == user_creds.user_id)
             .where(JobDB.id == query_params.job_status)
         )
+    if query_params.summary:
+        stmt = stmt.options(load_only(*JOB_SUMMARY_COLUMNS))
+    return stmt
+
+
+def job_from_db(job_db: JobDB, summary: bool) -> JobSummary:
+    """Convert a job DB record into a Job or a JobSummary.
+
+    Args:
+        job_db (JobDB): Job DB record
+        summary (bool): Only read the summary columns
+
+    Returns:
+        JobSummary: Job, or JobSummary if summary is True
+    """
+    if summary:
+        return JobSummary(
+            job_id=job_db.id,
+            name=job_db.name,
+            description=job_db.description or "",
+            job_type=job_db.job_type or "",
+            cluster_caps_req=job_db.cluster_caps_req,
+        )
+    return Job(job_id=job_db.id, **job_db.to_dict())
+
+
+def get_job_page(
+    query_params: JobGetQueryParams, user_creds: User
+) -> Tuple[List[JobSummary], Optional[str]]:
+    """Query DB for a page of jobs, ordered by creation time.
+
+    Args:
+        query_params (JobGetQueryParams): Query params from request
+        user_creds (User): User credentials.
+
+    Raises:
+        Exception: error
+
+    Returns:
+        Tuple[List[JobSummary], Optional[str]]: List of jobs returned from DB and cursor of the next page # noqa: B950
+    """
+    job_list: List[JobSummary] = []
+    stmt = paginate(
+        build_job_query(query_params, user_creds),
+        JobDB,
+        query_params.cursor,
+        query_params.limit,
+    )
+    with DBSession() as session:
+        try:
+            job_db_list, next_cursor = split_page(
+                session.execute(stmt).scalars().all(), query_params.limit
+            )
+            job_list = [job_from_db(obj, query_params.summary) for obj in job_db_list]
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Unable to fetch jobs due to {e}")
+            raise e
+
+    return job_list, next_cursor
+
+
+def iter_jobs(
+    query_params: JobGetQueryParams, user_creds: User
+) -> Iterator[JobSummary]:
+    """Iterate over all the jobs of a query, ordered by creation time.
+
+    Jobs are fetched from the DB in batches of DB_YIELD_PER rows while the
+    iterator is consumed. The limit is ignored, the cursor is honoured.
+
+    Args:
+        query_params (JobGetQueryParams): Query params from request
+        user_creds (User): User credentials.
+
+    Returns:
+        Iterator[JobSummary]: Jobs returned from DB
+    """
+    stmt = paginate(
+        build_job_query(query_params, user_creds), JobDB, query_params.cursor, None
+    )
+    return (
+        job_from_db(obj, query_params.summary)
+        for obj in iter_scalars(stmt, "Unable to fetch jobs")
+    )
+
+
+def get_jobs_by_ids(job_id_list: List[UUID], user_creds: User) -> Dict[UUID, Job]:
+    """Fetch full jobs, with their script and specifications, by id.
+
+    Each job is fetched once however many times its id is listed.
+
+    Args:
+        job_id_list (List[UUID]): List of ids of jobs
+        user_creds (User): User credentials.
 
+    Raises:
+        Exception: error
+
+    Returns:
+        Dict[UUID, Job]: Jobs found, by id
+    """
+    unique_job_ids = list({UUID(str(job_id)) for job_id in job_id_list})
+    job_dict: Dict[UUID, Job] = {}
     with DBSession() as session:
         try:
-            job_db_list: List[JobDB] = session.execute(stmt).scalars().all()
-            job_list = [Job(job_id=obj.id, **obj.to_dict()) for obj in job_db_list]
+            for start in range(0, len(unique_job_ids), QUERY_CHUNK_SIZE):
+                stmt = (
+                    select(JobDB)
+                    .where(JobDB.protagonist_id == user_creds.user_id)
+                    .where(
+                        JobDB.id.in_(unique_job_ids[start : start + QUERY_CHUNK_SIZE])
+                    )
+                )
+                for obj in session.execute(stmt).scalars():
+                    job_dict[obj.id] = job_from_db(obj, False)
         except Exception as e:
             session.rollback()
             logger.error(f"Unable to fetch jobs due to {e}")
             raise e
+    return job_dict
+
+
+def get_missing_job_ids(job_id_list: List[str], user_creds: User) -> Set[str]:
+    """Find the jobs of a list that do not exist or belong to another user.
+
+    Only the IDs of the requested jobs are read from the DB.
+
+    Args:
+        job_id_list (List[str]): List of ids of jobs
+        user_creds (User): User credentials.
+
+    Raises:
+        Exception: error
+
+    Returns:
+        Set[str]: Ids of the missing jobs
+    """
+    missing_job_ids: Set[str] = set()
+    requested_job_ids: Set[str] = set()
+    for job_id in job_id_list:
+        try:
+            requested_job_ids.add(str(UUID(str(job_id))))
+        except ValueError:
+            missing_job_ids.add(str(job_id))
+
+    requested_job_id_list = list(requested_job_ids)
+    found_job_ids: Set[str] = set()
+    with DBSession() as session:
+        try:
+            for start in range(0, len(requested_job_id_list), QUERY_CHUNK_SIZE):
+                stmt = (
+                    select(JobDB.id)
+                    .where(JobDB.protagonist_id == user_creds.user_id)
+                    .where(
+                        JobDB.id.in_(
+                            requested_job_id_list[start : start + QUERY_CHUNK_SIZE]
+                        )
+                    )
+                )
+                found_job_ids.update(
+                    str(job_id) for job_id in session.execute(stmt).scalars()
+                )
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Unable to check jobs existence due to {e}")
+            raise e
 
-    return job_list
+    return missing_job_ids | (requested_job_ids - found_job_ids)
 
 
 def update_job(job_update_list: List[JobUpdate], user_creds: User) -> List[Job]:
@@ -146,31 +338,20 @@ def update_job(job_update_list: List[JobUpdate], user_creds: User) -> List[Job]:
     Returns:
         List[Job]: List of Instance of Updated Job
     """
-    stmt = (
-        select(JobDB)
-        .where(JobDB.protagonist_id == user_creds.user_id)
-        .where(JobDB.id.in_([job_update.template_id for job_update in job_update_list]))
-    )
+    job_values_list = []
+    for job_update in job_update_list:
+        job_update_dict = job_update.dict(exclude_defaults=True)
+        job_update_dict["id"] = job_update_dict.pop("job_id")
+        job_values_list.append(job_update_dict)
     with DBSession() as session:
         try:
-            job_db_update_list: List[JobDB] = session.execute(stmt).scalars().all()
-            updated_job_list = []
-            for job in job_db_update_list:
-                for job_update in job_update_list:
-                    if job_update.job_id == job.id:
-                        job_update_dict = job_update.dict(exclude_defaults=True)
-                        job_update_dict.pop("job_id")
-                        updated_job = job.update(session, **job_update_dict)
-                        updated_job_list.append(
-                            Job(
-                                job_id=updated_job.id,
-                                **updated_job.to_dict(),
-                            )
-                        )
-            return updated_job_list
+            updated_row_list = JobDB.bulk_update(
+                job_values_list, session, JobDB.protagonist_id == user_creds.user_id
+            )
+            return [Job(job_id=row["id"], **row) for row in updated_row_list]
         except Exception as e:
             session.rollback()
-            logger.error(f"Unable to update job: {job.to_dict()} due to {e}")
+            logger.error(f"Unable to update jobs: {job_values_list} due to {e}")
             raise e
 
 
@@ -187,22 +368,16 @@ def delete_job(job_delete_list: List[JobDelete], user_creds: User) -> List[Job]:
     Returns:
         List[Job]: List of Instance of Deleted Job
     """
-    stmt = (
-        select(JobDB)
-        .where(JobDB.protagonist_id == user_creds.user_id)
-        .where(JobDB.id.in_([job.job_id for job in job_delete_list]))
-    )
+    job_id_list = [job.job_id for job in job_delete_list]
     with DBSession() as session:
         try:
-            job_db_delete_list: List[JobDB] = session.execute(stmt).scalars().all()
-            deleted_job_list = []
-            for job in job_db_delete_list:
-                job.delete(session)
-                deleted_job_list.append(Job(job_id=job.id, **job.to_dict()))
-            return deleted_job_list
+            deleted_row_list = JobDB.bulk_delete(
+                job_id_list, session, JobDB.protagonist_id == user_creds.user_id
+            )
+            return [Job(job_id=row["id"], **row) for row in deleted_row_list]
         except Exception as e:
             session.rollback()
-            logger.error(f"Unable to delete job: {job.to_dict()} due to {e}")
+            logger.error(f"Unable to delete jobs: {job_id_list} due to {e}")
             raise e
 
 
@@ -228,7 +403,7 @@ def check_job_list_exist(inputs: List[Prop]) -> List[Prop]:
     Returns:
         List[Prop]:
 
-            Prop(data=job_list, description="List of job Objects ids")
+            Prop(data=job_id_list, description="List of job Objects ids")
     """
     try:
         job_id_list: List[str] = inputs[0].data
@@ -244,15 +419,7 @@ def check_job_list_exist(inputs: List[Prop]) -> List[Prop]:
 
     try:
         # Check job list existence
-        job_query = JobGetQueryParams(query_type=JobQueryType.GET_ALL_JOBS)
-        job_list: List[Job] = get_job(job_query, user)
-        job_list_ids = [str(job.job_id) for job in job_list]
-        # Use sets to optimize later
-        for job_id in job_id_list:
-            if job_id not in job_list_ids:
-                # Raise a user descriptive error later
-                raise Exception("JOB NOT FOUND")
-
+        missing_job_ids = get_missing_job_ids(job_id_list, user)
     except SQLAlchemyError as e:
         raise FlowExecError(
             human_description="Querying DB object failed",
@@ -270,8 +437,18 @@ def check_job_list_exist(inputs: List[Prop]) -> List[Prop]:
             error_in_function=get_outer_function(),
         ) from e
 
+    if len(missing_job_ids) > 0:
+        raise FlowExecError(
+            human_description="Jobs not found",
+            error=f"Jobs not found: {sorted(missing_job_ids)}",
+            error_type=LookupError,
+            is_user_facing=True,
+            error_in_function=get_outer_function(),
+            user_facing_msg=f"Jobs not found: {', '.join(sorted(missing_job_ids))}",
+        )
+
     return [
-        Prop(data=job_list, description="List of job Objects"),
+        Prop(data=job_id_list, description="List of job Objects ids"),
     ]
 
 
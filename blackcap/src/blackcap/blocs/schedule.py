@@ -1,25 +1,26 @@
 """Schedule BLoCs."""
 
+from collections import defaultdict
 from datetime import datetime
-from typing import List
-
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from logzero import logger
 from pydantic import ValidationError
 from pydantic.error_wrappers import ErrorWrapper
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import Select
 
-
+from blackcap.blocs.job import get_jobs_by_ids
 from blackcap.configs import config_registry
-from blackcap.blocs.job import get_job
-from blackcap.db import DBSession
+from blackcap.db import DBSession, iter_scalars
 from blackcap.flow import Flow, FlowExecError, FuncProp, get_outer_function, Prop, Step
 from blackcap.flow.step import dummy_backward
 from blackcap.messenger import messenger_registry
+from blackcap.messenger.base import PublishResult
 from blackcap.models.schedule import ScheduleDB
 from blackcap.scheduler import scheduler_registry
-from blackcap.schemas.api.job.get import JobGetQueryParams, JobQueryType
+from blackcap.scheduler.capabilities import UnsatisfiableJobError
 from blackcap.schemas.api.schedule.delete import ScheduleDelete
 from blackcap.schemas.api.schedule.get import (
     ScheduleGetQueryParams,
@@ -31,6 +32,7 @@ from blackcap.schemas.job import Job
 from blackcap.schemas.message import Message, MessageType
 from blackcap.schemas.schedule import Schedule
 from blackcap.schemas.user import User
+from blackcap.utils.pagination import paginate, split_page
 
 config = config_registry.get_config()
 scheduler = scheduler_registry.get_scheduler(config.SCHEDULER)
@@ -81,18 +83,42 @@ def get_schedule(
 ) -> List[Schedule]:
     """Query DB for schedules.
 
+    Args:
+        query_params (ScheduleGetQueryParams): Query params from request
+        user_creds (User): User credentials.
+
+    Returns:
+        List[Schedule]: List of schedules returned from DB
+    """
+    return get_schedule_page(query_params, user_creds)[0]
+
+
+def build_schedule_query(
+    query_params: ScheduleGetQueryParams, user_creds: User
+) -> Select:
+    """Build the DB query of a schedule GET request.
+
     Args:
         query_params (ScheduleGetQueryParams): Query params from request
         user_creds (User): User credentials.
 
     Raises:
         e: error
-        Exception: error
 
     Returns:
-        List[Schedule]: List of schedules returned from DB
+        Select: Query selecting the schedules
     """
-    schedule_list: List[ScheduleDB]
+    if query_params.query_type in (
+        ScheduleQueryType.GET_SCHEDULES_BY_CREATE_TIMERANGE,
+        ScheduleQueryType.GET_SCHEDULES_BY_FINISHED_TIMERANGE,
+    ):
+        e = ValidationError(
+            errors=[
+                ErrorWrapper(ValueError("query type not supported"), "query_type"),
+            ],
+            model=ScheduleGetQueryParams,
+        )
+        raise e
     if query_params.query_type == ScheduleQueryType.GET_ALL_SCHEDULES:
         stmt = select(ScheduleDB).where(ScheduleDB.protagonist_id == user_creds.user_id)
     if query_params.query_type == ScheduleQueryType.GET_SCHEDULE_BY_ID:
@@ -104,7 +130,11 @@ def get_schedule(
                 model=ScheduleGetQueryParams,
             )
             raise e
-        stmt = select(ScheduleDB).where(ScheduleDB.id == query_params.schedule_id)
+        stmt = (
+            select(ScheduleDB)
+            .where(ScheduleDB.protagonist_id == user_creds.user_id)
+            .where(ScheduleDB.id == query_params.schedule_id)
+        )
     if query_params.query_type == ScheduleQueryType.GET_SCHEDULES_BY_PROTAGONIST_ID:
         if query_params.protagonist_id is None:
             e = ValidationError(
@@ -133,10 +163,35 @@ def get_schedule(
             .where(ScheduleDB.protagonist_id == user_creds.user_id)
             .where(ScheduleDB.assigned_cluster_id == query_params.cluster_id)
         )
+    return stmt
 
+
+def get_schedule_page(
+    query_params: ScheduleGetQueryParams, user_creds: User
+) -> Tuple[List[Schedule], Optional[str]]:
+    """Query DB for a page of schedules, ordered by creation time.
+
+    Args:
+        query_params (ScheduleGetQueryParams): Query params from request
+        user_creds (User): User credentials.
+
+    Raises:
+        Exception: error
+
+    Returns:
+        Tuple[List[Schedule], Optional[str]]: List of schedules returned from DB and cursor of the next page # noqa: B950
+    """
+    stmt = paginate(
+        build_schedule_query(query_params, user_creds),
+        ScheduleDB,
+        query_params.cursor,
+        query_params.limit,
+    )
     with DBSession() as session:
         try:
-            schedule_db_list: List[ScheduleDB] = session.execute(stmt).scalars().all()
+            schedule_db_list, next_cursor = split_page(
+                session.execute(stmt).scalars().all(), query_params.limit
+            )
             schedule_list: List[Schedule] = [
                 Schedule(schedule_id=obj.id, **obj.to_dict())
                 for obj in schedule_db_list
@@ -145,7 +200,34 @@ def get_schedule(
             session.rollback()
             logger.error(f"Unable to fetch schedules due to {e}")
             raise e
-    return schedule_list
+    return schedule_list, next_cursor
+
+
+def iter_schedules(
+    query_params: ScheduleGetQueryParams, user_creds: User
+) -> Iterator[Schedule]:
+    """Iterate over all the schedules of a query, ordered by creation time.
+
+    Schedules are fetched from the DB in batches of DB_YIELD_PER rows while
+    the iterator is consumed. The limit is ignored, the cursor is honoured.
+
+    Args:
+        query_params (ScheduleGetQueryParams): Query params from request
+        user_creds (User): User credentials.
+
+    Returns:
+        Iterator[Schedule]: Schedules returned from DB
+    """
+    stmt = paginate(
+        build_schedule_query(query_params, user_creds),
+        ScheduleDB,
+        query_params.cursor,
+        None,
+    )
+    return (
+        Schedule(schedule_id=obj.id, **obj.to_dict())
+        for obj in iter_scalars(stmt, "Unable to fetch schedules")
+    )
 
 
 def update_schedule(
@@ -163,44 +245,24 @@ def update_schedule(
     Returns:
         List[ScheduleDB]: List of Instance of Updated Schedule
     """
-    stmt = (
-        select(ScheduleDB)
-        .where(ScheduleDB.protagonist_id == user_creds.user_id)
-        .where(
-            ScheduleDB.id.in_(
-                [
-                    schedule_update.schedule_id
-                    for schedule_update in schedule_update_list
-                ]
-            )
-        )
-    )
+    schedule_values_list = []
+    for schedule_update in schedule_update_list:
+        schedule_update_dict = schedule_update.dict(exclude_defaults=True)
+        schedule_update_dict["id"] = schedule_update_dict.pop("schedule_id")
+        schedule_values_list.append(schedule_update_dict)
     with DBSession() as session:
         try:
-            schedule_db_update_list: List[ScheduleDB] = (
-                session.execute(stmt).scalars().all()
+            updated_row_list = ScheduleDB.bulk_update(
+                schedule_values_list,
+                session,
+                ScheduleDB.protagonist_id == user_creds.user_id,
             )
-            updated_schedule_list = []
-            for schedule in schedule_db_update_list:
-                for schedule_update in schedule_update_list:
-                    if schedule_update.schedule_id == schedule.id:
-                        schedule_update_dict = schedule_update.dict(
-                            exclude_defaults=True
-                        )
-                        schedule_update_dict.pop("schedule_id")
-                        updated_schedule = schedule.update(
-                            session, **schedule_update_dict
-                        )
-                        updated_schedule_list.append(
-                            Schedule(
-                                schedule_id=updated_schedule.id,
-                                **updated_schedule.to_dict(),
-                            )
-                        )
-            return updated_schedule_list
+            return [Schedule(schedule_id=row["id"], **row) for row in updated_row_list]
         except Exception as e:
             session.rollback()
-            logger.error(f"Unable to update schedule: {schedule.to_dict()} due to {e}")
+            logger.error(
+                f"Unable to update schedules: {schedule_values_list} due to {e}"
+            )
             raise e
 
 
@@ -219,30 +281,18 @@ def delete_schedule(
     Returns:
         ScheduleDB: Instance of Deleted Schedule
     """
-    stmt = (
-        select(ScheduleDB)
-        .where(ScheduleDB.protagonist_id == user_creds.user_id)
-        .where(
-            ScheduleDB.id.in_(
-                [schedule.schedule_id for schedule in schedule_delete_list]
-            )
-        )
-    )
+    schedule_id_list = [schedule.schedule_id for schedule in schedule_delete_list]
     with DBSession() as session:
         try:
-            schedule_db_delete_list: List[ScheduleDB] = (
-                session.execute(stmt).scalars().all()
+            deleted_row_list = ScheduleDB.bulk_delete(
+                schedule_id_list,
+                session,
+                ScheduleDB.protagonist_id == user_creds.user_id,
             )
-            deleted_schedule_list = []
-            for schedule in schedule_db_delete_list:
-                schedule.delete(session)
-                deleted_schedule_list.append(
-                    Schedule(schedule_id=schedule.id, **schedule.to_dict())
-                )
-            return deleted_schedule_list
+            return [Schedule(schedule_id=row["id"], **row) for row in deleted_row_list]
         except Exception as e:
             session.rollback()
-            logger.error(f"Unable to delete schedule: {schedule.to_dict()} due to {e}")
+            logger.error(f"Unable to delete schedules: {schedule_id_list} due to {e}")
             raise e
 
 
@@ -284,10 +334,17 @@ def create_schedule_with_scheduler(inputs: List[Prop]) -> List[Prop]:
         ) from e
 
     try:
-        processed_schedule_create_request_list = [
-            scheduler.schedule(schedule_create)
-            for schedule_create in schedule_create_request_list
-        ]
+        processed_schedule_create_request_list = scheduler.schedule_batch(
+            schedule_create_request_list
+        )
+    except UnsatisfiableJobError as e:
+        raise FlowExecError(
+            human_description="No cluster satisfies the job requirements",
+            error=e,
+            error_type=type(e),
+            is_user_facing=True,
+            error_in_function=get_outer_function(),
+        ) from e
     except Exception as e:
         raise FlowExecError(
             human_description="Something bad happened",
@@ -419,6 +476,72 @@ def revert_schedule_db_entry(inputs: List[Prop]) -> List[Prop]:
     ]
 
 
+def remove_unpublished_schedules(
+    created_schedule_list: List[Schedule],
+    failed_results: List[PublishResult],
+    user: User,
+) -> Tuple[List[Schedule], List[Schedule]]:
+    """Delete the schedules whose msg could not be published.
+
+    The published schedules are kept as they are already sent to the demons.
+
+    Args:
+        created_schedule_list (List[Schedule]): Schedules to publish
+        failed_results (List[PublishResult]): Results of the failed msgs
+        user (User): User credentials.
+
+    Returns:
+        Tuple[List[Schedule], List[Schedule]]: Published and unpublished schedules
+    """
+    failed_id_set = {result.msg["data"]["schedule_id"] for result in failed_results}
+    logger.error(
+        f"Publishing {len(failed_id_set)} of {len(created_schedule_list)} schedule msgs failed due to {[result.error for result in failed_results]}"  # noqa: B950
+    )
+    failed_schedule_list = [
+        schedule
+        for schedule in created_schedule_list
+        if schedule.schedule_id in failed_id_set
+    ]
+    try:
+        delete_schedule(failed_schedule_list, user)
+    except Exception as e:
+        logger.error(
+            f"Unable to delete unpublished schedules: {failed_id_set} due to {e}"
+        )
+    published_schedule_list = [
+        schedule
+        for schedule in created_schedule_list
+        if schedule.schedule_id not in failed_id_set
+    ]
+    return published_schedule_list, failed_schedule_list
+
+
+def publish_msg_batches(
+    msg_batches: Dict[Tuple[str, str], List[Dict]]
+) -> List[PublishResult]:
+    """Publish batches of msgs, each to its own messenger queue.
+
+    A batch that can not be published fails only its own msgs.
+
+    Args:
+        msg_batches (Dict[Tuple[str, str], List[Dict]]): Msgs by messenger and queue
+
+    Returns:
+        List[PublishResult]: Result of each msg
+    """
+    results: List[PublishResult] = []
+    for (messenger_name, messenger_queue), msgs in msg_batches.items():
+        try:
+            messenger = messenger_registry.get_messenger(messenger_name)
+            results += messenger.publish_many(msgs, messenger_queue)
+        except Exception as e:
+            logger.error(
+                f"Publishing to {messenger_name} queue {messenger_queue} failed: {e}"
+            )
+            results += [PublishResult(msg=msg, error=e) for msg in msgs]
+    return results
+
+
 def publish_schedule_message(inputs: List[Prop]) -> List[Prop]:
     """Publish schedule message step function.
 
@@ -435,9 +558,10 @@ def publish_schedule_message(inputs: List[Prop]) -> List[Prop]:
 
     Returns:
         List[Prop]:
-            Created schedule objects
+            Published schedule objects, and the unpublished ones which are deleted
 
             Prop(data=created_schedule_list, description="List of created schedule Objects") # noqa: B950
+            Prop(data=failed_schedule_list, description="List of unpublished schedule Objects") # noqa: B950
     """
     try:
         created_schedule_list: List[Schedule] = inputs[0].data
@@ -452,21 +576,22 @@ def publish_schedule_message(inputs: List[Prop]) -> List[Prop]:
         ) from e
 
     try:
+        # Group msgs by destination so each queue gets a single batch
+        msg_batches: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        # Full jobs are needed for dispatch, fetch each of them once
+        job_dict = get_jobs_by_ids(
+            [schedule.job_id for schedule in created_schedule_list], user
+        )
         for schedule in created_schedule_list:
-            messenger = messenger_registry.get_messenger(schedule.messenger)
-            job = get_job(
-                JobGetQueryParams(
-                    query_type=JobQueryType.GET_JOBS_BY_ID, job_id=schedule.job_id
-                ),
-                user,
-            )[0]
-            schedule.job = job
+            schedule.job = job_dict[schedule.job_id]
             message = Message(
                 data=schedule.dict(),
                 msg_type=MessageType.TO_DEMON_SCHEDULE_MSG,
                 timestamp=str(datetime.now()),
             )
-            messenger.publish(message.dict(), schedule.messenger_queue)
+            msg_batches[(schedule.messenger, schedule.messenger_queue)].append(
+                message.dict()
+            )
     except Exception as e:
         raise FlowExecError(
             human_description="Something bad happened",
@@ -476,8 +601,33 @@ def publish_schedule_message(inputs: List[Prop]) -> List[Prop]:
             error_in_function=get_outer_function(),
         ) from e
 
+    failed_results = [
+        result for result in publish_msg_batches(msg_batches) if not result.ok
+    ]
+
+    # Nothing was published, fail so that every schedule gets reverted
+    if failed_results and len(failed_results) == len(created_schedule_list):
+        error = failed_results[0].error
+        raise FlowExecError(
+            human_description=f"Publishing {len(failed_results)} of {len(created_schedule_list)} schedule msgs failed",  # noqa: B950
+            error=[result.error for result in failed_results],
+            error_type=type(error),
+            is_user_facing=False,
+            error_in_function=get_outer_function(),
+        ) from error
+
+    failed_schedule_list: List[Schedule] = []
+    if failed_results:
+        created_schedule_list, failed_schedule_list = remove_unpublished_schedules(
+            created_schedule_list, failed_results, user
+        )
+
     return [
-        Prop(data=created_schedule_list, description="List of created schedule Objects")
+        Prop(data=created_schedule_list, description="List of created schedule Objects"),
+        Prop(
+            data=failed_schedule_list,
+            description="List of unpublished schedule Objects",
+        ),
     ]
 
 
@@ -7,6 +7,7 @@ from logzero import logger
 
 from blackcap.configs import config_registry
 from blackcap.messenger import messenger_registry
+from blackcap.messenger.flow_control import FlowControl
 from blackcap.cluster import cluster_registry
 
 
@@ -28,12 +29,34 @@ def echo(sub_id: str) -> None:
 
 @click.command()
 @click.option("--sub_id", default=config.MESSENGER_SUB_ID, help="Subscription Id")
+@click.option(
+    "--max_msgs",
+    default=config.MESSENGER_MAX_OUTSTANDING_MSGS,
+    help="Max msgs being processed at once",
+)
+@click.option(
+    "--max_bytes",
+    default=config.MESSENGER_MAX_OUTSTANDING_BYTES,
+    help="Max bytes of msgs being processed at once",
+)
+@click.option(
+    "--workers",
+    default=config.MESSENGER_CALLBACK_WORKERS,
+    help="Number of threads processing msgs",
+)
 @on_exception(expo, Exception)
-def schedule(sub_id: str) -> None:
+def schedule(sub_id: str, max_msgs: int, max_bytes: int, workers: int) -> None:
     """subscribe and save msgs to DB"""
     logger.info("Trying to subscribe and read messages...")
+    flow_control = FlowControl(
+        max_messages=max_msgs, max_bytes=max_bytes, workers=workers
+    )
     try:
-        messenger.subscribe(callback=cluster.process_schedule_msg, sub_id=sub_id)
+        messenger.subscribe(
+            callback=cluster.process_schedule_msg,
+            sub_id=sub_id,
+            flow_control=flow_control,
+        )
     except Exception as e:
         logger.error(f"failed to subscribe: {e}")
 
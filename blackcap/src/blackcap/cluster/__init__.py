@@ -3,7 +3,9 @@
 
 from blackcap.cluster.registry import ClusterRegistry
 from blackcap.cluster.slurm_cluster import SlurmCluster
+from blackcap.cluster.slurm_rest_cluster import SlurmRestCluster
 
 
 cluster_registry = ClusterRegistry()
 cluster_registry.add_cluster(SlurmCluster())
+cluster_registry.add_cluster(SlurmRestCluster())
@@ -1,7 +1,12 @@
 """Base cluster inteface."""
 
 from abc import ABC, abstractmethod
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import subprocess
+from typing import Any, List, Optional
+
+from logzero import logger
 
 from blackcap.configs import config_registry
 from blackcap.messenger import messenger_registry
@@ -11,6 +16,20 @@ config = config_registry.get_config()
 messenger = messenger_registry.get_messenger(config.MESSENGER)
 
 
+@dataclass
+class SubmitResult:
+    """Outcome of submitting a single schedule."""
+
+    schedule: Schedule
+    job_id: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self: "SubmitResult") -> bool:
+        """Whether the schedule was submitted."""
+        return self.error is None
+
+
 class BaseCluster(ABC):
     """Base cluster interface."""
 
@@ -40,6 +59,34 @@ class BaseCluster(ABC):
         """
         pass
 
+    def submit_jobs(
+        self: "BaseCluster", schedules: List[Schedule], max_workers: int = 1
+    ) -> List[SubmitResult]:
+        """Submit many jobs to the cluster.
+
+        Clusters with a native batch submission should override this. The
+        default implementation calls submit_job for each schedule. A failed
+        submission does not stop the rest of the batch.
+
+        Args:
+            schedules (List[Schedule]): Schedule Objects
+            max_workers (int): Number of concurrent submissions. Defaults to 1.
+
+        Returns:
+            List[SubmitResult]: Result of each schedule, in the order of schedules
+        """
+
+        def submit(schedule: Schedule) -> SubmitResult:
+            try:
+                return SubmitResult(schedule=schedule, job_id=self.submit_job(schedule))
+            except Exception as e:
+                return SubmitResult(schedule=schedule, error=e)
+
+        if max_workers <= 1 or len(schedules) <= 1:
+            return [submit(schedule) for schedule in schedules]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(submit, schedules))
+
     @abstractmethod
     def get_job_status(self: "BaseCluster", job_id: str) -> List[str]:
         """Get status of a job.
@@ -52,16 +99,52 @@ class BaseCluster(ABC):
         """
         pass
 
+    def is_transient_error(self: "BaseCluster", error: Exception) -> bool:
+        """Whether a failed submission can succeed if it is retried.
+
+        Clusters should override this to add the errors of their own client.
+
+        Args:
+            error (Exception): Error raised while preparing or submitting a job
+
+        Returns:
+            bool: True if the error is transient
+        """
+        return isinstance(
+            error, (ConnectionError, TimeoutError, subprocess.TimeoutExpired)
+        )
+
     def process_schedule_msg(self: "BaseCluster", messenger_msg: Any) -> None:
         """Submit job to the cluster.
 
+        Only msgs that failed with a transient error are nacked, so they are
+        redelivered. Msgs that can not be parsed and jobs the cluster rejected
+        are acked and logged, redelivering them would fail the same way.
+
         Args:
             messenger_msg (Any): message in Messenger specific format
         """
         try:
             schedule = messenger.parse_messenger_msg(messenger_msg).data
+        except Exception as e:
+            # Add to central logging
+            logger.error(f"Dropping schedule msg that can not be parsed. Error: {e}")
+            messenger.ack_msg(messenger_msg)
+            return
+        try:
             self.prepare_job(schedule)
             self.submit_job(schedule)
         except Exception as e:
+            if self.is_transient_error(e):
+                logger.warning(
+                    f"Failed to submit schedule {schedule.schedule_id}, "
+                    f"it will be retried. Error: {e}"
+                )
+                messenger.nack_msg(messenger_msg)
+                return
             # Add to central logging
-            pass
+            logger.error(
+                f"Dropping schedule {schedule.schedule_id}, "
+                f"the cluster rejected its job. Error: {e}"
+            )
+        messenger.ack_msg(messenger_msg)
@@ -0,0 +1,349 @@
+"""Slurm REST API interface."""
+
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import threading
+from typing import Any, Dict, List, Optional
+
+from logzero import logger
+from requests import ConnectionError as RequestConnectionError, Session, Timeout
+from requests.adapters import HTTPAdapter
+from xdg import xdg_data_home
+
+from blackcap.cluster.base import config, SubmitResult
+from blackcap.cluster.slurm_cluster import SlurmCluster, SlurmJobStatus
+from blackcap.schemas.schedule import Schedule
+
+
+class SlurmRestError(Exception):
+    """Error reported by slurmrestd."""
+
+    def __init__(self: "SlurmRestError", msg: str, status_code: int) -> None:
+        """Error reported by slurmrestd.
+
+        Args:
+            msg (str): Error message
+            status_code (int): HTTP status code of the response
+        """
+        super().__init__(msg)
+        self.status_code = status_code
+
+
+class SlurmRestCluster(SlurmCluster):
+    """Slurm interface talking to slurmrestd over HTTP.
+
+    All requests of the process share one HTTP session, so connections to
+    slurmrestd are kept alive and reused. At most SLURM_REST_MAX_CONNECTIONS
+    requests are in flight at once, others wait for a free connection.
+    """
+
+    CONFIG_KEY_VAL = "SLURM_REST"
+
+    def __init__(self: "SlurmRestCluster") -> None:
+        """Initialize cluster."""
+        self._lock = threading.Lock()
+        self._session: Optional[Session] = None
+        self._pid = os.getpid()
+
+    @property
+    def session(self: "SlurmRestCluster") -> Session:
+        """HTTP session with a bounded pool of keep-alive connections."""
+        with self._lock:
+            # Connections must not be shared with forked children
+            if self._session is None or self._pid != os.getpid():
+                session = Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=config.SLURM_REST_MAX_CONNECTIONS,
+                    pool_block=True,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(
+                    {
+                        "X-SLURM-USER-NAME": config.SLURM_REST_USER,
+                        "X-SLURM-USER-TOKEN": config.SLURM_REST_TOKEN,
+                    }
+                )
+                self._session = session
+                self._pid = os.getpid()
+            return self._session
+
+    def close(self: "SlurmRestCluster") -> None:
+        """Close the pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def request(
+        self: "SlurmRestCluster",
+        method: str,
+        path: str,
+        json: Optional[Dict] = None,
+        plugin: str = "slurm",
+        params: Optional[Dict] = None,
+    ) -> Dict:
+        """Send a request to slurmrestd.
+
+        Args:
+            method (str): HTTP method
+            path (str): Path below /<plugin>/<api version>/
+            json (Optional[Dict]): Request body. Defaults to None.
+            plugin (str): slurm for slurmctld, slurmdb for slurmdbd. Defaults to slurm.
+            params (Optional[Dict]): Query string params. Defaults to None.
+
+        Raises:
+            SlurmRestError: slurmrestd reported errors
+
+        Returns:
+            Dict: Response body
+        """
+        url = (
+            f"{config.SLURM_REST_URL.rstrip('/')}"
+            f"/{plugin}/{config.SLURM_REST_API_VERSION}/{path}"
+        )
+        response = self.session.request(
+            method, url, json=json, params=params, timeout=config.SLURM_REST_TIMEOUT
+        )
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        errors = [error for error in body.get("errors", []) if error]
+        if response.status_code >= 400 or len(errors) > 0:
+            raise SlurmRestError(
+                f"{method} {path} failed with {response.status_code}: {errors}",
+                response.status_code,
+            )
+        return body
+
+    def job_properties(
+        self: "SlurmRestCluster", name: str, job_data_path: Path, output: Path
+    ) -> Dict[str, Any]:
+        """Build the job description of a submission.
+
+        Args:
+            name (str): Name of the job
+            job_data_path (Path): Working dir of the job
+            output (Path): Path of the stdout file
+
+        Returns:
+            Dict[str, Any]: Job description
+        """
+        return {
+            "name": name,
+            "current_working_directory": str(job_data_path.absolute()),
+            "standard_output": str(output.absolute()),
+            "environment": {"PATH": os.environ.get("PATH", "/usr/bin:/bin")},
+        }
+
+    def is_transient_error(self: "SlurmRestCluster", error: Exception) -> bool:
+        """Whether a failed submission can succeed if it is retried.
+
+        Connection errors, timeouts and 5xx responses of slurmrestd are
+        transient, 4xx responses mean the job was rejected.
+
+        Args:
+            error (Exception): Error raised while preparing or submitting a job
+
+        Returns:
+            bool: True if the error is transient
+        """
+        if isinstance(error, SlurmRestError):
+            return error.status_code >= 500
+        if isinstance(error, (RequestConnectionError, Timeout)):
+            return True
+        return super().is_transient_error(error)
+
+    def submit_job(self: "SlurmRestCluster", schedule: Schedule) -> str:
+        """Submit job to the cluster.
+
+        Args:
+            schedule (Schedule): Schedule Object
+
+        Returns:
+            str: Job ID
+        """
+        job = schedule.job
+        self.prepare_job(schedule)
+        job_data_path: Path = (
+            xdg_data_home() / "orchestra" / "demon" / "jobs" / str(job.job_id)
+        )
+        body = self.request(
+            "POST",
+            "job/submit",
+            json={
+                "script": job.script,
+                "job": self.job_properties(
+                    job.name, job_data_path, job_data_path / "out" / "slurm.out"
+                ),
+            },
+        )
+        return str(body["job_id"])
+
+    def submit_job_array(
+        self: "SlurmRestCluster", schedules: List[Schedule]
+    ) -> List[SubmitResult]:
+        """Submit schedules sharing the same script as a single job array.
+
+        Args:
+            schedules (List[Schedule]): Schedule Objects with identical scripts
+
+        Returns:
+            List[SubmitResult]: Result of each schedule, in the order of schedules
+        """
+        array_data_path = self.prepare_job_array(schedules)
+        job = self.job_properties(
+            schedules[0].job.name,
+            array_data_path,
+            array_data_path / "out" / "%A_%a.out",
+        )
+        job["array"] = f"0-{len(schedules) - 1}"
+        with open(array_data_path.joinpath("start.sh")) as f:
+            body = self.request(
+                "POST", "job/submit", json={"script": f.read(), "job": job}
+            )
+        array_job_id = body["job_id"]
+        return [
+            SubmitResult(schedule=schedule, job_id=f"{array_job_id}_{index}")
+            for index, schedule in enumerate(schedules)
+        ]
+
+    @staticmethod
+    def parse_job(job: Dict) -> SlurmJobStatus:
+        """Parse a job of a slurmrestd response.
+
+        Args:
+            job (Dict): Job as returned by slurmrestd
+
+        Returns:
+            SlurmJobStatus: Status of the job
+        """
+        job_id = str(job["job_id"])
+        if job.get("array_job_id") and job.get("array_task_id") is not None:
+            job_id = f"{job['array_job_id']}_{job['array_task_id']}"
+        state = job.get("job_state", "")
+        # Newer API versions return a list of state flags
+        if isinstance(state, list):
+            state = state[0] if len(state) > 0 else ""
+        return SlurmJobStatus(job_id, state, str(job.get("exit_code", "")))
+
+    @staticmethod
+    def parse_db_job(job: Dict) -> SlurmJobStatus:
+        """Parse a job of a slurmdbd response.
+
+        Args:
+            job (Dict): Job as returned by the slurmdb endpoints of slurmrestd
+
+        Returns:
+            SlurmJobStatus: Status of the job
+        """
+        job_id = str(job["job_id"])
+        array = job.get("array", {})
+        if array.get("job_id") and array.get("task_id") is not None:
+            job_id = f"{array['job_id']}_{array['task_id']}"
+        state = job.get("state", {}).get("current", "")
+        # Newer API versions return a list of state flags
+        if isinstance(state, list):
+            state = state[0] if len(state) > 0 else ""
+        exit_code = job.get("exit_code", {}).get("return_code", "")
+        return SlurmJobStatus(job_id, state, str(exit_code))
+
+    def get_job_status(self: "SlurmRestCluster", job_id: str) -> List[str]:
+        """Get status of a job by Job.
+
+        Args:
+            job_id (str): ID of the job
+
+        Returns:
+            List[str]: List of status of the jobs
+        """
+        body = self.request("GET", f"job/{job_id}")
+        return [self.parse_job(job).state for job in body.get("jobs", [])]
+
+    def get_jobs_status(
+        self: "SlurmRestCluster", job_ids: List[str]
+    ) -> Dict[str, SlurmJobStatus]:
+        """Get status of many jobs.
+
+        Jobs are looked up in slurmctld by job ID, tasks of a job array share
+        a single request. At most SLURM_REST_STATUS_MAX_LOOKUPS requests are
+        sent to slurmctld per call. The other jobs, including the ones no
+        longer known to slurmctld as they finished more than MinJobAge ago,
+        are looked up in slurmdbd with a single request.
+
+        Args:
+            job_ids (List[str]): IDs of the jobs
+
+        Returns:
+            Dict[str, SlurmJobStatus]: Status of each job by job ID
+        """
+        if len(job_ids) == 0:
+            return {}
+        statuses: Dict[str, SlurmJobStatus] = {}
+        parent_ids = list(dict.fromkeys(job_id.split("_")[0] for job_id in job_ids))
+        for parent_id in parent_ids[: config.SLURM_REST_STATUS_MAX_LOOKUPS]:
+            try:
+                body = self.request("GET", f"job/{parent_id}")
+            except SlurmRestError as e:
+                logger.debug(f"Job {parent_id} not found in slurmctld due to {e}")
+                continue
+            for job in body.get("jobs", []):
+                status = self.parse_job(job)
+                statuses[status.job_id] = status
+        missing_ids = [job_id for job_id in job_ids if job_id not in statuses]
+        statuses.update(self.get_db_jobs_status(missing_ids))
+        return {job_id: statuses[job_id] for job_id in job_ids if job_id in statuses}
+
+    def get_db_jobs_status(
+        self: "SlurmRestCluster", job_ids: List[str]
+    ) -> Dict[str, SlurmJobStatus]:
+        """Get status of many jobs from slurmdbd with a single request.
+
+        Only jobs started within the last SLURM_SACCT_WINDOW_DAYS days are
+        looked up. At most SLURM_REST_STATUS_MAX_DB_JOBS jobs are looked up
+        per call, the others are left out until a later call.
+
+        Args:
+            job_ids (List[str]): IDs of the jobs
+
+        Returns:
+            Dict[str, SlurmJobStatus]: Status of each job found by job ID
+        """
+        if len(job_ids) == 0:
+            return {}
+        if len(job_ids) > config.SLURM_REST_STATUS_MAX_DB_JOBS:
+            logger.warning(
+                f"Looking up {config.SLURM_REST_STATUS_MAX_DB_JOBS} of {len(job_ids)} jobs in slurmdbd"  # noqa: B950
+            )
+            job_ids = job_ids[: config.SLURM_REST_STATUS_MAX_DB_JOBS]
+        start_time = datetime.now() - timedelta(days=config.SLURM_SACCT_WINDOW_DAYS)
+        try:
+            body = self.request(
+                "GET",
+                "jobs",
+                plugin="slurmdb",
+                # step filters on job IDs, like sacct --jobs
+                params={
+                    "step": ",".join(job_ids),
+                    "start_time": int(start_time.timestamp()),
+                },
+            )
+        except SlurmRestError as e:
+            logger.warning(f"Unable to get status of jobs {job_ids} due to {e}")
+            return {}
+        statuses = {}
+        for job in body.get("jobs", []):
+            status = self.parse_db_job(job)
+            statuses[status.job_id] = status
+        return statuses
+
+    def cancel_job(self: "SlurmRestCluster", job_id: str) -> None:
+        """Cancel a job.
+
+        Args:
+            job_id (str): ID of the job
+        """
+        self.request("DELETE", f"job/{job_id}")
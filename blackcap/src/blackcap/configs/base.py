@@ -15,6 +15,8 @@ class BaseConfig(ABC, BaseSettings):
     FLASK_HOST: str = "localhost"
     FLASK_PORT: int = 9991
     FLASK_ENV: str = "development"
+    API_PAGE_SIZE: int = 100
+    API_MAX_PAGE_SIZE: int = 1000
     DB_TYPE: str = "postgresql"
     DB_NAME: str = "conductor"
     DB_PATH: str = ""
@@ -23,6 +25,7 @@ class BaseConfig(ABC, BaseSettings):
     DB_PASS: str = "postgres"
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
+    DB_YIELD_PER: int = 1000
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
     SECRET_KEY: str = "ADD_A_RANDOM_KEY_HERE"  # noqa: S105
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
@@ -30,15 +33,42 @@ class BaseConfig(ABC, BaseSettings):
     AUTHER: str = "COOKIE"
     MESSENGER: str = "GCP"
     SCHEDULER: str = "RANDOM"
+    SCHEDULER_CLUSTER_CACHE_TTL: float = 30.0
+    SCHEDULER_METRICS_RANGE: str = "15m"
+    SCHEDULER_METRICS_TTL: float = 15.0
     OBSERVER: str = "ELASTIC"
+    ELASTIC_URL: str = ""
+    ELASTIC_METRICS_INDEX: str = "orchestra-metrics"
+    ELASTIC_TIMEOUT: float = 5.0
     CLUSTER: str = "ARGO"
+    SLURM_MAX_ARRAY_SIZE: int = 1000
+    SLURM_SACCT_WINDOW_DAYS: int = 7
+    SLURM_REST_URL: str = "http://localhost:6820"
+    SLURM_REST_API_VERSION: str = "v0.0.38"
+    SLURM_REST_USER: str = ""
+    SLURM_REST_TOKEN: str = ""
+    SLURM_REST_TIMEOUT: float = 10.0
+    SLURM_REST_MAX_CONNECTIONS: int = 10
+    SLURM_REST_STATUS_MAX_LOOKUPS: int = 20
+    SLURM_REST_STATUS_MAX_DB_JOBS: int = 500
+    CLI_COMMAND_TIMEOUT: float = 120.0
+    CLI_MAX_CONCURRENT_COMMANDS: int = 16
     GOOGLE_APPLICATION_CREDENTIALS: str = "./keys.json"
     GCP_PROJECT_ID: str = "YOUR_GCP_PROJECT_ID"
+    GCP_CREDENTIALS_REFRESH_MARGIN: int = 300
     MESSENGER_TOPIC_ID: str = "test-topic"
     MESSENGER_SUB_ID: str = "test-topic"
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     NATS_ENDPOINT: str = "nats://localhost:1401"
+    NATS_SOCKET_TIMEOUT: float = 5.0
+    NATS_PING_INTERVAL: float = 60.0
+    NATS_RECONNECT_MAX_TIME: float = 60.0
+    MESSENGER_MAX_IN_FLIGHT: int = 1000
+    MESSENGER_MAX_OUTSTANDING_MSGS: int = 100
+    MESSENGER_MAX_OUTSTANDING_BYTES: int = 100 * 1024 * 1024
+    MESSENGER_CALLBACK_WORKERS: int = 10
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/0"
+    FLOW_TRACING: bool = False
 
     @abstractmethod
     def get_config_name(self: "BaseConfig") -> str:
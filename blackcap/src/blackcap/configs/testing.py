@@ -9,6 +9,7 @@ class TestingConfig(DefaultConfig):
     """Testing config."""
 
     MESSENGER: str = "NATS"
+    NATS_RECONNECT_MAX_TIME: float = 1.0
     DB_NAME: str = "blackcap_test"
     DB_URI: str = f"sqlite:////{xdg_data_home() / ('orchestra') / ('blackcap_test.db')}"
 
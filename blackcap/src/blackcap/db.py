@@ -1,8 +1,11 @@
 """Blackcap database."""
 
+from typing import Any, Iterator
+
 from logzero import logger
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import Select
 
 from blackcap.configs import config_registry
 
@@ -13,3 +16,32 @@ logger.info(
 db_engine = create_engine(config_registry.get_config().SQLALCHEMY_DATABASE_URI)
 # Use this session for all db operations in the app
 DBSession = sessionmaker(db_engine)
+
+# Max IDs bound in a single IN clause, larger lists are queried in chunks
+QUERY_CHUNK_SIZE = 500
+
+
+def iter_scalars(stmt: Select, error_msg: str) -> Iterator[Any]:
+    """Iterate over the records of a query, fetching them in batches.
+
+    Only DB_YIELD_PER rows are buffered at a time. The session stays open
+    until the iterator is exhausted or closed.
+
+    Args:
+        stmt (Select): Query selecting the records
+        error_msg (str): Message logged if the query fails
+
+    Raises:
+        Exception: error
+
+    Yields:
+        Iterator[Any]: Records
+    """
+    stmt = stmt.execution_options(yield_per=config_registry.get_config().DB_YIELD_PER)
+    with DBSession() as session:
+        try:
+            yield from session.execute(stmt).scalars()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"{error_msg} due to {e}")
+            raise e
@@ -1,5 +1,19 @@
 """Flow engine."""
 
+from .async_executor import AsyncExecutor  # noqa: F401
+from .dag_executor import DAGExecutor  # noqa: F401
 from .executor import Executor  # noqa: F401
-from .flow import Flow, FlowExecError, FlowStatus, get_outer_function  # noqa: F401
+from .flow import (  # noqa: F401
+    DAGFlow,
+    Flow,
+    FlowExecError,
+    FlowStatus,
+    get_outer_function,
+)
+from .instrumentation import (  # noqa: F401
+    default_hooks,
+    DurationCollector,
+    FlowHooks,
+    OTelSpanExporter,
+)
 from .step import FuncProp, Prop, Step  # noqa: F401
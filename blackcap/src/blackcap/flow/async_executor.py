@@ -0,0 +1,166 @@
+"""Async flow executor."""
+
+import asyncio
+from dataclasses import dataclass
+from functools import partial
+import inspect
+import time
+from typing import Any, Callable, Dict, List
+
+from blackcap.flow.executor import Executor, StepGraph
+from blackcap.flow.flow import DAGFlow, Flow, FlowStatus
+from blackcap.flow.step import FuncProp, Prop
+
+
+@dataclass
+class AsyncExecutor(Executor):
+    """Executor running flows on an asyncio loop.
+
+    Step functions and FuncProp functions can be either async def or plain
+    functions. Plain functions run in the default executor of the loop so
+    they never block it. Steps of a DAGFlow whose dependencies passed run
+    concurrently, steps of a linear Flow run one after the other. Failures
+    are compensated like with the other executors, by reverting every passed
+    step in the reverse order of completion.
+    """
+
+    async def call(
+        self: "AsyncExecutor", func: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Call a sync or async function without blocking the loop.
+
+        Args:
+            func (Callable): Function to call
+            *args (Any): Positional arguments of the function
+            **kwargs (Any): Keyword arguments of the function
+
+        Returns:
+            Any: Result of the function
+        """
+        if inspect.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        # Plain functions returning an awaitable are awaited as well
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def get_dependencies(self: "AsyncExecutor") -> List[List[int]]:
+        """Get the dependencies of each step.
+
+        Returns:
+            List[List[int]]: Indexes of the steps each step depends on
+        """
+        if isinstance(self.flow, DAGFlow):
+            return self.flow.dependencies
+        # Steps of a linear flow depend on the previous step
+        return [
+            [index - 1] if index > 0 else [] for index in range(len(self.flow.steps))
+        ]
+
+    async def resolve_inputs_async(self: "AsyncExecutor", index: int) -> List[Prop]:
+        """Resolve the FuncProp inputs of a step.
+
+        Args:
+            index (int): Index of the step
+
+        Returns:
+            List[Prop]: Prepared inputs of the step
+        """
+        functions_inputs = []
+        for item in self.flow.inputs[index]:
+            if type(item) == FuncProp:
+                with self.invoking_func_prop(index, item):
+                    # Lookups of outputs of previous steps are cheap
+                    if item.func == self.flow.get_froward_output:
+                        input_list_from_func = item.func(**item.params)
+                    else:
+                        input_list_from_func = await self.call(item.func, **item.params)
+                functions_inputs += input_list_from_func
+            else:
+                functions_inputs.append(self.check_prop(item))
+        return functions_inputs
+
+    async def run_forward_async(self: "AsyncExecutor", index: int) -> List[Prop]:
+        """Resolve the inputs of a step and invoke its forward call.
+
+        Args:
+            index (int): Index of the step
+
+        Raises:
+            Exception: Forward call failed
+
+        Returns:
+            List[Prop]: Output of the forward call
+        """
+        self.emit("on_step_start", index)
+        step_start = time.perf_counter()
+        try:
+            self.flow.inputs[index] = await self.resolve_inputs_async(index)
+            forward_out = await self.call(
+                self.flow.steps[index].forward_call, self.flow.inputs[index]
+            )
+        except Exception as e:
+            self.emit("on_step_end", index, time.perf_counter() - step_start, e)
+            raise e
+        self.emit("on_step_end", index, time.perf_counter() - step_start, None)
+        return forward_out
+
+    async def run_backward_async(
+        self: "AsyncExecutor", back_index: int, index: int
+    ) -> None:
+        """Invoke the backward call of a step to revert it.
+
+        Args:
+            back_index (int): Index of the step to revert
+            index (int): Index of the failed step
+        """
+        with self.reverting_step(back_index, index):
+            backward_out = await self.call(
+                self.flow.steps[back_index].backward_call,
+                self.flow.inputs[back_index] + self.flow.forward_outputs[back_index],
+            )
+            self.flow.backward_outputs.append(backward_out)
+
+    async def run_async(self: "AsyncExecutor") -> Flow:
+        """Execute flow.
+
+        Returns:
+            Flow: Executed flow
+        """
+        self.emit("on_flow_start")
+        flow_start = time.perf_counter()
+        # Set Flow status to executing
+        self.flow.status = FlowStatus.EXECUTING
+        self.flow.forward_outputs = [None] * len(self.flow.steps)
+        graph = StepGraph(self.get_dependencies())
+
+        running: Dict[asyncio.Task, int] = {}
+        ready = graph.roots()
+        while len(ready) > 0 or len(running) > 0:
+            for index in ready:
+                running[asyncio.ensure_future(self.run_forward_async(index))] = index
+            ready = []
+            done, _ = await asyncio.wait(
+                list(running), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                index = running.pop(task)
+                ready += self.finish_step(graph, index, task.result)
+
+        if graph.failed_index is not None:
+            for back_index in reversed(graph.completed):
+                await self.run_backward_async(back_index, graph.failed_index)
+        else:
+            self.flow.status = FlowStatus.PASSED
+        self.emit("on_flow_end", time.perf_counter() - flow_start)
+        return self.flow
+
+    def run(self: "AsyncExecutor") -> Flow:
+        """Execute flow on a new event loop, for callers outside of a loop.
+
+        Returns:
+            Flow: Executed flow
+        """
+        return asyncio.run(self.run_async())
@@ -0,0 +1,77 @@
+"""DAG flow executor."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import time
+from typing import Dict, List
+
+from blackcap.flow.executor import Executor, StepGraph
+from blackcap.flow.flow import DAGFlow, FlowStatus
+from blackcap.flow.step import Prop
+
+
+@dataclass
+class DAGExecutor(Executor):
+    """Executor running independent steps of a DAGFlow concurrently.
+
+    A step is submitted to a thread pool as soon as all the steps it depends
+    on passed. Once a step fails no new step is started, the running ones
+    are awaited, then every passed step is reverted in the reverse order of
+    completion, which is a valid reverse topological order of the graph.
+    """
+
+    flow: DAGFlow
+    max_workers: int = 4
+
+    def timed_forward(self: "DAGExecutor", index: int) -> List[Prop]:
+        """Run the forward call of a step and emit its hooks.
+
+        Args:
+            index (int): Index of the step
+
+        Raises:
+            Exception: Forward call failed
+
+        Returns:
+            List[Prop]: Output of the step
+        """
+        self.emit("on_step_start", index)
+        step_start = time.perf_counter()
+        try:
+            forward_out = self.run_forward(index)
+        except Exception as e:
+            self.emit("on_step_end", index, time.perf_counter() - step_start, e)
+            raise e
+        self.emit("on_step_end", index, time.perf_counter() - step_start, None)
+        return forward_out
+
+    def run(self: "DAGExecutor") -> DAGFlow:
+        """Execute flow."""
+        self.emit("on_flow_start")
+        flow_start = time.perf_counter()
+        # Set Flow status to executing
+        self.flow.status = FlowStatus.EXECUTING
+        self.flow.forward_outputs = [None] * len(self.flow.steps)
+        graph = StepGraph(self.flow.dependencies)
+
+        running: Dict[Future, int] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="flow"
+        ) as pool:
+            ready = graph.roots()
+            while len(ready) > 0 or len(running) > 0:
+                for index in ready:
+                    running[pool.submit(self.timed_forward, index)] = index
+                ready = []
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    ready += self.finish_step(graph, index, future.result)
+
+        if graph.failed_index is not None:
+            for back_index in reversed(graph.completed):
+                self.run_backward(back_index, graph.failed_index)
+        else:
+            self.flow.status = FlowStatus.PASSED
+        self.emit("on_flow_end", time.perf_counter() - flow_start)
+        return self.flow
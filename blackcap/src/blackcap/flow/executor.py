@@ -1,12 +1,79 @@
 """Flow executor."""
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from logzero import logger
 
 from blackcap.flow.flow import Flow, FlowExecError, FlowStatus, get_outer_function
+from blackcap.flow.instrumentation import default_hooks, FlowHooks
 from blackcap.flow.step import FuncProp, Prop
 
 
+class StepGraph:
+    """Dependency graph tracking which steps of a flow are ready to run.
+
+    A step is ready once every step it depends on passed. Once a step failed
+    no step becomes ready anymore.
+    """
+
+    def __init__(self: "StepGraph", dependencies: List[List[int]]) -> None:
+        """Build the graph.
+
+        Args:
+            dependencies (List[List[int]]): Indexes of the steps each step depends on # noqa: B950
+        """
+        self.dependents: Dict[int, List[int]] = {
+            index: [] for index in range(len(dependencies))
+        }
+        self.waiting_on: Dict[int, int] = {}
+        for index, step_dependencies in enumerate(dependencies):
+            self.waiting_on[index] = len(step_dependencies)
+            for dependency in step_dependencies:
+                self.dependents[dependency].append(index)
+        self.completed: List[int] = []
+        self.failed_index: Optional[int] = None
+
+    def roots(self: "StepGraph") -> List[int]:
+        """Get the steps without dependencies.
+
+        Returns:
+            List[int]: Indexes of the steps ready to run first
+        """
+        return [index for index, n_waiting in self.waiting_on.items() if n_waiting == 0]
+
+    def mark_passed(self: "StepGraph", index: int) -> List[int]:
+        """Mark a step passed.
+
+        Args:
+            index (int): Index of the step
+
+        Returns:
+            List[int]: Indexes of the steps the step made ready
+        """
+        self.completed.append(index)
+        # Do not start new steps once the flow failed
+        if self.failed_index is not None:
+            return []
+        ready = []
+        for dependent in self.dependents[index]:
+            self.waiting_on[dependent] -= 1
+            if self.waiting_on[dependent] == 0:
+                ready.append(dependent)
+        return ready
+
+    def mark_failed(self: "StepGraph", index: int) -> None:
+        """Mark a step failed, the first failed step is kept.
+
+        Args:
+            index (int): Index of the step
+        """
+        if self.failed_index is None:
+            self.failed_index = index
+
+
 @dataclass
 class Executor:
     """Flow executor."""
@@ -14,77 +81,247 @@ class Executor:
     flow: Flow
     # TODO: Strongly type it in the future
     config: Dict
+    # Instrumentation hooks, defaults to instrumentation.default_hooks
+    hooks: Optional[List[FlowHooks]] = None
+
+    def __post_init__(self: "Executor") -> None:
+        """Set default hooks."""
+        if self.hooks is None:
+            self.hooks = default_hooks
+
+    def emit(self: "Executor", event: str, *args: Any) -> None:
+        """Call an instrumentation hook on every hook object.
+
+        Args:
+            event (str): Name of the hook
+            *args (Any): Arguments of the hook after the flow
+        """
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(self.flow, *args)
+            except Exception as e:
+                logger.error(f"Flow hook {type(hook).__name__}.{event} failed: {e}")
+
+    @contextmanager
+    def invoking_func_prop(
+        self: "Executor", index: int, item: FuncProp
+    ) -> Iterator[None]:
+        """Emit the FuncProp hooks around the invocation of a FuncProp.
+
+        Args:
+            index (int): Index of the step
+            item (FuncProp): FuncProp being invoked
+
+        Raises:
+            FlowExecError: Invoking the FuncProp failed
+
+        Yields:
+            None: FuncProp is invoked in the body of the with statement
+        """
+        self.emit("on_func_prop_start", index, item)
+        func_prop_start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.emit(
+                "on_func_prop_end",
+                index,
+                item,
+                time.perf_counter() - func_prop_start,
+                e,
+            )
+            raise FlowExecError(
+                human_description="Invoking FuncProp failed",
+                error=e,
+                error_type=type(e),
+                is_user_facing=False,
+                error_in_function=item.func,
+                step_index=index,
+            ) from e
+        self.emit(
+            "on_func_prop_end",
+            index,
+            item,
+            time.perf_counter() - func_prop_start,
+            None,
+        )
+
+    def check_prop(self: "Executor", item: Union[Prop, Any]) -> Prop:
+        """Check that an input which is not a FuncProp is a Prop.
+
+        Args:
+            item (Union[Prop, Any]): Input of a step
+
+        Raises:
+            FlowExecError: Unknown input type
+
+        Returns:
+            Prop: The input
+        """
+        if type(item) != Prop:
+            raise FlowExecError(
+                human_description="Unkown type of input is used to invoke a step function",
+                error=f"Input type: {type(item)} is not recognised",
+                error_type="Unkown input error",
+                is_user_facing=False,
+                error_in_function=get_outer_function(),
+            )
+        return item
+
+    def resolve_inputs(self: "Executor", index: int) -> List[Prop]:
+        """Resolve the FuncProp inputs of a step.
+
+        Args:
+            index (int): Index of the step
+
+        Returns:
+            List[Prop]: Prepared inputs of the step
+        """
+        # Prepare function inputs
+        functions_inputs = []
+        # Check the prop type
+        for item in self.flow.inputs[index]:
+            if type(item) == FuncProp:
+                with self.invoking_func_prop(index, item):
+                    input_list_from_func = item.func(**item.params)
+                functions_inputs += input_list_from_func
+            else:
+                functions_inputs.append(self.check_prop(item))
+        return functions_inputs
+
+    def run_forward(self: "Executor", index: int) -> List[Prop]:
+        """Resolve the inputs of a step and invoke its forward call.
+
+        Args:
+            index (int): Index of the step
+
+        Returns:
+            List[Prop]: Output of the forward call
+        """
+        # Replace current function input with the prepared inputs
+        self.flow.inputs[index] = self.resolve_inputs(index)
+
+        # Invoke function with prepared inputs
+        return self.flow.steps[index].forward_call(self.flow.inputs[index])
+
+    def record_failure(self: "Executor", index: int, error: Exception) -> None:
+        """Mark the flow failed because of a forward call.
+
+        Args:
+            index (int): Index of the failed step
+            error (Exception): Error of the step
+        """
+        # TODO: Add logging for failed forward calls
+        # Set flow status to failed and append error
+        self.flow.status = FlowStatus.FAILED
+        flow_error = FlowExecError(
+            human_description="A forward step function failed",
+            error=error,
+            error_type=type(error),
+            is_user_facing=False,
+            error_in_function=get_outer_function(),
+        )
+        flow_error.step_index = index
+        self.flow.errors.append(flow_error)
+
+    def finish_step(
+        self: "Executor",
+        graph: StepGraph,
+        index: int,
+        get_output: Callable[[], List[Prop]],
+    ) -> List[int]:
+        """Record the outcome of a step once it finished running.
+
+        Args:
+            graph (StepGraph): Dependency graph of the flow
+            index (int): Index of the step
+            get_output (Callable[[], List[Prop]]): Returns the output of the step or raises its error # noqa: B950
+
+        Returns:
+            List[int]: Indexes of the steps the step made ready
+        """
+        try:
+            forward_out = get_output()
+        except Exception as e:
+            self.record_failure(index, e)
+            graph.mark_failed(index)
+            return []
+        self.flow.forward_outputs[index] = forward_out
+        return graph.mark_passed(index)
+
+    @contextmanager
+    def reverting_step(
+        self: "Executor", back_index: int, index: int
+    ) -> Iterator[None]:
+        """Emit the backward hooks around the backward call of a step.
+
+        A failed backward call is recorded in the flow errors, so the
+        remaining steps are still reverted.
+
+        Args:
+            back_index (int): Index of the step to revert
+            index (int): Index of the failed step
+
+        Yields:
+            None: Backward call is invoked in the body of the with statement
+        """
+        self.emit("on_backward_start", back_index)
+        backward_start = time.perf_counter()
+        backward_error = None
+        try:
+            yield
+        except Exception as e:
+            backward_error = e
+            # TODO: Add central logging here
+            flow_error = FlowExecError(
+                human_description="A backward step function failed",
+                error=e,
+                error_type=type(e),
+                is_user_facing=False,
+                error_in_function=get_outer_function(),
+            )
+            flow_error.step_index = index
+            self.flow.errors.append(flow_error)
+        self.emit(
+            "on_backward_end",
+            back_index,
+            time.perf_counter() - backward_start,
+            backward_error,
+        )
+
+    def run_backward(self: "Executor", back_index: int, index: int) -> None:
+        """Invoke the backward call of a step to revert it.
+
+        Args:
+            back_index (int): Index of the step to revert
+            index (int): Index of the failed step
+        """
+        with self.reverting_step(back_index, index):
+            backward_out = self.flow.steps[back_index].backward_call(
+                self.flow.inputs[back_index] + self.flow.forward_outputs[back_index],
+            )
+            self.flow.backward_outputs.append(backward_out)
 
-    def run(self: "Executor") -> Flow:  # noqa: C901
+    def run(self: "Executor") -> Flow:
         """Execute flow."""
+        self.emit("on_flow_start")
+        flow_start = time.perf_counter()
         # Set Flow status to executing
         self.flow.status = FlowStatus.EXECUTING
-        for index, step in enumerate(self.flow.steps):
+        for index in range(len(self.flow.steps)):
+            self.emit("on_step_start", index)
+            step_start = time.perf_counter()
             try:
-                # Prepare function inputs
-                functions_inputs = []
-                # Check the prop type
-                for item in self.flow.inputs[index]:
-                    if type(item) == FuncProp:
-                        try:
-                            input_list_from_func = item.func(**item.params)
-                        except Exception as e:
-                            raise FlowExecError(
-                                human_description="Invoking FuncProp failed",
-                                error=e,
-                                error_type=type(e),
-                                is_user_facing=False,
-                                error_in_function=item.func,
-                                step_index=index,
-                            ) from e
-                        functions_inputs += input_list_from_func
-                    elif type(item) == Prop:
-                        functions_inputs.append(item)
-                    else:
-                        raise FlowExecError(
-                            human_description="Unkown type of input is used to invoke a step function",
-                            error=f"Input type: {type(self.flow.inputs[index])} is not recognised",
-                            error_type="Unkown input error",
-                            is_user_facing=False,
-                            error_in_function=get_outer_function(),
-                        )
-                # Replace current function input with the prepared inputs
-                self.flow.inputs[index] = functions_inputs
-
-                # Invoke function with prepared inputs
-                forward_out = step.forward_call(self.flow.inputs[index])
+                forward_out = self.run_forward(index)
                 self.flow.forward_outputs.append(forward_out)
             except Exception as e:
-                # TODO: Add logging for failed forward calls
-                # Set flow status to failed and append error
-                self.flow.status = FlowStatus.FAILED
-                flow_error = FlowExecError(
-                    human_description="A forward step function failed",
-                    error=e,
-                    error_type=type(e),
-                    is_user_facing=False,
-                    error_in_function=get_outer_function(),
-                )
-                flow_error.step_index = index
-                self.flow.errors.append(flow_error)
+                self.emit("on_step_end", index, time.perf_counter() - step_start, e)
+                self.record_failure(index, e)
                 for back_index in reversed(range(0, index)):
-                    try:
-                        backward_out = self.flow.steps[back_index].backward_call(
-                            self.flow.inputs[back_index]
-                            + self.flow.forward_outputs[back_index],
-                        )
-                        self.flow.backward_outputs.append(backward_out)
-                    except Exception as e:
-                        # TODO: Add central logging here
-                        flow_error = FlowExecError(
-                            human_description="A backward step function failed",
-                            error=e,
-                            error_type=type(e),
-                            is_user_facing=False,
-                            error_in_function=get_outer_function(),
-                        )
-                        flow_error.step_index = index
-                        self.flow.errors.append(flow_error)
+                    self.run_backward(back_index, index)
+                self.emit("on_flow_end", time.perf_counter() - flow_start)
                 return self.flow
+            self.emit("on_step_end", index, time.perf_counter() - step_start, None)
         self.flow.status = FlowStatus.PASSED
+        self.emit("on_flow_end", time.perf_counter() - flow_start)
         return self.flow
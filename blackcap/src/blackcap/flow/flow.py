@@ -2,8 +2,9 @@
 
 from dataclasses import dataclass, field
 from enum import auto, Enum, unique
-import inspect
-from typing import Any, List, Optional, Union
+import sys
+import traceback
+from typing import Any, List, Optional, Set, Union
 
 from blackcap.flow.step import FuncProp, Prop, Step
 
@@ -41,7 +42,25 @@ class FlowExecError(Exception):
     is_user_facing: bool = False
     user_facing_msg: Optional[str] = None
 
+    def format_traceback(self: "FlowExecError") -> str:
+        """Render the traceback of the wrapped error.
 
+        Tracebacks are rendered on demand rather than when the error is
+        raised, so failing flows do not pay for reading source files.
+
+        Returns:
+            str: Formatted traceback, empty if the error is not an exception
+        """
+        if not isinstance(self.error, BaseException):
+            return ""
+        return "".join(
+            traceback.format_exception(
+                type(self.error), self.error, self.error.__traceback__
+            )
+        )
+
+
+@dataclass
 class FlowBuildError(Exception):
     """Errors while building flow."""
 
@@ -53,8 +72,12 @@ class FlowBuildError(Exception):
 
 
 def get_outer_function() -> str:
-    """Return name of the outer function."""
-    return inspect.getframeinfo(inspect.currentframe().f_back).function
+    """Return name of the outer function.
+
+    Only the code object of the calling frame is read, no source file is
+    opened, so it is cheap enough to call on every error.
+    """
+    return sys._getframe(1).f_code.co_name
 
 
 @dataclass
@@ -81,3 +104,70 @@ class Flow:
     def get_input(self: "Flow", index: int) -> Optional[List[Prop]]:
         """Lazily get list of prop from flow inputs."""
         return self.inputs[index]
+
+
+@dataclass
+class DAGFlow(Flow):
+    """Flow whose steps form a directed acyclic graph.
+
+    Each step declares the steps it depends on, either through the
+    depends_on of its FuncProp inputs or explicitly with after. A step may
+    only depend on steps added before it, so the graph is always acyclic.
+    Steps without dependencies between them can be executed concurrently
+    by the DAGExecutor.
+    """
+
+    dependencies: List[List[int]] = field(default_factory=list)
+
+    def add_step(
+        self: "DAGFlow",
+        step: Step,
+        inputs: List[Union[Prop, FuncProp]],
+        after: Optional[List[int]] = None,
+    ) -> int:
+        """Add a step to the flow.
+
+        Args:
+            step (Step): Step to add
+            inputs (List[Union[Prop, FuncProp]]): Inputs of the step
+            after (Optional[List[int]]): Indexes of steps to run before, on top of the FuncProp dependencies. Defaults to None. # noqa: B950
+
+        Raises:
+            FlowBuildError: Dependency on an unknown or later step
+
+        Returns:
+            int: Index of the added step
+        """
+        index = len(self.steps)
+        dependencies: Set[int] = set(after or [])
+        for item in inputs:
+            if isinstance(item, FuncProp):
+                dependencies.update(item.depends_on)
+        for dependency in dependencies:
+            if not 0 <= dependency < index:
+                raise FlowBuildError(
+                    human_description="Step depends on an unknown step",
+                    error=f"Step {index} depends on step {dependency}",
+                    error_type=IndexError,
+                    error_in_function=get_outer_function(),
+                )
+        super().add_step(step, inputs)
+        self.dependencies.append(sorted(dependencies))
+        return index
+
+    def output_of(self: "DAGFlow", index: int, description: str) -> FuncProp:
+        """Get a FuncProp resolving to the forward output of a step.
+
+        Args:
+            index (int): Index of the step
+            description (str): Description of the input
+
+        Returns:
+            FuncProp: Input depending on the step
+        """
+        return FuncProp(
+            func=self.get_froward_output,
+            params={"index": index},
+            description=description,
+            depends_on=[index],
+        )
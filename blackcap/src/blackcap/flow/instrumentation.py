@@ -0,0 +1,415 @@
+"""Flow instrumentation hooks."""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from logzero import logger
+
+from blackcap.configs import config_registry
+from blackcap.flow.flow import Flow
+from blackcap.flow.step import FuncProp
+from blackcap.utils.command_runner import LatencyHistogram
+
+config = config_registry.get_config()
+
+
+def get_step_name(flow: Flow, index: int) -> str:
+    """Get the name of a step.
+
+    Args:
+        flow (Flow): Flow of the step
+        index (int): Index of the step
+
+    Returns:
+        str: Name of the forward function of the step
+    """
+    forward_call = flow.steps[index].forward_call
+    return getattr(forward_call, "__name__", type(forward_call).__name__)
+
+
+class FlowHooks:
+    """Base class of the flow instrumentation hooks.
+
+    The executor calls the hooks around the flow, each step, each FuncProp
+    resolution and each backward call. Durations are in seconds. Errors
+    raised by hooks are logged and never fail the flow. Override only the
+    hooks you need, the others do nothing.
+    """
+
+    def on_flow_start(self: "FlowHooks", flow: Flow) -> None:
+        """Flow execution started.
+
+        Args:
+            flow (Flow): Executed flow
+        """
+        pass
+
+    def on_flow_end(self: "FlowHooks", flow: Flow, duration: float) -> None:
+        """Flow execution ended, flow.status tells whether it passed.
+
+        Args:
+            flow (Flow): Executed flow
+            duration (float): Duration of the flow
+        """
+        pass
+
+    def on_step_start(self: "FlowHooks", flow: Flow, index: int) -> None:
+        """Forward call of a step started, including its input resolution.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+        """
+        pass
+
+    def on_step_end(
+        self: "FlowHooks",
+        flow: Flow,
+        index: int,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """Forward call of a step ended.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            duration (float): Duration of the step
+            error (Optional[Exception]): Error of the step if it failed
+        """
+        pass
+
+    def on_func_prop_start(
+        self: "FlowHooks", flow: Flow, index: int, func_prop: FuncProp
+    ) -> None:
+        """Resolution of a FuncProp input of a step started.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            func_prop (FuncProp): Resolved FuncProp
+        """
+        pass
+
+    def on_func_prop_end(
+        self: "FlowHooks",
+        flow: Flow,
+        index: int,
+        func_prop: FuncProp,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """Resolution of a FuncProp input of a step ended.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            func_prop (FuncProp): Resolved FuncProp
+            duration (float): Duration of the resolution
+            error (Optional[Exception]): Error of the resolution if it failed
+        """
+        pass
+
+    def on_backward_start(self: "FlowHooks", flow: Flow, index: int) -> None:
+        """Backward call of a step started.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+        """
+        pass
+
+    def on_backward_end(
+        self: "FlowHooks",
+        flow: Flow,
+        index: int,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """Backward call of a step ended.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            duration (float): Duration of the backward call
+            error (Optional[Exception]): Error of the backward call if it failed
+        """
+        pass
+
+
+class DurationCollector(FlowHooks):
+    """Collect step durations and log them once the flow ends.
+
+    Durations of all flows are also aggregated in a histogram per step name.
+    """
+
+    def __init__(self: "DurationCollector") -> None:
+        """Initialize collector."""
+        self.latency = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._durations: Dict[int, List[Tuple[str, float]]] = {}
+
+    def record(
+        self: "DurationCollector", flow: Flow, name: str, duration: float
+    ) -> None:
+        """Record the duration of a step.
+
+        Args:
+            flow (Flow): Executed flow
+            name (str): Name of the step
+            duration (float): Duration of the step
+        """
+        self.latency.observe(name, duration)
+        with self._lock:
+            self._durations.setdefault(id(flow), []).append((name, duration))
+
+    def on_step_end(
+        self: "DurationCollector",
+        flow: Flow,
+        index: int,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """Record the duration of a forward call.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            duration (float): Duration of the step
+            error (Optional[Exception]): Error of the step if it failed
+        """
+        self.record(flow, get_step_name(flow, index), duration)
+
+    def on_backward_end(
+        self: "DurationCollector",
+        flow: Flow,
+        index: int,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """Record the duration of a backward call.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            duration (float): Duration of the backward call
+            error (Optional[Exception]): Error of the backward call if it failed
+        """
+        self.record(flow, f"{get_step_name(flow, index)}.backward", duration)
+
+    def on_flow_end(self: "DurationCollector", flow: Flow, duration: float) -> None:
+        """Log the durations of the steps of the flow.
+
+        Args:
+            flow (Flow): Executed flow
+            duration (float): Duration of the flow
+        """
+        with self._lock:
+            durations = self._durations.pop(id(flow), [])
+        steps = " ".join(f"{name}={seconds:.3f}s" for name, seconds in durations)
+        logger.info(
+            f"Flow durations: status={flow.status.value} total={duration:.3f}s {steps}"
+        )
+
+
+class OTelSpanExporter(FlowHooks):
+    """Export flows as OpenTelemetry spans.
+
+    Each flow is a span with a child span per step, FuncProp resolution and
+    backward call. Spans go through the globally configured tracer provider,
+    so they reach any exporter set up with the OpenTelemetry SDK. Requires
+    the opentelemetry-api package.
+    """
+
+    def __init__(self: "OTelSpanExporter", tracer: Any = None) -> None:
+        """Initialize exporter.
+
+        Args:
+            tracer (Any): OpenTelemetry tracer. Defaults to the tracer of the global provider. # noqa: B950
+
+        Raises:
+            ImportError: opentelemetry-api is not installed
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OTelSpanExporter requires opentelemetry-api, install blackcap[otel]"
+            ) from e
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("blackcap.flow")
+        self._lock = threading.Lock()
+        self._spans: Dict[Tuple[int, str], Any] = {}
+
+    def _start(
+        self: "OTelSpanExporter",
+        key: Tuple[int, str],
+        name: str,
+        parent: Optional[Tuple[int, str]],
+        attributes: Dict[str, Any],
+    ) -> None:
+        """Start a span.
+
+        Args:
+            key (Tuple[int, str]): Key of the span
+            name (str): Name of the span
+            parent (Optional[Tuple[int, str]]): Key of the parent span
+            attributes (Dict[str, Any]): Attributes of the span
+        """
+        with self._lock:
+            parent_span = self._spans.get(parent) if parent is not None else None
+        context = (
+            self._trace.set_span_in_context(parent_span)
+            if parent_span is not None
+            else None
+        )
+        span = self.tracer.start_span(name, context=context, attributes=attributes)
+        with self._lock:
+            self._spans[key] = span
+
+    def _end(
+        self: "OTelSpanExporter",
+        key: Tuple[int, str],
+        error: Optional[Exception] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """End a span.
+
+        Args:
+            key (Tuple[int, str]): Key of the span
+            error (Optional[Exception]): Error to record on the span. Defaults to None. # noqa: B950
+            attributes (Optional[Dict[str, Any]]): Attributes to add. Defaults to None. # noqa: B950
+        """
+        with self._lock:
+            span = self._spans.pop(key, None)
+        if span is None:
+            return
+        if attributes:
+            span.set_attributes(attributes)
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, str(error))
+            )
+        span.end()
+
+    def on_flow_start(self: "OTelSpanExporter", flow: Flow) -> None:
+        """Start the span of the flow.
+
+        Args:
+            flow (Flow): Executed flow
+        """
+        self._start((id(flow), "flow"), "flow", None, {"flow.steps": len(flow.steps)})
+
+    def on_flow_end(self: "OTelSpanExporter", flow: Flow, duration: float) -> None:
+        """End the span of the flow.
+
+        Args:
+            flow (Flow): Executed flow
+            duration (float): Duration of the flow
+        """
+        self._end((id(flow), "flow"), attributes={"flow.status": flow.status.value})
+
+    def on_step_start(self: "OTelSpanExporter", flow: Flow, index: int) -> None:
+        """Start the span of a step.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+        """
+        self._start(
+            (id(flow), f"step.{index}"),
+            f"step {get_step_name(flow, index)}",
+            (id(flow), "flow"),
+            {"flow.step.index": index},
+        )
+
+    def on_step_end(
+        self: "OTelSpanExporter",
+        flow: Flow,
+        index: int,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """End the span of a step.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            duration (float): Duration of the step
+            error (Optional[Exception]): Error of the step if it failed
+        """
+        self._end((id(flow), f"step.{index}"), error)
+
+    def on_func_prop_start(
+        self: "OTelSpanExporter", flow: Flow, index: int, func_prop: FuncProp
+    ) -> None:
+        """Start the span of a FuncProp resolution.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            func_prop (FuncProp): Resolved FuncProp
+        """
+        self._start(
+            (id(flow), f"func_prop.{index}.{id(func_prop)}"),
+            f"func_prop {func_prop.description}",
+            (id(flow), f"step.{index}"),
+            {"flow.step.index": index},
+        )
+
+    def on_func_prop_end(
+        self: "OTelSpanExporter",
+        flow: Flow,
+        index: int,
+        func_prop: FuncProp,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """End the span of a FuncProp resolution.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            func_prop (FuncProp): Resolved FuncProp
+            duration (float): Duration of the resolution
+            error (Optional[Exception]): Error of the resolution if it failed
+        """
+        self._end((id(flow), f"func_prop.{index}.{id(func_prop)}"), error)
+
+    def on_backward_start(self: "OTelSpanExporter", flow: Flow, index: int) -> None:
+        """Start the span of a backward call.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+        """
+        self._start(
+            (id(flow), f"backward.{index}"),
+            f"backward {get_step_name(flow, index)}",
+            (id(flow), "flow"),
+            {"flow.step.index": index},
+        )
+
+    def on_backward_end(
+        self: "OTelSpanExporter",
+        flow: Flow,
+        index: int,
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """End the span of a backward call.
+
+        Args:
+            flow (Flow): Executed flow
+            index (int): Index of the step
+            duration (float): Duration of the backward call
+            error (Optional[Exception]): Error of the backward call if it failed
+        """
+        self._end((id(flow), f"backward.{index}"), error)
+
+
+# Hooks of executors created without explicit hooks
+default_hooks: List[FlowHooks] = [DurationCollector()]
+if config.FLOW_TRACING:
+    default_hooks.append(OTelSpanExporter())
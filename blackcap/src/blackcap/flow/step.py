@@ -1,6 +1,6 @@
 """Flow steps."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Dict, List
 
 
@@ -19,6 +19,8 @@ class FuncProp:
     func: Callable
     params: Dict
     description: str
+    # Indexes of the steps whose outputs func reads, used by DAGFlow
+    depends_on: List[int] = field(default_factory=list)
 
 
 @dataclass
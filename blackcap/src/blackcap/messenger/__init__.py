@@ -1,12 +1,20 @@
 """Messenger that delivers and reads msgs from a pub/sub queue."""
 
 from blackcap.configs import config_registry
+from blackcap.messenger.async_gcp_messenger import AsyncGCPMessenger
+from blackcap.messenger.async_nats_messenger import AsyncNATSMessenger
 from blackcap.messenger.gcp_messenger import GCPMessenger
 from blackcap.messenger.nats_messenger import NATSMessenger
-from blackcap.messenger.registry import MessengerRegistry
+from blackcap.messenger.registry import AsyncMessengerRegistry, MessengerRegistry
 
 config = config_registry.get_config()
 
+gcp_messenger = GCPMessenger(config)
+
 messenger_registry = MessengerRegistry()
-messenger_registry.add_messenger(GCPMessenger(config))
+messenger_registry.add_messenger(gcp_messenger)
 messenger_registry.add_messenger(NATSMessenger(config))
+
+async_messenger_registry = AsyncMessengerRegistry()
+async_messenger_registry.add_messenger(AsyncGCPMessenger(config, gcp_messenger))
+async_messenger_registry.add_messenger(AsyncNATSMessenger(config))
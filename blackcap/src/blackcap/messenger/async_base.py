@@ -0,0 +1,124 @@
+"""Base asyncio messenger class."""
+
+from abc import ABC, abstractmethod
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from logzero import logger
+
+from blackcap.messenger.base import PublishResult
+from blackcap.schemas.message import Message
+
+
+class AsyncBaseMessenger(ABC):
+    """Base asyncio messenger class."""
+
+    CONFIG_KEY = "MESSENGER"
+    CONFIG_KEY_DEF_VAL = "GCP"
+
+    # Change this value in custom messenger implementations.
+    CONFIG_KEY_VAL = "GCP"
+
+    @abstractmethod
+    async def publish(self: "AsyncBaseMessenger", msg: Dict, topic_id: str) -> str:
+        """Publish a msg.
+
+        Args:
+            msg (Dict): Message to publish
+            topic_id (str): Id of the topic
+        """
+        pass
+
+    async def publish_many(
+        self: "AsyncBaseMessenger", msgs: List[Dict], topic_id: str
+    ) -> List[PublishResult]:
+        """Publish a batch of msgs concurrently.
+
+        Args:
+            msgs (List[Dict]): Messages to publish
+            topic_id (str): Id of the topic
+
+        Returns:
+            List[PublishResult]: Result of each msg, in the order of msgs
+        """
+        outcomes = await asyncio.gather(
+            *[self.publish(msg, topic_id) for msg in msgs], return_exceptions=True
+        )
+        return [
+            (
+                PublishResult(msg=msg, error=outcome)
+                if isinstance(outcome, Exception)
+                else PublishResult(msg=msg, msg_id=outcome)
+            )
+            for msg, outcome in zip(msgs, outcomes)
+        ]
+
+    @abstractmethod
+    async def subscribe(
+        self: "AsyncBaseMessenger",
+        callback: Callable[[Any], Awaitable[None]],
+        sub_id: str,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Subscribe to a topic.
+
+        Msgs are handed to the callback concurrently, up to
+        MESSENGER_MAX_IN_FLIGHT at a time. Subscribing to several topics is
+        done by gathering several subscribe calls on the same loop.
+
+        Args:
+            callback (Callable[[Any], Awaitable[None]]): Coroutine function to invoke when a msg is received # noqa: B950
+            sub_id (str): Id of the topic.
+            timeout (Union[float, None]): Time to wait for msgs. Defaults to None. # noqa: E501
+        """
+        pass
+
+    @abstractmethod
+    async def close(self: "AsyncBaseMessenger") -> None:
+        """Flush pending msgs and close connections."""
+        pass
+
+    @abstractmethod
+    def parse_messenger_msg(self: "AsyncBaseMessenger", messenger_msg: Any) -> Message:
+        """Parse messenger msg to blackcap mesage schema.
+
+        Args:
+            messenger_msg (Any): Messenger specific message
+        """
+        pass
+
+
+def bounded_callback(
+    callback: Callable[[Any], Awaitable[None]], max_in_flight: int
+) -> Callable[[Any], Awaitable[None]]:
+    """Wrap a msg callback so every msg is handled in its own task.
+
+    At most max_in_flight msgs are handled at once, the wrapper waits for a
+    free slot before returning so the messenger stops reading new msgs.
+
+    Args:
+        callback (Callable[[Any], Awaitable[None]]): Msg callback
+        max_in_flight (int): Maximum number of msgs handled at once
+
+    Returns:
+        Callable[[Any], Awaitable[None]]: Wrapped callback
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    tasks = set()
+
+    async def handle(msg: Any) -> None:
+        try:
+            await callback(msg)
+        except Exception as e:
+            logger.error(f"Msg callback failed. Error: {e}")
+        finally:
+            semaphore.release()
+
+    async def wrapper(msg: Any) -> None:
+        await semaphore.acquire()
+        task = asyncio.ensure_future(handle(msg))
+        # Keep a reference so the task isn't garbage collected mid flight
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    return wrapper
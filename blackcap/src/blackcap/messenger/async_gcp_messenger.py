@@ -0,0 +1,118 @@
+"""asyncio GCP implementation of messenger."""
+
+import asyncio
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Optional
+
+from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1.subscriber.message import Message as GCPMessage
+from logzero import logger
+
+from blackcap.configs.base import BaseConfig
+from blackcap.messenger.async_base import AsyncBaseMessenger
+from blackcap.messenger.gcp_messenger import GCPMessenger
+from blackcap.schemas.message import Message
+
+
+class AsyncGCPMessenger(AsyncBaseMessenger):
+    """asyncio wrapper around the GCP(Pub/Sub) Messenger.
+
+    The Pub/Sub client is thread based, its futures are awaited on the loop
+    and msgs received on its threads are dispatched back onto the loop.
+    """
+
+    CONFIG_KEY_VAL = "GCP"
+
+    def __init__(
+        self: "AsyncGCPMessenger",
+        config: BaseConfig,
+        messenger: Optional[GCPMessenger] = None,
+    ) -> None:
+        """Initialize Messenger with app config.
+
+        Args:
+            config (BaseConfig): Config to initialize messenger
+            messenger (Optional[GCPMessenger]): Sync messenger whose clients are shared. Defaults to None. # noqa: B950
+        """
+        self.config = config
+        self.messenger = messenger or GCPMessenger(config)
+
+    async def publish(self: "AsyncGCPMessenger", msg: Dict, topic_id: str) -> str:
+        """Publish msg on the GCP Pub/Sub queue.
+
+        Args:
+            msg (Dict): Messsag to publish
+            topic_id (str): Id of the topic
+
+        Returns:
+            str: Id of the published msg
+        """
+        return await asyncio.wrap_future(self.messenger.publish_async(msg, topic_id))
+
+    async def subscribe(
+        self: "AsyncGCPMessenger",
+        callback: Callable[[GCPMessage], Awaitable[None]],
+        sub_id: str,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Subscribe to a topic.
+
+        Pub/Sub flow control keeps at most MESSENGER_MAX_IN_FLIGHT msgs leased,
+        the callback is responsible for acking them.
+
+        Args:
+            callback (Callable[[GCPMessage], Awaitable[None]]): Coroutine function to invoke when a msg is received # noqa: B950
+            sub_id (str): Id of the topic.
+            timeout (Union[float, None]): Time to wait for msgs. Defaults to None. # noqa: E501
+        """
+        loop = asyncio.get_running_loop()
+        subscriber = self.messenger.subscriber
+        subscription_path = subscriber.subscription_path(
+            self.messenger.project_id, sub_id
+        )
+
+        def dispatch(msg: GCPMessage) -> None:
+            future = asyncio.run_coroutine_threadsafe(callback(msg), loop)
+
+            def nack_on_error(future: Future) -> None:
+                if future.cancelled() or future.exception() is not None:
+                    logger.error(f"Msg callback failed for msg: {msg.message_id}")
+                    msg.nack()
+
+            future.add_done_callback(nack_on_error)
+
+        streaming_pull_future = subscriber.subscribe(
+            subscription_path,
+            callback=dispatch,
+            flow_control=pubsub_v1.types.FlowControl(
+                max_messages=self.config.MESSENGER_MAX_IN_FLIGHT
+            ),
+        )
+        logger.info(f"Subscription created: {subscription_path}")
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(streaming_pull_future), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            streaming_pull_future.cancel()
+
+    async def close(self: "AsyncGCPMessenger") -> None:
+        """Flush pending msgs and close connections."""
+        loop = asyncio.get_running_loop()
+        # Stopping the publisher blocks until its pending batches are sent
+        await loop.run_in_executor(None, self.messenger.publisher.stop)
+        await loop.run_in_executor(None, self.messenger.subscriber.close)
+        self.messenger.reset_clients()
+
+    def parse_messenger_msg(
+        self: "AsyncGCPMessenger", messenger_msg: GCPMessage
+    ) -> Message:
+        """Parse messenger msg to blackcap mesage schema.
+
+        Args:
+            messenger_msg (GCPMessage): GCPMessenger message
+
+        Returns:
+            Message: Parsed Message
+        """
+        return self.messenger.parse_messenger_msg(messenger_msg)
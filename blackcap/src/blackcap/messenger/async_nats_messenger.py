@@ -0,0 +1,143 @@
+"""asyncio NATS implementation of messenger."""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from logzero import logger
+import nats
+from nats.aio.client import Client as NATSClient
+from nats.aio.msg import Msg as NATSMsg
+
+from blackcap.configs.base import BaseConfig
+from blackcap.messenger.async_base import AsyncBaseMessenger, bounded_callback
+from blackcap.messenger.base import PublishResult
+from blackcap.schemas.message import Message
+from blackcap.utils.json_encoders import UUIDEncoder
+
+
+class AsyncNATSMessenger(AsyncBaseMessenger):
+    """asyncio NATS implementation of Messenger."""
+
+    CONFIG_KEY_VAL = "NATS"
+
+    def __init__(self: "AsyncNATSMessenger", config: BaseConfig) -> None:
+        """Initialize Messenger with app config.
+
+        Args:
+            config (BaseConfig): Config to initialize messenger
+        """
+        self.config = config
+        self._client: Optional[NATSClient] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get_client(self: "AsyncNATSMessenger") -> NATSClient:
+        """Get the shared connection, connecting on first use.
+
+        The client reconnects by itself, so it only has to be created once
+        per event loop.
+
+        Returns:
+            NATSClient: Connected client
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = await nats.connect(
+                    servers=[self.config.NATS_ENDPOINT],
+                    name=self.config.FLASK_APP,
+                    max_reconnect_attempts=-1,
+                    ping_interval=int(self.config.NATS_PING_INTERVAL),
+                )
+        return self._client
+
+    async def publish(self: "AsyncNATSMessenger", msg: Dict, topic_id: str) -> str:
+        """Publish msg on the NATS queue.
+
+        Args:
+            msg (Dict): Messsag to publish
+            topic_id (str): Id of the topic
+
+        Returns:
+            str: Id of the published msg
+        """
+        client = await self.get_client()
+        await client.publish(topic_id, json.dumps(msg, cls=UUIDEncoder).encode("utf-8"))
+        return "ok"
+
+    async def publish_many(
+        self: "AsyncNATSMessenger", msgs: List[Dict], topic_id: str
+    ) -> List[PublishResult]:
+        """Publish a batch of msgs and flush them in a single round trip.
+
+        Args:
+            msgs (List[Dict]): Messages to publish
+            topic_id (str): Id of the topic
+
+        Returns:
+            List[PublishResult]: Result of each msg, in the order of msgs
+        """
+        results = await super().publish_many(msgs, topic_id)
+        try:
+            client = await self.get_client()
+            await client.flush()
+        except Exception as e:
+            results = [
+                PublishResult(msg=result.msg, error=result.error or e)
+                for result in results
+            ]
+        return results
+
+    async def subscribe(
+        self: "AsyncNATSMessenger",
+        callback: Callable[[NATSMsg], Awaitable[None]],
+        sub_id: str,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Subscribe to a topic.
+
+        Args:
+            callback (Callable[[NATSMsg], Awaitable[None]]): Coroutine function to invoke when a msg is received # noqa: B950
+            sub_id (str): Id of the topic.
+            timeout (Union[float, None]): Time to wait for msgs. Defaults to None. # noqa: E501
+        """
+        client = await self.get_client()
+        sub = await client.subscribe(
+            sub_id,
+            cb=bounded_callback(callback, self.config.MESSENGER_MAX_IN_FLIGHT),
+        )
+        logger.info(f"Subscription created: {sub_id}")
+        try:
+            await asyncio.wait_for(asyncio.Event().wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await sub.unsubscribe()
+
+    async def close(self: "AsyncNATSMessenger") -> None:
+        """Flush pending msgs and close the connection."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.drain()
+        self._client = None
+
+    def parse_messenger_msg(
+        self: "AsyncNATSMessenger", messenger_msg: NATSMsg
+    ) -> Message:
+        """Parse messenger msg to blackcap mesage schema.
+
+        Args:
+            messenger_msg (NATSMsg): NATS message
+
+        Returns:
+            Message: Parsed Message
+        """
+        return Message.parse_raw(messenger_msg.data.decode("utf-8"))
+
+    async def echo_msg(self: "AsyncNATSMessenger", msg: Any) -> None:
+        """Echo msgs to stdout.
+
+        Args:
+            msg (Any): Message to echo
+        """
+        print(msg)
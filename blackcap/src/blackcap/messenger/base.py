@@ -1,11 +1,28 @@
 """Base messenger class."""
 
 from abc import ABC, abstractclassmethod
-from typing import Any, Callable, Dict, Optional
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
 
+from blackcap.messenger.flow_control import FlowControl
 from blackcap.schemas.message import Message
 
 
+@dataclass
+class PublishResult:
+    """Outcome of publishing a single msg."""
+
+    msg: Dict
+    msg_id: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self: "PublishResult") -> bool:
+        """Whether the msg was published."""
+        return self.error is None
+
+
 class BaseMessenger(ABC):
     """Base messenger class."""
 
@@ -25,12 +42,70 @@ class BaseMessenger(ABC):
         """
         pass
 
+    def publish_async(self: "BaseMessenger", msg: Dict, topic_id: str) -> Future:
+        """Publish a msg without waiting for it to be delivered.
+
+        Messengers with a native async client should override this. The
+        default implementation publishes synchronously.
+
+        Args:
+            msg (Dict): Message to publish
+            topic_id (str): Id of the topic
+
+        Returns:
+            Future: Future resolving to the id of the published msg
+        """
+        future = Future()
+        try:
+            future.set_result(self.publish(msg, topic_id))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def publish_many(
+        self: "BaseMessenger",
+        msgs: List[Dict],
+        topic_id: str,
+        timeout: Optional[float] = None,
+    ) -> List[PublishResult]:
+        """Publish a batch of msgs.
+
+        All msgs are sent before waiting on any of them, a failed msg does
+        not stop the rest of the batch from being published.
+
+        Args:
+            msgs (List[Dict]): Messages to publish
+            topic_id (str): Id of the topic
+            timeout (Optional[float]): Time to wait for each msg. Defaults to None.
+
+        Returns:
+            List[PublishResult]: Result of each msg, in the order of msgs
+        """
+        futures = []
+        for msg in msgs:
+            try:
+                futures.append(self.publish_async(msg, topic_id))
+            except Exception as e:
+                futures.append(e)
+
+        results = []
+        for msg, future in zip(msgs, futures):
+            if isinstance(future, Exception):
+                results.append(PublishResult(msg=msg, error=future))
+                continue
+            try:
+                results.append(PublishResult(msg=msg, msg_id=future.result(timeout)))
+            except Exception as e:
+                results.append(PublishResult(msg=msg, error=e))
+        return results
+
     @abstractclassmethod
     def subscribe(
         self: "BaseMessenger",
         callback: Callable,
         sub_id: str,
         timeout: Optional[float] = None,
+        flow_control: Optional[FlowControl] = None,
     ) -> None:
         """Subscribe to a topic.
 
@@ -38,6 +113,29 @@ class BaseMessenger(ABC):
             callback (Callable): Callback to invoke when a msg is received
             sub_id (str): Id of the topic.
             timeout (Union[float, None]): Time to wait for msgs. Defaults to None. # noqa: E501
+            flow_control (Optional[FlowControl]): Subscription limits. Defaults to config.
+        """
+        pass
+
+    def ack_msg(self: "BaseMessenger", messenger_msg: Any) -> None:
+        """Acknowledge a processed msg.
+
+        Messengers with delivery guarantees should override this. The default
+        implementation does nothing.
+
+        Args:
+            messenger_msg (Any): Messenger specific message
+        """
+        pass
+
+    def nack_msg(self: "BaseMessenger", messenger_msg: Any) -> None:
+        """Reject a msg so that it gets redelivered.
+
+        Messengers with delivery guarantees should override this. The default
+        implementation does nothing.
+
+        Args:
+            messenger_msg (Any): Messenger specific message
         """
         pass
 
@@ -0,0 +1,117 @@
+"""Flow control for messenger subscriptions."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable
+
+from logzero import logger
+
+from blackcap.configs.base import BaseConfig
+
+
+@dataclass
+class FlowControl:
+    """Limits applied to a subscription."""
+
+    # Maximum number of received msgs not yet processed by the callback
+    max_messages: int = 100
+    # Maximum total size in bytes of received msgs not yet processed
+    max_bytes: int = 100 * 1024 * 1024
+    # Number of threads invoking the callback
+    workers: int = 10
+
+    @classmethod
+    def from_config(cls: Any, config: BaseConfig) -> "FlowControl":
+        """Create flow control from app config.
+
+        Args:
+            config (BaseConfig): App config
+
+        Returns:
+            FlowControl: Flow control with the configured limits
+        """
+        return cls(
+            max_messages=config.MESSENGER_MAX_OUTSTANDING_MSGS,
+            max_bytes=config.MESSENGER_MAX_OUTSTANDING_BYTES,
+            workers=config.MESSENGER_CALLBACK_WORKERS,
+        )
+
+
+class BoundedDispatcher:
+    """Run msg callbacks on a worker pool with a cap on outstanding msgs.
+
+    dispatch() blocks the caller, i.e. the thread reading msgs off the wire,
+    while the caps are reached so msgs are not pulled faster than the
+    callbacks can process them.
+    """
+
+    def __init__(
+        self: "BoundedDispatcher", callback: Callable, flow_control: FlowControl
+    ) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            callback (Callable): Callback to invoke for each msg
+            flow_control (FlowControl): Limits to enforce
+        """
+        self.callback = callback
+        self.flow_control = flow_control
+        self.executor = ThreadPoolExecutor(
+            max_workers=flow_control.workers, thread_name_prefix="msg-callback"
+        )
+        self._condition = threading.Condition()
+        self._outstanding_msgs = 0
+        self._outstanding_bytes = 0
+
+    def _has_room(self: "BoundedDispatcher", size: int) -> bool:
+        """Check if a msg of the given size fits within the caps.
+
+        Args:
+            size (int): Size of the msg in bytes
+
+        Returns:
+            bool: True if the msg can be dispatched now
+        """
+        if self._outstanding_msgs == 0:
+            # Always let a single msg through, even if it is bigger than max_bytes
+            return True
+        return (
+            self._outstanding_msgs < self.flow_control.max_messages
+            and self._outstanding_bytes + size <= self.flow_control.max_bytes
+        )
+
+    def dispatch(self: "BoundedDispatcher", msg: Any, size: int = 0) -> Future:
+        """Hand a msg to the worker pool, waiting for room if needed.
+
+        Args:
+            msg (Any): Messenger specific msg
+            size (int): Size of the msg in bytes. Defaults to 0.
+
+        Returns:
+            Future: Future of the callback invocation
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._has_room(size))
+            self._outstanding_msgs += 1
+            self._outstanding_bytes += size
+
+        def done(future: Future) -> None:
+            if future.exception() is not None:
+                logger.error(f"Msg callback failed. Error: {future.exception()}")
+            with self._condition:
+                self._outstanding_msgs -= 1
+                self._outstanding_bytes -= size
+                self._condition.notify_all()
+
+        future = self.executor.submit(self.callback, msg)
+        future.add_done_callback(done)
+        return future
+
+    def shutdown(self: "BoundedDispatcher", wait: bool = True) -> None:
+        """Stop the worker pool.
+
+        Args:
+            wait (bool): Wait for outstanding callbacks. Defaults to True.
+        """
+        self.executor.shutdown(wait=wait)
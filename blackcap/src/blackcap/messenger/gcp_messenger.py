@@ -1,15 +1,21 @@
 """GCP implementation of messenger."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
 import json
-from typing import Callable, Dict, Optional
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from google.auth import jwt
 from google.cloud import pubsub_v1
 from google.cloud.pubsub_v1.subscriber.message import Message as GCPMessage
+from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
 from logzero import logger
 
 from blackcap.configs.base import BaseConfig
 from blackcap.messenger.base import BaseMessenger
+from blackcap.messenger.flow_control import FlowControl
 from blackcap.schemas.message import Message
 from blackcap.utils.json_encoders import UUIDEncoder
 
@@ -32,26 +38,99 @@ class GCPMessenger(BaseMessenger):
 
         self.project_id = config.GCP_PROJECT_ID
 
+        # Clients and credentials are expensive to build, so they are created
+        # lazily once per process and reused by every publish/subscribe call.
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._service_account_info: Optional[Dict] = None
+        self._credentials: Dict[str, jwt.Credentials] = {}
+        self._clients: Dict[Tuple[type, str, str], Any] = {}
+
+        # gRPC channels must not be shared across a fork (celery prefork workers)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.reset_clients)
+
     @property
     def service_account_info(self: "GCPMessenger") -> Dict:
         """Service account info."""
-        return json.load(open(self.config.GOOGLE_APPLICATION_CREDENTIALS))
+        if self._service_account_info is None:
+            with open(self.config.GOOGLE_APPLICATION_CREDENTIALS) as f:
+                self._service_account_info = json.load(f)
+        return self._service_account_info
 
     @property
     def publisher(self: "GCPMessenger") -> pubsub_v1.PublisherClient:
         """Publisher Client."""
-        self.pub_credentials = jwt.Credentials.from_service_account_info(
-            self.service_account_info, audience=self.pub_audience
-        )
-        return pubsub_v1.PublisherClient(credentials=self.pub_credentials)
+        return self._get_client(pubsub_v1.PublisherClient, self.pub_audience)
 
     @property
     def subscriber(self: "GCPMessenger") -> pubsub_v1.SubscriberClient:
         """Subscriber Client."""
-        self.sub_credentials = jwt.Credentials.from_service_account_info(
-            self.service_account_info, audience=self.sub_audience
-        )
-        return pubsub_v1.SubscriberClient(credentials=self.sub_credentials)
+        return self._get_client(pubsub_v1.SubscriberClient, self.sub_audience)
+
+    def reset_clients(self: "GCPMessenger") -> None:
+        """Drop all cached clients and credentials.
+
+        Called automatically in forked children so that they never reuse the
+        parent's gRPC channels.
+        """
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._credentials = {}
+        self._clients = {}
+
+    def _get_credentials(self: "GCPMessenger", audience: str) -> jwt.Credentials:
+        """Get cached credentials for an audience, refreshing them before expiry.
+
+        Args:
+            audience (str): Audience of the credentials
+
+        Returns:
+            jwt.Credentials: Credentials valid for at least the refresh margin
+        """
+        credentials = self._credentials.get(audience)
+        if credentials is None:
+            credentials = jwt.Credentials.from_service_account_info(
+                self.service_account_info, audience=audience
+            )
+            self._credentials[audience] = credentials
+        margin = timedelta(seconds=self.config.GCP_CREDENTIALS_REFRESH_MARGIN)
+        refresh_at = credentials.expiry and credentials.expiry - margin
+        if refresh_at is None or refresh_at <= datetime.utcnow():
+            # Self signed JWT credentials do not need a transport to refresh
+            credentials.refresh(None)
+        return credentials
+
+    def _get_client(self: "GCPMessenger", client_cls: type, audience: str) -> Any:
+        """Get a cached client keyed by client type, audience and project.
+
+        Args:
+            client_cls (type): Pub/Sub client class
+            audience (str): Audience of the client credentials
+
+        Returns:
+            Any: Instance of client_cls
+        """
+        if self._pid != os.getpid():
+            self.reset_clients()
+        key = (client_cls, audience, self.project_id)
+        with self._lock:
+            credentials = self._get_credentials(audience)
+            client = self._clients.get(key)
+            if client is None:
+                client = client_cls(credentials=credentials)
+                self._clients[key] = client
+            return client
+
+    def _drop_client(self: "GCPMessenger", client_cls: type, audience: str) -> None:
+        """Remove a client from the cache.
+
+        Args:
+            client_cls (type): Pub/Sub client class
+            audience (str): Audience of the client credentials
+        """
+        with self._lock:
+            self._clients.pop((client_cls, audience, self.project_id), None)
 
     def publish(self: "GCPMessenger", msg: Dict, topic_id: str) -> str:
         """Publish msg on the GCP Pub/Sub queue.
@@ -63,45 +142,82 @@ class GCPMessenger(BaseMessenger):
         Returns:
             str: Id of the published msg
         """
-        topic_path = self.publisher.topic_path(self.project_id, topic_id)
+        # Wait for the returned future
+        return self.publish_async(msg, topic_id).result()
+
+    def publish_async(self: "GCPMessenger", msg: Dict, topic_id: str) -> Future:
+        """Publish msg on the GCP Pub/Sub queue without waiting for it.
+
+        The publisher client batches msgs sent in quick succession, so
+        publishing many msgs this way pipelines them into few requests.
+
+        Args:
+            msg (Dict): Messsag to publish
+            topic_id (str): Id of the topic
+
+        Returns:
+            Future: Future resolving to the id of the published msg
+        """
+        publisher = self.publisher
+        topic_path = publisher.topic_path(self.project_id, topic_id)
 
         # Msg must be a bytestring
-
         msg = json.dumps(msg, cls=UUIDEncoder).encode("utf-8")
 
-        # Wait for the returned future
-        future = self.publisher.publish(topic_path, msg)
-        return future.result()
+        return publisher.publish(topic_path, msg)
 
     def subscribe(
         self: "GCPMessenger",
         callback: Callable,
         sub_id: str,
         timeout: Optional[float] = None,
+        flow_control: Optional[FlowControl] = None,
     ) -> None:
         """Subscribe to a topic.
 
+        The client stops leasing new msgs once the outstanding msgs or bytes
+        reach the flow control limits, and runs callbacks on a pool of
+        flow_control.workers threads. Acks and nacks issued by callbacks are
+        sent to Pub/Sub in batches by the client.
+
         Args:
             callback (Callable): Callback to invoke when a msg is received
             sub_id (str): Id of the topic.
             timeout (Union[float, None]): Time to wait for msgs. Defaults to None. # noqa: E501
+            flow_control (Optional[FlowControl]): Subscription limits. Defaults to config.
         """
-        subscription_path = self.subscriber.subscription_path(self.project_id, sub_id)
+        if flow_control is None:
+            flow_control = FlowControl.from_config(self.config)
 
-        streaming_pull_future = self.subscriber.subscribe(
+        subscriber = self.subscriber
+        subscription_path = subscriber.subscription_path(self.project_id, sub_id)
+
+        executor = ThreadPoolExecutor(
+            max_workers=flow_control.workers, thread_name_prefix="msg-callback"
+        )
+        streaming_pull_future = subscriber.subscribe(
             subscription_path,
             callback=callback,
+            flow_control=pubsub_v1.types.FlowControl(
+                max_messages=flow_control.max_messages,
+                max_bytes=flow_control.max_bytes,
+            ),
+            scheduler=ThreadScheduler(executor=executor),
             await_callbacks_on_shutdown=True,
         )
 
-        with self.subscriber:
-            try:
-                streaming_pull_future.result(timeout=timeout)
-            except TimeoutError as e:
-                logger.error(
-                    f"GCPMessenger timeout error while pulling messages. Error: {e}"
-                )
-                streaming_pull_future.cancel()
+        try:
+            with subscriber:
+                try:
+                    streaming_pull_future.result(timeout=timeout)
+                except TimeoutError as e:
+                    logger.error(
+                        f"GCPMessenger timeout error while pulling messages. Error: {e}"
+                    )
+                    streaming_pull_future.cancel()
+        finally:
+            # Exiting the context closes the client, so it can't be reused
+            self._drop_client(pubsub_v1.SubscriberClient, self.sub_audience)
 
     def parse_messenger_msg(self: "GCPMessenger", messenger_msg: GCPMessage) -> Message:
         """Parse messenger msg to blackcap mesage schema.
@@ -114,6 +230,22 @@ class GCPMessenger(BaseMessenger):
         """
         return Message.parse_raw(messenger_msg.data)
 
+    def ack_msg(self: "GCPMessenger", messenger_msg: GCPMessage) -> None:
+        """Acknowledge a processed msg.
+
+        Args:
+            messenger_msg (GCPMessage): GCPMessenger message
+        """
+        messenger_msg.ack()
+
+    def nack_msg(self: "GCPMessenger", messenger_msg: GCPMessage) -> None:
+        """Reject a msg so that Pub/Sub redelivers it.
+
+        Args:
+            messenger_msg (GCPMessage): GCPMessenger message
+        """
+        messenger_msg.nack()
+
     def echo_msg(self: "GCPMessenger", msg: Message) -> None:
         """Echo msgs to stdout.
 
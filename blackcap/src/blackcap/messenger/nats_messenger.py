@@ -1,17 +1,27 @@
 """NATS implementation of messenger."""
 
+import atexit
 from dataclasses import asdict
 import json
-from typing import Callable, Dict, Optional
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
 
+from backoff import expo, on_exception
 from logzero import logger
 from pynats import NATSClient, NATSMessage
+from pynats.exceptions import NATSError
 
 from blackcap.configs.base import BaseConfig
-from blackcap.messenger.base import BaseMessenger
+from blackcap.messenger.base import BaseMessenger, PublishResult
+from blackcap.messenger.flow_control import BoundedDispatcher, FlowControl
 from blackcap.schemas.message import Message
 from blackcap.utils.json_encoders import UUIDEncoder
 
+# Errors after which a connection is considered dead
+CONNECTION_ERRORS = (OSError, NATSError)
+
 
 class NATSMessenger(BaseMessenger):
     """NATS implementation of Messenger."""
@@ -26,15 +36,121 @@ class NATSMessenger(BaseMessenger):
         """
         self.config = config
 
+        # A single publishing connection is shared by the whole process
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._client: Optional[NATSClient] = None
+        self._last_used = 0.0
+
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._forget_client)
+        atexit.register(self.close)
+
+    def _new_client(
+        self: "NATSMessenger", socket_timeout: Optional[float]
+    ) -> NATSClient:
+        """Open a new NATS connection, retrying with exponential backoff.
+
+        Args:
+            socket_timeout (Optional[float]): Socket timeout of the connection
+
+        Returns:
+            NATSClient: Connected client
+        """
+
+        def connect() -> NATSClient:
+            client = NATSClient(
+                url=self.config.NATS_ENDPOINT,
+                name=self.config.FLASK_APP,
+                socket_timeout=socket_timeout,
+                socket_keepalive=True,
+            )
+            client.connect()
+            return client
+
+        return on_exception(
+            expo, CONNECTION_ERRORS, max_time=self.config.NATS_RECONNECT_MAX_TIME
+        )(connect)()
+
+    def _forget_client(self: "NATSMessenger") -> None:
+        """Drop the connection inherited from a parent process without closing it."""
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._client = None
+
+    def _discard_client(self: "NATSMessenger") -> None:
+        """Close and drop the current connection, ignoring errors."""
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                client.close()
+            except CONNECTION_ERRORS:
+                pass
+
+    def is_healthy(self: "NATSMessenger") -> bool:
+        """Check the publishing connection with a PING/PONG round trip.
+
+        Returns:
+            bool: True if the server answered
+        """
+        with self._lock:
+            if self._client is None:
+                return False
+            try:
+                self._client.ping()
+            except CONNECTION_ERRORS as e:
+                logger.warning(f"NATSMessenger health check failed: {e}")
+                return False
+            self._last_used = time.monotonic()
+            return True
+
     @property
     def client(self: "NATSMessenger") -> NATSClient:
-        """NATS client object."""
-        client = NATSClient(url=self.config.NATS_ENDPOINT, name=self.config.FLASK_APP)
-        client.connect()
-        return client
+        """Managed NATS client, reconnected when it is found dead."""
+        if self._pid != os.getpid():
+            self._forget_client()
+        with self._lock:
+            idle_for = time.monotonic() - self._last_used
+            if self._client is not None and idle_for > self.config.NATS_PING_INTERVAL:
+                # Idle connections may have been dropped by the server
+                if not self.is_healthy():
+                    self._discard_client()
+            if self._client is None:
+                self._client = self._new_client(self.config.NATS_SOCKET_TIMEOUT)
+                self._last_used = time.monotonic()
+            return self._client
+
+    def close(self: "NATSMessenger") -> None:
+        """Flush pending msgs and close the publishing connection."""
+        with self._lock:
+            if self._client is None or self._pid != os.getpid():
+                return
+            try:
+                # The server answers a PING only after processing earlier msgs
+                self._client.ping()
+            except CONNECTION_ERRORS as e:
+                logger.warning(f"NATSMessenger flush on close failed: {e}")
+            self._discard_client()
+
+    def _publish_payload(self: "NATSMessenger", payload: bytes, topic_id: str) -> None:
+        """Publish a payload, reconnecting once if the connection is dead.
+
+        Args:
+            payload (bytes): Serialized msg
+            topic_id (str): Id of the topic
+        """
+        with self._lock:
+            client = self.client
+            try:
+                client.publish(subject=topic_id, payload=payload)
+            except CONNECTION_ERRORS as e:
+                logger.warning(f"NATSMessenger reconnecting after error: {e}")
+                self._discard_client()
+                self.client.publish(subject=topic_id, payload=payload)
+            self._last_used = time.monotonic()
 
     def publish(self: "NATSMessenger", msg: Dict, topic_id: str) -> str:
-        """Publish msg on the GCP Pub/Sub queue.
+        """Publish msg on the NATS queue.
 
         Args:
             msg (Dict): Messsag to publish
@@ -45,34 +161,111 @@ class NATSMessenger(BaseMessenger):
         """
         # Msg must be a bytestring
         msg = json.dumps(msg, cls=UUIDEncoder).encode("utf-8")
-        self.client.publish(subject=topic_id, payload=msg)
-        self.client.close()
+        self._publish_payload(msg, topic_id)
         return "ok"
 
+    def publish_many(
+        self: "NATSMessenger",
+        msgs: List[Dict],
+        topic_id: str,
+        timeout: Optional[float] = None,
+    ) -> List[PublishResult]:
+        """Publish a batch of msgs over the managed NATS connection.
+
+        Args:
+            msgs (List[Dict]): Messages to publish
+            topic_id (str): Id of the topic
+            timeout (Optional[float]): Unused, NATS publishes are fire and forget.
+
+        Returns:
+            List[PublishResult]: Result of each msg, in the order of msgs
+        """
+        results = []
+        with self._lock:
+            for msg in msgs:
+                try:
+                    payload = json.dumps(msg, cls=UUIDEncoder).encode("utf-8")
+                    self._publish_payload(payload, topic_id)
+                    results.append(PublishResult(msg=msg, msg_id="ok"))
+                except Exception as e:
+                    results.append(PublishResult(msg=msg, error=e))
+        return results
+
     def subscribe(
         self: "NATSMessenger",
         callback: Callable,
         sub_id: str,
         timeout: Optional[float] = None,
+        flow_control: Optional[FlowControl] = None,
     ) -> None:
         """Subscribe to a topic.
 
+        The subscription uses its own connection since waiting for msgs blocks
+        it. The connection is re-established and the subscription recreated
+        whenever the connection drops.
+
+        Callbacks run on a pool of flow_control.workers threads. Reading from
+        the connection pauses while the outstanding msgs or bytes are at the
+        flow control limits, leaving further msgs buffered by the server.
+
         Args:
             callback (Callable): Callback to invoke when a msg is received
             sub_id (str): Id of the topic.
             timeout (Union[float, None]): Time to wait for msgs. Defaults to None. # noqa: E501
+            flow_control (Optional[FlowControl]): Subscription limits. Defaults to config.
         """
+        if flow_control is None:
+            flow_control = FlowControl.from_config(self.config)
+        dispatcher = BoundedDispatcher(callback, flow_control)
         try:
-            client = self.client
-            sub = client.subscribe(subject=sub_id, callback=callback)
-            logger.info(f"Subscription created: {sub}")
-            client.wait(count=None)
-            client.close()
-        except Exception as e:
-            logger.error(
-                f"NATSMessenger subscribe error while pulling messages. Error: {e}"
-            )
-            client.close()
+            self._subscribe(dispatcher, sub_id, timeout)
+        finally:
+            dispatcher.shutdown(wait=True)
+
+    def _subscribe(
+        self: "NATSMessenger",
+        dispatcher: BoundedDispatcher,
+        sub_id: str,
+        timeout: Optional[float],
+    ) -> None:
+        """Pull msgs from a topic and hand them to the dispatcher.
+
+        Args:
+            dispatcher (BoundedDispatcher): Dispatcher running the callback
+            sub_id (str): Id of the topic.
+            timeout (Optional[float]): Time to wait for msgs.
+        """
+
+        def dispatch(msg: NATSMessage) -> None:
+            dispatcher.dispatch(msg, len(msg.payload))
+
+        while True:
+            client = None
+            try:
+                client = self._new_client(timeout)
+                sub = client.subscribe(subject=sub_id, callback=dispatch)
+                logger.info(f"Subscription created: {sub}")
+                client.wait(count=None)
+            except CONNECTION_ERRORS as e:
+                if timeout is not None:
+                    logger.error(
+                        f"NATSMessenger subscribe error while pulling messages. Error: {e}"
+                    )
+                    return
+                logger.warning(
+                    f"NATSMessenger subscription dropped, resubscribing: {e}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"NATSMessenger subscribe error while pulling messages. Error: {e}"
+                )
+                return
+            finally:
+                if client is not None:
+                    try:
+                        client.close()
+                    except CONNECTION_ERRORS:
+                        pass
 
     def parse_messenger_msg(
         self: "NATSMessenger", messenger_msg: NATSMessage
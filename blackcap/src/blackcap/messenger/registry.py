@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from blackcap.messenger.async_base import AsyncBaseMessenger
 from blackcap.messenger.base import BaseMessenger
 
 
@@ -30,3 +31,32 @@ class MessengerRegistry:
             Optional[BaseMessenger]: Returns the messenger if found else None
         """
         return self.messengers.get(messenger)
+
+
+class AsyncMessengerRegistry:
+    """asyncio messenger registry."""
+
+    messengers = {}
+
+    def add_messenger(
+        self: "AsyncMessengerRegistry", messenger: AsyncBaseMessenger
+    ) -> None:
+        """Add custom asyncio messengers to registry.
+
+        Args:
+            messenger (AsyncBaseMessenger): Custom messenger implementation
+        """
+        self.messengers[messenger.CONFIG_KEY_VAL] = messenger
+
+    def get_messenger(
+        self: "AsyncMessengerRegistry", messenger: str
+    ) -> Optional[AsyncBaseMessenger]:
+        """Get asyncio messenger.
+
+        Args:
+            messenger (str): Messenger name
+
+        Returns:
+            Optional[AsyncBaseMessenger]: Returns the messenger if found else None
+        """
+        return self.messengers.get(messenger)
@@ -1,6 +1,6 @@
 """Job DBModel."""
 
-from sqlalchemy import Column, Integer, JSON, String
+from sqlalchemy import Column, Index, Integer, JSON, String
 
 from blackcap.models.meta.mixins import (
     DBModel,
@@ -14,6 +14,13 @@ class JobDB(DBModel, TimestampMixin, SurrogatePKUUID):
     """Job table."""
 
     __tablename__ = "job"
+    __table_args__ = (
+        # Keyset pagination of the records of a user
+        Index(
+            "ix_job_protagonist_id_created_at_id", "protagonist_id", "created_at", "id"
+        ),
+        {"extend_existing": True},
+    )
     serialize_rules = ("-protagonist.jobs",)
     name = Column(String, nullable=False)
     description = Column(String)
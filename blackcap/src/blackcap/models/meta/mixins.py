@@ -1,20 +1,45 @@
 """Mixins for database models."""
 
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import uuid
 
-from sqlalchemy import Column, DateTime, delete, Integer
+from sqlalchemy import (
+    case,
+    Column,
+    DateTime,
+    delete,
+    Integer,
+    literal,
+    select,
+    update,
+)
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm.session import Session
 from sqlalchemy_serializer import SerializerMixin
 
+from blackcap.db import QUERY_CHUNK_SIZE
 from blackcap.models.meta.helpers import GUID
 
 # declarative base class
 Base = declarative_base()
 
 
+def supports_returning(session: Session) -> bool:
+    """Check if the database of a session supports UPDATE/DELETE RETURNING.
+
+    Args:
+        session: (Session): database session to use
+
+    Returns:
+        bool: True if RETURNING is supported
+    """
+    dialect = session.get_bind().dialect
+    return getattr(
+        dialect, "update_returning", getattr(dialect, "full_returning", False)
+    )
+
+
 class TimestampMixin(object):
     """Mixin that adds timestamp."""
 
@@ -91,23 +116,68 @@ class CRUDMixin(object):
         return commit and self.save(session) or self
 
     @classmethod
-    def bulk_update(cls: Any, obj_list: List[Any], session: Session) -> Any:
-        """Bulk update records and save them to the database.
+    def bulk_update(
+        cls: Any,
+        values_list: List[Dict[str, Any]],
+        session: Session,
+        *criteria: Any,
+        commit: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Bulk update records with a single UPDATE statement per chunk of ids.
+
+        Each record gets its own values through a CASE expression on its id.
+        Objects already loaded in the session are not synchronised.
 
         Args:
-            obj_list (List[Any]): List of instances of self
+            values_list (List[Dict[str, Any]]): Column values to set, keyed by column name, with the record "id" # noqa: E501
             session: (Session): database session to use
+            *criteria (Any): Extra where clauses, records not matching are left untouched # noqa: E501
+            commit (bool): Flag to control commit behaviour. Defaults to True.
 
         Returns:
-            Any: List of updated instances self
+            List[Dict[str, Any]]: Column values of the updated records
         """
-        instance_list: List[Any] = []
-        for item in obj_list:
-            instance_list.append(cls(**item))
-
-        session.add_all(instance_list)
-        session.commit()
-        return instance_list
+        updated_row_list: List[Dict[str, Any]] = []
+        for start in range(0, len(values_list), QUERY_CHUNK_SIZE):
+            chunk = values_list[start : start + QUERY_CHUNK_SIZE]
+            id_list = [values["id"] for values in chunk]
+            column_names = {key for values in chunk for key in values} - {"id"}
+            if len(column_names) == 0:
+                # Nothing to set, only report the matching records
+                updated_row_list += cls._select_rows(session, id_list, *criteria)
+                continue
+            new_values = {}
+            for name in column_names:
+                column = cls.__table__.c[name]
+                new_values[name] = case(
+                    *[
+                        (
+                            literal(values["id"], cls.id.type),
+                            literal(values[name], column.type),
+                        )
+                        for values in chunk
+                        if name in values
+                    ],
+                    value=cls.id,
+                    else_=column,
+                )
+            stmt = (
+                update(cls)
+                .values(new_values)
+                .execution_options(synchronize_session=False)
+            )
+            if supports_returning(session):
+                stmt = stmt.where(cls.id.in_(id_list), *criteria)
+                result = session.execute(stmt.returning(*cls.__table__.c))
+                updated_row_list += [dict(row) for row in result.mappings()]
+            else:
+                # Criteria may not match anymore once updated, fix the ids first
+                matched_id_list = cls._select_ids(session, id_list, *criteria)
+                session.execute(stmt.where(cls.id.in_(matched_id_list)))
+                updated_row_list += cls._select_rows(session, matched_id_list)
+        if commit:
+            session.commit()
+        return updated_row_list
 
     def delete(
         self: "CRUDMixin", session: Session, commit: bool = True
@@ -124,19 +194,81 @@ class CRUDMixin(object):
         session.delete(self)
         return commit and session.commit()
 
-    def bulk_delete(cls: Any, obj_list: List[Any], session: Session) -> Any:
-        """Bulk delete records from the database.
+    @classmethod
+    def bulk_delete(
+        cls: Any,
+        id_list: List[Any],
+        session: Session,
+        *criteria: Any,
+        commit: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Bulk delete records with a single DELETE statement per chunk of ids.
+
+        Objects already loaded in the session are not synchronised.
 
         Args:
-            obj_list (List[Any]): List of self
+            id_list (List[Any]): Ids of the records to delete
             session: (Session): database session to use
+            *criteria (Any): Extra where clauses, records not matching are left untouched # noqa: E501
+            commit (bool): Flag to control commit behaviour. Defaults to True.
 
         Returns:
-            Any: True if scuccess
+            List[Dict[str, Any]]: Column values of the deleted records
         """
-        session.execute(delete(cls).where(cls.id._in([obj.id for obj in obj_list])))
-        session.commit()
-        return True
+        deleted_row_list: List[Dict[str, Any]] = []
+        for start in range(0, len(id_list), QUERY_CHUNK_SIZE):
+            chunk = id_list[start : start + QUERY_CHUNK_SIZE]
+            stmt = (
+                delete(cls)
+                .where(cls.id.in_(chunk), *criteria)
+                .execution_options(synchronize_session=False)
+            )
+            if supports_returning(session):
+                result = session.execute(stmt.returning(*cls.__table__.c))
+                deleted_row_list += [dict(row) for row in result.mappings()]
+            else:
+                row_list = cls._select_rows(session, chunk, *criteria)
+                session.execute(
+                    stmt.where(cls.id.in_([row["id"] for row in row_list]))
+                )
+                deleted_row_list += row_list
+        if commit:
+            session.commit()
+        return deleted_row_list
+
+    @classmethod
+    def _select_ids(
+        cls: Any, session: Session, id_list: List[Any], *criteria: Any
+    ) -> List[Any]:
+        """Select the ids of the records matching the ids and criteria.
+
+        Args:
+            session: (Session): database session to use
+            id_list (List[Any]): Ids of the records
+            *criteria (Any): Extra where clauses
+
+        Returns:
+            List[Any]: Ids of the matching records
+        """
+        stmt = select(cls.id).where(cls.id.in_(id_list), *criteria)
+        return session.execute(stmt).scalars().all()
+
+    @classmethod
+    def _select_rows(
+        cls: Any, session: Session, id_list: List[Any], *criteria: Any
+    ) -> List[Dict[str, Any]]:
+        """Select the column values of the records matching the ids and criteria.
+
+        Args:
+            session: (Session): database session to use
+            id_list (List[Any]): Ids of the records
+            *criteria (Any): Extra where clauses
+
+        Returns:
+            List[Dict[str, Any]]: Column values of the matching records
+        """
+        stmt = select(*cls.__table__.c).where(cls.id.in_(id_list), *criteria)
+        return [dict(row) for row in session.execute(stmt).mappings()]
 
 
 class DBModel(CRUDMixin, SerializerMixin, Base):
@@ -1,6 +1,6 @@
 """Schedule DBModel."""
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String
 
 from blackcap.models.meta.mixins import (
     DBModel,
@@ -14,6 +14,16 @@ class ScheduleDB(DBModel, TimestampMixin, SurrogatePKUUID):
     """Schedule table."""
 
     __tablename__ = "schedule"
+    __table_args__ = (
+        # Keyset pagination of the records of a user
+        Index(
+            "ix_schedule_protagonist_id_created_at_id",
+            "protagonist_id",
+            "created_at",
+            "id",
+        ),
+        {"extend_existing": True},
+    )
     job_id = reference_col("job")
     assigned_cluster_id = reference_col("cluster")
     messenger = Column(String, nullable=False, default="GCP")
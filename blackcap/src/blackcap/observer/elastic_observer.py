@@ -1,24 +1,100 @@
-"""Random Scheduler implementation of Scheduler."""
+"""Elastic Observer implementation of Observer."""
 
 
-from typing import List
+from typing import Dict, List
 
+from logzero import logger
+import requests
+
+from blackcap.configs import config_registry
 from blackcap.observer.base import BaseObserver
 from blackcap.schemas.metrics import Metrics
 
+config = config_registry.get_config()
+
 
 class ElasticObserver(BaseObserver):
-    """Elastic observer to fetch metrics from Elastic stack."""
+    """Elastic observer to fetch metrics from Elastic stack.
+
+    Clusters report their load as documents of ELASTIC_METRICS_INDEX with
+    the fields of the Metrics schema and an @timestamp. completed_jobs of a
+    document counts the jobs finished since the previous report of the cluster.
+    """
 
     CONFIG_KEY_VAL = "ELASTIC"
 
-    def get_metrics(self: "BaseObserver", range: str) -> List[Metrics]:
+    def build_query(self: "ElasticObserver", range: str) -> Dict:
+        """Build the search request of the metrics.
+
+        Args:
+            range (str): time range
+
+        Returns:
+            Dict: Elasticsearch search request
+        """
+        return {
+            "size": 0,
+            "query": {"range": {"@timestamp": {"gte": f"now-{range}"}}},
+            "aggs": {
+                "clusters": {
+                    "terms": {"field": "cluster_id", "size": 1000},
+                    "aggs": {
+                        "latest": {
+                            "top_hits": {
+                                "size": 1,
+                                "sort": [{"@timestamp": {"order": "desc"}}],
+                            }
+                        },
+                        "completed_jobs": {"sum": {"field": "completed_jobs"}},
+                    },
+                }
+            },
+        }
+
+    def parse_response(self: "ElasticObserver", body: Dict) -> List[Metrics]:
+        """Parse the search response of the metrics.
+
+        Args:
+            body (Dict): Elasticsearch search response
+
+        Returns:
+            List[Metrics]: List of metrics from each cluster
+        """
+        metrics_list = []
+        for bucket in body.get("aggregations", {}).get("clusters", {}).get("buckets", []):  # noqa: B950
+            hits = bucket["latest"]["hits"]["hits"]
+            latest = hits[0]["_source"] if len(hits) > 0 else {}
+            metrics_list.append(
+                Metrics(
+                    cluster_id=bucket["key"],
+                    queued_jobs=latest.get("queued_jobs", 0),
+                    running_jobs=latest.get("running_jobs", 0),
+                    total_cores=latest.get("total_cores", 0),
+                    free_cores=latest.get("free_cores", 0),
+                    completed_jobs=int(bucket["completed_jobs"]["value"] or 0),
+                    timestamp=latest.get("@timestamp"),
+                )
+            )
+        return metrics_list
+
+    def get_metrics(self: "ElasticObserver", range: str) -> List[Metrics]:
         """Get cluster metrics.
 
         Args:
             range (str): time range
 
         Returns:
-            List[Metrics]: List of metrics from each cluster # noqa: DAR202
+            List[Metrics]: List of metrics from each cluster
         """
-        return []
+        if config.ELASTIC_URL == "":
+            return []
+        url = f"{config.ELASTIC_URL.rstrip('/')}/{config.ELASTIC_METRICS_INDEX}/_search"  # noqa: B950
+        try:
+            response = requests.post(
+                url, json=self.build_query(range), timeout=config.ELASTIC_TIMEOUT
+            )
+            response.raise_for_status()
+            return self.parse_response(response.json())
+        except Exception as e:
+            logger.error(f"Unable to fetch metrics: {e}")
+            return []
@@ -6,11 +6,15 @@ from flask import make_response, request, Response
 from pydantic.error_wrappers import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
-from blackcap.blocs.job import get_job
+from blackcap.blocs.job import get_job_page, iter_jobs
+from blackcap.configs import config_registry
 from blackcap.routes.job import job_bp
 from blackcap.schemas.api.job.get import JobGetQueryParams, JobGetResponse
 from blackcap.schemas.user import User
 from blackcap.utils.auth import check_authentication
+from blackcap.utils.streaming import make_stream_response
+
+config = config_registry.get_config()
 
 
 @job_bp.get("/")
@@ -38,9 +42,22 @@ def get(user: User) -> Response:
         )
         return make_response(response_body.json(), HTTPStatus.INTERNAL_SERVER_ERROR)
 
-    # Get jobs from the DB
+    # Paginate with the default page size, capped to the max page size
+    query_params.limit = min(
+        query_params.limit or config.API_PAGE_SIZE, config.API_MAX_PAGE_SIZE
+    )
+
+    # Get jobs from the DB, every result is streamed if asked for
     try:
-        job_list = get_job(query_params, user)
+        if query_params.stream:
+            job_iter = iter_jobs(query_params, user)
+        else:
+            job_list, next_cursor = get_job_page(query_params, user)
+    except ValidationError as e:
+        response_body = JobGetResponse(
+            msg="query validation error", errors={"main": e.errors()}
+        )
+        return make_response(response_body.json(), HTTPStatus.BAD_REQUEST)
     except SQLAlchemyError:
         response_body = JobGetResponse(
             msg="internal databse error", errors={"main": ["unknown internal error"]}
@@ -52,8 +69,20 @@ def get(user: User) -> Response:
         )
         return make_response(response_body.json(), HTTPStatus.INTERNAL_SERVER_ERROR)
 
+    # Stream as JSON or NDJSON depending on the Accept header
+    if query_params.stream:
+        return make_stream_response(
+            request,
+            "job successfully retrieved",
+            "job_list",
+            job_iter,
+            config.DB_YIELD_PER,
+        )
+
     # return fetched jobs in response
     response_body = JobGetResponse(
-        msg="job successfully retrieved", items={"job_list": job_list}
+        msg="job successfully retrieved",
+        items={"job_list": job_list},
+        next_cursor=next_cursor,
     )
     return make_response(response_body.json(), HTTPStatus.OK)
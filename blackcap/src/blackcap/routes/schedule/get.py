@@ -6,7 +6,8 @@ from flask import make_response, request, Response
 from pydantic.error_wrappers import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
-from blackcap.blocs.schedule import get_schedule
+from blackcap.blocs.schedule import get_schedule_page, iter_schedules
+from blackcap.configs import config_registry
 from blackcap.routes.schedule import schedule_bp
 from blackcap.schemas.api.schedule.get import (
     ScheduleGetQueryParams,
@@ -14,6 +15,9 @@ from blackcap.schemas.api.schedule.get import (
 )
 from blackcap.schemas.user import User
 from blackcap.utils.auth import check_authentication
+from blackcap.utils.streaming import make_stream_response
+
+config = config_registry.get_config()
 
 
 @schedule_bp.get("/")
@@ -29,7 +33,7 @@ def get(user: User) -> Response:
     """
     # Parse query params from request
     try:
-        query_params = ScheduleGetQueryParams.parse_raw(request.query_string)
+        query_params = ScheduleGetQueryParams.parse_obj(request.args)
     except ValidationError as e:
         response_body = ScheduleGetResponse(
             msg="query validation error", errors={"main": e.errors()}
@@ -41,9 +45,22 @@ def get(user: User) -> Response:
         )
         return make_response(response_body.json(), HTTPStatus.INTERNAL_SERVER_ERROR)
 
-    # Get s from the DB
+    # Paginate with the default page size, capped to the max page size
+    query_params.limit = min(
+        query_params.limit or config.API_PAGE_SIZE, config.API_MAX_PAGE_SIZE
+    )
+
+    # Get s from the DB, every result is streamed if asked for
     try:
-        schedule_list = get_schedule(query_params, user)
+        if query_params.stream:
+            schedule_iter = iter_schedules(query_params, user)
+        else:
+            schedule_list, next_cursor = get_schedule_page(query_params, user)
+    except ValidationError as e:
+        response_body = ScheduleGetResponse(
+            msg="query validation error", errors={"main": e.errors()}
+        )
+        return make_response(response_body.json(), HTTPStatus.BAD_REQUEST)
     except SQLAlchemyError:
         response_body = ScheduleGetResponse(
             msg="internal databse error", errors={"main": ["unknown internal error"]}
@@ -55,8 +72,20 @@ def get(user: User) -> Response:
         )
         return make_response(response_body.json(), HTTPStatus.INTERNAL_SERVER_ERROR)
 
+    # Stream as JSON or NDJSON depending on the Accept header
+    if query_params.stream:
+        return make_stream_response(
+            request,
+            " successfully retrieved",
+            "schedule_list",
+            schedule_iter,
+            config.DB_YIELD_PER,
+        )
+
     # return fetched s in response
     response_body = ScheduleGetResponse(
-        msg=" successfully retrieved", items={"schedule_list": schedule_list}
+        msg=" successfully retrieved",
+        items={"schedule_list": schedule_list},
+        next_cursor=next_cursor,
     )
     return make_response(response_body.json(), HTTPStatus.OK)
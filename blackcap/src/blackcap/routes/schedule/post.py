@@ -1,15 +1,18 @@
 """Blackcap schedule POST route."""
 
 from http import HTTPStatus
-
+import json
 
 from flask import make_response, request, Response
-from pydantic import ValidationError
-from sqlalchemy.exc import SQLAlchemyError
+from pydantic import parse_obj_as, ValidationError
 
-from blackcap.blocs.schedule import create_schedule
+from blackcap.blocs.schedule import generate_create_schedule_flow
+from blackcap.flow import Executor, FlowStatus
 from blackcap.routes.schedule import schedule_bp
-from blackcap.schemas.api.schedule.post import ScheduleCreate, SchedulePOSTResponse
+from blackcap.schemas.api.schedule.post import (
+    SchedulePOSTRequest,
+    SchedulePOSTResponse,
+)
 from blackcap.schemas.user import User
 from blackcap.utils.auth import check_authentication
 
@@ -27,7 +30,9 @@ def post(user: User) -> Response:
     """
     # Parse json from request
     try:
-        schedule_create_request_list = ScheduleCreate.parse_obj(request.json)
+        schedule_create_request_list = parse_obj_as(
+            SchedulePOSTRequest, json.loads(request.data)
+        ).schedule_list
     except ValidationError as e:
         response_body = SchedulePOSTResponse(
             msg="json validation failed", errors={"main": e.errors()}
@@ -40,21 +45,29 @@ def post(user: User) -> Response:
         return make_response(response_body.json(), HTTPStatus.INTERNAL_SERVER_ERROR)
 
     # ceate schedule in DB and publish msg
-    try:
-        schedule_list = create_schedule(schedule_create_request_list, user)
-    except SQLAlchemyError:
-        response_body = SchedulePOSTResponse(
-            msg="internal databse error", errors={"main": ["unknown internal error"]}
-        )
-        return make_response(response_body.json(), HTTPStatus.INTERNAL_SERVER_ERROR)
-    except Exception:
+    create_schedule_flow = generate_create_schedule_flow(
+        schedule_create_request_list, user
+    )
+    executed_flow = Executor(create_schedule_flow, {}).run()
+    if executed_flow.status != FlowStatus.PASSED:
         response_body = SchedulePOSTResponse(
             msg="unknown error", errors={"main": ["unknown internal error"]}
         )
         return make_response(response_body.json(), HTTPStatus.INTERNAL_SERVER_ERROR)
 
-    # return created schedule in response
+    # return published schedules in response, and the ids of unpublished ones
+    schedule_list, failed_schedule_list = [
+        prop.data for prop in executed_flow.forward_outputs[-1]
+    ]
+    errors = {}
+    if failed_schedule_list:
+        errors["publish"] = [
+            f"schedule {schedule.schedule_id} could not be published"
+            for schedule in failed_schedule_list
+        ]
     response_body = SchedulePOSTResponse(
-        msg="schedule successfully created", items={"schedule_list": schedule_list}
+        msg="schedule successfully created",
+        items={"schedule_list": schedule_list},
+        errors=errors,
     )
     return make_response(response_body.json(), HTTPStatus.OK)
@@ -1,7 +1,11 @@
 """Scheduler to schedule jobs using metrcis from clusters."""
 
+from blackcap.scheduler.bin_packing_scheduler import BinPackingScheduler
+from blackcap.scheduler.least_loaded_scheduler import LeastLoadedScheduler
 from blackcap.scheduler.random_scheduler import RandomScheduler
 from blackcap.scheduler.registry import SchedulerRegistry
 
 scheduler_registry = SchedulerRegistry()
 scheduler_registry.add_scheduler(RandomScheduler())
+scheduler_registry.add_scheduler(LeastLoadedScheduler())
+scheduler_registry.add_scheduler(BinPackingScheduler())
@@ -1,8 +1,18 @@
 """Base Scheduler class."""
 
 from abc import ABC, abstractclassmethod
+from typing import Dict, List, Optional
 
+from logzero import logger
+from pydantic.types import UUID4
+from sqlalchemy.sql.expression import select
+
+from blackcap.db import DBSession, QUERY_CHUNK_SIZE
+from blackcap.models.job import JobDB
+from blackcap.scheduler.capabilities import Capabilities, UnsatisfiableJobError
+from blackcap.scheduler.inventory import cluster_inventory
 from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
 
 
 class BaseScheduler(ABC):
@@ -14,6 +24,104 @@ class BaseScheduler(ABC):
     # Change this value in custom auther implementations.
     CONFIG_KEY_VAL = "RANDOM"
 
+    def get_cluster_caps_reqs(
+        self: "BaseScheduler", job_ids: List[UUID4]
+    ) -> Dict[UUID4, str]:
+        """Fetch the cluster requirements of jobs.
+
+        Args:
+            job_ids (List[UUID4]): IDs of the jobs
+
+        Raises:
+            Exception: error
+
+        Returns:
+            Dict[UUID4, str]: Cluster requirements by job ID, for jobs having any
+        """
+        unique_job_ids = list(set(job_ids))
+        cluster_caps_reqs: Dict[UUID4, str] = {}
+        with DBSession() as session:
+            try:
+                for start in range(0, len(unique_job_ids), QUERY_CHUNK_SIZE):
+                    stmt = select(JobDB.id, JobDB.cluster_caps_req).where(
+                        JobDB.id.in_(unique_job_ids[start : start + QUERY_CHUNK_SIZE]),
+                        JobDB.cluster_caps_req.is_not(None),
+                    )
+                    cluster_caps_reqs.update(session.execute(stmt).all())
+            except Exception as e:
+                logger.error(f"Unable to fetch cluster requirements of jobs: {e}")
+                raise e
+        return cluster_caps_reqs
+
+    def match_clusters(
+        self: "BaseScheduler", schedule_create_list: List[ScheduleCreate]
+    ) -> List[List[Cluster]]:
+        """Find the clusters satisfying the requirements of each schedule request.
+
+        Requirements are matched against the capability index of the cluster
+        inventory, once per distinct requirement of the batch.
+
+        Args:
+            schedule_create_list (List[ScheduleCreate]): Schedule create requests
+
+        Raises:
+            Exception: No cluster available
+            UnsatisfiableJobError: No cluster satisfies the requirements of a job
+
+        Returns:
+            List[List[Cluster]]: Candidate clusters of each request, in order
+        """
+        index = cluster_inventory.get_index()
+
+        # Raise error if no cluster available
+        if len(index.clusters) == 0:
+            logger.error("No cluster available")
+            raise Exception("cluster_list: List[ClusterDB]")
+
+        cluster_caps_reqs = self.get_cluster_caps_reqs(
+            [schedule_create.job_id for schedule_create in schedule_create_list]
+        )
+        matches: Dict[Optional[str], List[Cluster]] = {}
+        candidates_list = []
+        for schedule_create in schedule_create_list:
+            cluster_caps_req = cluster_caps_reqs.get(schedule_create.job_id)
+            if cluster_caps_req not in matches:
+                try:
+                    requirements = Capabilities.parse(cluster_caps_req)
+                except ValueError as e:
+                    raise UnsatisfiableJobError(
+                        f"Invalid requirements of job {schedule_create.job_id}: {e}"
+                    ) from e
+                matches[cluster_caps_req] = index.match(requirements)
+            if len(matches[cluster_caps_req]) == 0:
+                logger.error(
+                    f"No cluster satisfies job {schedule_create.job_id}: "
+                    f"{cluster_caps_req}"
+                )
+                raise UnsatisfiableJobError(
+                    f"No cluster satisfies the requirements of job "
+                    f"{schedule_create.job_id}: {cluster_caps_req}"
+                )
+            candidates_list.append(matches[cluster_caps_req])
+        return candidates_list
+
+    def assign(
+        self: "BaseScheduler", schedule_create: ScheduleCreate, cluster: Cluster
+    ) -> ScheduleCreate:
+        """Assign a cluster to the schedule request.
+
+        Args:
+            schedule_create (ScheduleCreate): Schedule create request
+            cluster (Cluster): Selected cluster
+
+        Returns:
+            ScheduleCreate: Instance of Schedule Create
+        """
+        schedule_create.assigned_cluster_id = cluster.cluster_id
+        schedule_create.messenger = cluster.messenger
+        schedule_create.messenger_queue = cluster.messenger_queue
+        return schedule_create
+
     @abstractclassmethod
     def schedule(
         self: "BaseScheduler", schedule_create: ScheduleCreate
@@ -27,3 +135,22 @@ class BaseScheduler(ABC):
             ScheduleCreate: Instance of Schedule
         """
         return ScheduleCreate()
+
+    def schedule_batch(
+        self: "BaseScheduler", schedule_create_list: List[ScheduleCreate]
+    ) -> List[ScheduleCreate]:
+        """Create schedules from a batch of schedule requests.
+
+        The whole batch is assigned at once, so implementations can share
+        lookups and balance the requests against each other. Defaults to
+        scheduling each request independently.
+
+        Args:
+            schedule_create_list (List[ScheduleCreate]): Schedule create requests
+
+        Returns:
+            List[ScheduleCreate]: Instances of Schedule Create, in order
+        """
+        return [
+            self.schedule(schedule_create) for schedule_create in schedule_create_list
+        ]
@@ -0,0 +1,110 @@
+"""Bin packing Scheduler implementation of Scheduler."""
+
+import heapq
+import random
+from typing import Dict, FrozenSet, List, Tuple
+
+from pydantic.types import UUID4
+
+from blackcap.scheduler.least_loaded_scheduler import LeastLoadedScheduler
+from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
+from blackcap.schemas.metrics import Metrics
+
+
+class BinPackingScheduler(LeastLoadedScheduler):
+    """Bin packing scheduler spread batches over the cluster capacities.
+
+    The capacity of a cluster is its free cores plus the jobs it completed
+    in the observed time range. Each job goes to the candidate cluster with
+    the lowest expected backlog per unit of capacity once the job is added,
+    so a batch fills the clusters in proportion to their capacity. Requests
+    sharing the same candidate clusters are assigned together from a heap,
+    the most constrained requests first, which costs O(n log k) for n
+    requests over k clusters.
+    """
+
+    CONFIG_KEY_VAL = "BIN_PACKING"
+
+    @staticmethod
+    def cost(metrics: Metrics, planned_jobs: int = 0) -> float:
+        """Cost of adding one more job to a cluster, lower is better.
+
+        Args:
+            metrics (Metrics): Metrics of the cluster
+            planned_jobs (int): Jobs assigned to the cluster but not yet observed. Defaults to 0. # noqa: B950
+
+        Returns:
+            float: Expected backlog per unit of capacity
+        """
+        capacity = max(metrics.free_cores + metrics.completed_jobs, 1)
+        return (metrics.queued_jobs + planned_jobs + 1) / capacity
+
+    def schedule_batch(
+        self: "BinPackingScheduler", schedule_create_list: List[ScheduleCreate]
+    ) -> List[ScheduleCreate]:
+        """Create schedules from a batch of schedule requests.
+
+        Args:
+            schedule_create_list (List[ScheduleCreate]): Schedule create requests
+
+        Raises:
+            Exception: No cluster available
+            UnsatisfiableJobError: No cluster satisfies the requirements of a job
+
+        Returns:
+            List[ScheduleCreate]: Instances of Schedule Create, in order
+        """
+        if len(schedule_create_list) == 0:
+            return []
+        candidates_list = self.match_clusters(schedule_create_list)
+        metrics = self.get_metrics()
+
+        # Group the requests by candidate clusters. Requests with the same
+        # requirements share the same candidates list object.
+        group_keys: Dict[int, FrozenSet[UUID4]] = {}
+        groups: Dict[FrozenSet[UUID4], Tuple[List[Cluster], List[int]]] = {}
+        for position, candidates in enumerate(candidates_list):
+            key = group_keys.get(id(candidates))
+            if key is None:
+                key = frozenset(cluster.cluster_id for cluster in candidates)
+                group_keys[id(candidates)] = key
+            groups.setdefault(key, (candidates, []))[1].append(position)
+
+        planned_jobs: Dict[UUID4, int] = {}
+        for candidates, positions in sorted(
+            groups.values(), key=lambda group: len(group[0])
+        ):
+            cluster_metrics = [
+                metrics.get(cluster.cluster_id)
+                or Metrics(cluster_id=cluster.cluster_id)
+                for cluster in candidates
+            ]
+            # Ties are broken randomly so that processes do not all pick the same cluster # noqa: B950
+            heap = [
+                (
+                    self.cost(
+                        cluster_metrics[index],
+                        planned_jobs.get(cluster.cluster_id, 0),
+                    ),
+                    random.random(),  # noqa: S311
+                    index,
+                )
+                for index, cluster in enumerate(candidates)
+            ]
+            heapq.heapify(heap)
+            for position in positions:
+                _, _, index = heapq.heappop(heap)
+                cluster = candidates[index]
+                planned = planned_jobs.get(cluster.cluster_id, 0) + 1
+                planned_jobs[cluster.cluster_id] = planned
+                self.assign(schedule_create_list[position], cluster)
+                heapq.heappush(
+                    heap,
+                    (
+                        self.cost(cluster_metrics[index], planned),
+                        random.random(),  # noqa: S311
+                        index,
+                    ),
+                )
+        return schedule_create_list
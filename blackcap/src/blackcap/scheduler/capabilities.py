@@ -0,0 +1,153 @@
+"""Cluster capabilities and job requirements."""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from logzero import logger
+from pydantic.types import UUID4
+
+from blackcap.schemas.cluster import Cluster
+
+
+class UnsatisfiableJobError(Exception):
+    """No cluster satisfies the requirements of a job."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    """Parsed capabilities of a cluster or requirements of a job.
+
+    Capabilities are written as comma separated tokens. A token is either a
+    tag like GPU or a numeric resource like cores=64. Tags are case
+    insensitive. A cluster satisfies requirements when it has all the
+    required tags and at least the required amount of each resource.
+    """
+
+    tags: FrozenSet[str] = frozenset()
+    resources: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls: "Capabilities", caps: Optional[str]) -> "Capabilities":
+        """Parse capabilities.
+
+        Args:
+            caps (Optional[str]): Capabilities like "CPU,GPU,cores=64"
+
+        Raises:
+            ValueError: Resource amount is not a number
+
+        Returns:
+            Capabilities: Parsed capabilities
+        """
+        tags = set()
+        resources = {}
+        for token in (caps or "").split(","):
+            token = token.strip()
+            if token == "":
+                continue
+            if "=" in token:
+                name, amount = token.split("=", 1)
+                name = name.rstrip(">").strip().upper()
+                try:
+                    resources[name] = float(amount)
+                except ValueError as e:
+                    raise ValueError(
+                        f"Invalid amount of resource {name}: {amount}"
+                    ) from e
+            else:
+                tags.add(token.upper())
+        return cls(tags=frozenset(tags), resources=resources)
+
+    @property
+    def is_empty(self: "Capabilities") -> bool:
+        """Whether there are neither tags nor resources."""
+        return len(self.tags) == 0 and len(self.resources) == 0
+
+    def satisfies(self: "Capabilities", requirements: "Capabilities") -> bool:
+        """Check the capabilities against requirements.
+
+        Args:
+            requirements (Capabilities): Requirements of a job
+
+        Returns:
+            bool: Whether all requirements are met
+        """
+        return requirements.tags <= self.tags and all(
+            self.resources.get(name, 0.0) >= amount
+            for name, amount in requirements.resources.items()
+        )
+
+
+class CapabilityIndex:
+    """Inverted index from capabilities to the clusters providing them.
+
+    Matching looks up each requirement in the index instead of parsing and
+    comparing the capabilities of every cluster.
+    """
+
+    def __init__(self: "CapabilityIndex", cluster_list: List[Cluster]) -> None:
+        """Build the index.
+
+        Args:
+            cluster_list (List[Cluster]): List of clusters
+        """
+        self.clusters: Dict[UUID4, Cluster] = {
+            cluster.cluster_id: cluster for cluster in cluster_list
+        }
+        self.tags: Dict[str, Set[UUID4]] = {}
+        # Amounts of each resource sorted ascending, with the matching clusters
+        self.resources: Dict[str, Tuple[List[float], List[UUID4]]] = {}
+
+        amounts: Dict[str, List[Tuple[float, UUID4]]] = {}
+        for cluster in cluster_list:
+            try:
+                capabilities = Capabilities.parse(cluster.cluster_caps)
+            except ValueError as e:
+                logger.error(f"Invalid caps of cluster {cluster.cluster_id}: {e}")
+                capabilities = Capabilities()
+            for tag in capabilities.tags:
+                self.tags.setdefault(tag, set()).add(cluster.cluster_id)
+            for name, amount in capabilities.resources.items():
+                amounts.setdefault(name, []).append((amount, cluster.cluster_id))
+        for name, pairs in amounts.items():
+            pairs.sort(key=lambda pair: pair[0])
+            self.resources[name] = (
+                [amount for amount, _ in pairs],
+                [cluster_id for _, cluster_id in pairs],
+            )
+
+    def match(self: "CapabilityIndex", requirements: Capabilities) -> List[Cluster]:
+        """Find the clusters satisfying requirements.
+
+        Args:
+            requirements (Capabilities): Requirements of a job
+
+        Returns:
+            List[Cluster]: List of matching clusters
+        """
+        if requirements.is_empty:
+            return list(self.clusters.values())
+
+        candidate_sets: List[Set[UUID4]] = []
+        for tag in requirements.tags:
+            cluster_ids = self.tags.get(tag)
+            if cluster_ids is None:
+                return []
+            candidate_sets.append(cluster_ids)
+        for name, amount in requirements.resources.items():
+            if name not in self.resources:
+                return []
+            amounts, cluster_ids = self.resources[name]
+            candidate_sets.append(set(cluster_ids[bisect_left(amounts, amount) :]))
+
+        # Intersect starting from the most selective requirement
+        candidate_sets.sort(key=len)
+        matched = set(candidate_sets[0])
+        for cluster_ids in candidate_sets[1:]:
+            matched &= cluster_ids
+            if len(matched) == 0:
+                break
+        return [self.clusters[cluster_id] for cluster_id in matched]
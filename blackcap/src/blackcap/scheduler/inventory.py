@@ -0,0 +1,97 @@
+"""In-process cache of the cluster inventory."""
+
+import threading
+import time
+from typing import List, Optional
+
+from logzero import logger
+from sqlalchemy.sql.expression import select
+
+from blackcap.configs import config_registry
+from blackcap.db import DBSession
+from blackcap.models.cluster import ClusterDB
+from blackcap.scheduler.capabilities import CapabilityIndex
+from blackcap.schemas.cluster import Cluster
+
+config = config_registry.get_config()
+
+
+class ClusterInventory:
+    """Cache of the registered clusters shared by the schedulers.
+
+    Clusters are read from the DB at most once per ttl seconds, together
+    with the index of their capabilities. Changes made through the cluster
+    BLoCs invalidate the cache right away, changes made by other processes
+    become visible once the ttl expires.
+    """
+
+    def __init__(self: "ClusterInventory", ttl: float) -> None:
+        """Initialize inventory.
+
+        Args:
+            ttl (float): Max age of the cached clusters in seconds
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._index: Optional[CapabilityIndex] = None
+        self._loaded_at = 0.0
+        self._generation = 0
+
+    def load(self: "ClusterInventory") -> List[Cluster]:
+        """Read the clusters from the DB.
+
+        Raises:
+            Exception: error
+
+        Returns:
+            List[Cluster]: List of clusters
+        """
+        with DBSession() as session:
+            try:
+                stmt = select(ClusterDB)
+                cluster_list: List[ClusterDB] = session.execute(stmt).scalars().all()
+                return [
+                    Cluster(cluster_id=obj.id, **obj.to_dict()) for obj in cluster_list
+                ]
+            except Exception as e:
+                logger.error(f"Unable to fetch clusters: {e}")
+                raise e
+
+    def get_index(self: "ClusterInventory") -> CapabilityIndex:
+        """Get the capability index of the clusters, reading them if the cache is stale.
+
+        Returns:
+            CapabilityIndex: Index of the clusters
+        """
+        with self._lock:
+            if (
+                self._index is not None
+                and time.monotonic() - self._loaded_at < self.ttl
+            ):
+                return self._index
+            generation = self._generation
+
+        index = CapabilityIndex(self.load())
+        with self._lock:
+            # Do not cache a result that was invalidated while being loaded
+            if generation == self._generation:
+                self._index = index
+                self._loaded_at = time.monotonic()
+        return index
+
+    def get_clusters(self: "ClusterInventory") -> List[Cluster]:
+        """Get the clusters, reading them from the DB if the cache is stale.
+
+        Returns:
+            List[Cluster]: List of clusters
+        """
+        return list(self.get_index().clusters.values())
+
+    def invalidate(self: "ClusterInventory") -> None:
+        """Drop the cached clusters."""
+        with self._lock:
+            self._index = None
+            self._generation += 1
+
+
+cluster_inventory = ClusterInventory(ttl=config.SCHEDULER_CLUSTER_CACHE_TTL)
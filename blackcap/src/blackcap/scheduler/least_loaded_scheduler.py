@@ -0,0 +1,166 @@
+"""Least loaded Scheduler implementation of Scheduler."""
+
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from pydantic.types import UUID4
+
+from blackcap.configs import config_registry
+from blackcap.observer import observer_registry
+from blackcap.observer.base import BaseObserver
+from blackcap.scheduler.base import BaseScheduler
+from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
+from blackcap.schemas.metrics import Metrics
+
+config = config_registry.get_config()
+
+
+class LeastLoadedScheduler(BaseScheduler):
+    """Least loaded scheduler schedule jobs on the least loaded cluster.
+
+    Clusters are scored with the metrics of the observer. The score is the
+    time needed to drain the queue of the cluster, in multiples of the
+    observed time range, minus the fraction of free cores. Jobs assigned
+    earlier in the same batch count as queued, so a batch spreads over the
+    clusters instead of piling on one. Only clusters satisfying the
+    requirements of the job are candidates. Clusters without metrics are
+    scored as idle clusters with no known throughput.
+    """
+
+    CONFIG_KEY_VAL = "LEAST_LOADED"
+
+    def __init__(
+        self: "LeastLoadedScheduler", observer: Optional[BaseObserver] = None
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            observer (Optional[BaseObserver]): Source of the metrics. Defaults to the configured observer. # noqa: B950
+        """
+        self._observer = observer
+        self._lock = threading.Lock()
+        self._metrics: Dict[UUID4, Metrics] = {}
+        self._metrics_at: Optional[float] = None
+
+    @property
+    def observer(self: "LeastLoadedScheduler") -> BaseObserver:
+        """Observer providing the cluster metrics."""
+        if self._observer is None:
+            self._observer = observer_registry.get_observer(config.OBSERVER)
+        return self._observer
+
+    def get_metrics(self: "LeastLoadedScheduler") -> Dict[UUID4, Metrics]:
+        """Get the metrics of the clusters, refreshed every SCHEDULER_METRICS_TTL.
+
+        Returns:
+            Dict[UUID4, Metrics]: Metrics by cluster ID
+        """
+        with self._lock:
+            if (
+                self._metrics_at is not None
+                and time.monotonic() - self._metrics_at < config.SCHEDULER_METRICS_TTL
+            ):
+                return self._metrics
+        metrics_list = self.observer.get_metrics(config.SCHEDULER_METRICS_RANGE)
+        metrics = {metrics.cluster_id: metrics for metrics in metrics_list}
+        with self._lock:
+            self._metrics = metrics
+            self._metrics_at = time.monotonic()
+        return metrics
+
+    @staticmethod
+    def score(metrics: Metrics, planned_jobs: int = 0) -> float:
+        """Score the load of a cluster, lower is better.
+
+        Args:
+            metrics (Metrics): Metrics of the cluster
+            planned_jobs (int): Jobs assigned to the cluster but not yet observed. Defaults to 0. # noqa: B950
+
+        Returns:
+            float: Score of the cluster
+        """
+        drain_time = (metrics.queued_jobs + planned_jobs) / max(
+            metrics.completed_jobs, 1
+        )
+        free_ratio = (
+            metrics.free_cores / metrics.total_cores if metrics.total_cores > 0 else 0.0
+        )
+        return drain_time - free_ratio
+
+    def select_cluster(
+        self: "LeastLoadedScheduler",
+        cluster_list: List[Cluster],
+        metrics: Dict[UUID4, Metrics],
+        planned_jobs: Dict[UUID4, int],
+    ) -> Cluster:
+        """Select the least loaded cluster.
+
+        Args:
+            cluster_list (List[Cluster]): List of candidate clusters
+            metrics (Dict[UUID4, Metrics]): Metrics by cluster ID
+            planned_jobs (Dict[UUID4, int]): Jobs assigned in the batch by cluster ID # noqa: B950
+
+        Returns:
+            Cluster: Selected cluster
+        """
+        # Ties are broken randomly so that processes do not all pick the same cluster # noqa: B950
+        return min(
+            cluster_list,
+            key=lambda cluster: (
+                self.score(
+                    metrics.get(cluster.cluster_id)
+                    or Metrics(cluster_id=cluster.cluster_id),
+                    planned_jobs.get(cluster.cluster_id, 0),
+                ),
+                random.random(),  # noqa: S311
+            ),
+        )
+
+    def schedule(
+        self: "LeastLoadedScheduler", schedule_create: ScheduleCreate
+    ) -> ScheduleCreate:
+        """Create schedule from schedule request.
+
+        Args:
+            schedule_create (ScheduleCreate): Schedule create request
+
+        Raises:
+            Exception: No cluster available
+            UnsatisfiableJobError: No cluster satisfies the requirements of a job
+
+        Returns:
+            ScheduleCreate: Instance of Schedule Create
+        """
+        return self.schedule_batch([schedule_create])[0]
+
+    def schedule_batch(
+        self: "LeastLoadedScheduler", schedule_create_list: List[ScheduleCreate]
+    ) -> List[ScheduleCreate]:
+        """Create schedules from a batch of schedule requests.
+
+        Args:
+            schedule_create_list (List[ScheduleCreate]): Schedule create requests
+
+        Raises:
+            Exception: No cluster available
+            UnsatisfiableJobError: No cluster satisfies the requirements of a job
+
+        Returns:
+            List[ScheduleCreate]: Instances of Schedule Create, in order
+        """
+        if len(schedule_create_list) == 0:
+            return []
+        candidates_list = self.match_clusters(schedule_create_list)
+        metrics = self.get_metrics()
+        planned_jobs: Dict[UUID4, int] = {}
+        processed_schedule_create_list = []
+        for schedule_create, candidates in zip(schedule_create_list, candidates_list):
+            cluster = self.select_cluster(candidates, metrics, planned_jobs)
+            planned_jobs[cluster.cluster_id] = (
+                planned_jobs.get(cluster.cluster_id, 0) + 1
+            )
+            processed_schedule_create_list.append(self.assign(schedule_create, cluster))
+        return processed_schedule_create_list
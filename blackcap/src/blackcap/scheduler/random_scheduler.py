@@ -3,11 +3,6 @@
 import random
 from typing import List
 
-from logzero import logger
-from sqlalchemy.sql.expression import select
-
-from blackcap.db import DBSession
-from blackcap.models.cluster import ClusterDB
 from blackcap.scheduler.base import BaseScheduler
 from blackcap.schemas.api.schedule.post import ScheduleCreate
 
@@ -18,7 +13,7 @@ class RandomScheduler(BaseScheduler):
     CONFIG_KEY_VAL = "RANDOM"
 
     def schedule(
-        self: "BaseScheduler", schedule_create: ScheduleCreate
+        self: "RandomScheduler", schedule_create: ScheduleCreate
     ) -> ScheduleCreate:
         """Create schedule from schedule request.
 
@@ -27,29 +22,37 @@ class RandomScheduler(BaseScheduler):
 
         Raises:
             Exception: No cluster available
+            UnsatisfiableJobError: No cluster satisfies the requirements of a job
 
         Returns:
             ScheduleCreate: Instance of Schedule Create
         """
-        # fetch available clusters
-        cluster_list: List[ClusterDB] = []
-        with DBSession() as session:
-            try:
-                stmt = select(ClusterDB)
-                cluster_list = session.execute(stmt).scalars().all()
-            except Exception as e:
-                logger.error(f"Unable to fetch clusters: {e}")
-                raise e
-
-        # Raise error if no cluster available
-        if len(cluster_list) == 0:
-            logger.error("No cluster available")
-            raise Exception("cluster_list: List[ClusterDB]")
-
-        # Randomly selects a cluster
-        selected_cluster = random.choice(cluster_list)  # noqa: S311
-        schedule_create.assigned_cluster_id = selected_cluster.id
-        schedule_create.messenger = selected_cluster.messenger
-        schedule_create.messenger_queue = selected_cluster.messenger_queue
-
-        return schedule_create
+        return self.schedule_batch([schedule_create])[0]
+
+    def schedule_batch(
+        self: "RandomScheduler", schedule_create_list: List[ScheduleCreate]
+    ) -> List[ScheduleCreate]:
+        """Create schedules from a batch of schedule requests.
+
+        The cluster inventory and the job requirements are read once for the
+        whole batch.
+
+        Args:
+            schedule_create_list (List[ScheduleCreate]): Schedule create requests
+
+        Raises:
+            Exception: No cluster available
+            UnsatisfiableJobError: No cluster satisfies the requirements of a job
+
+        Returns:
+            List[ScheduleCreate]: Instances of Schedule Create, in order
+        """
+        if len(schedule_create_list) == 0:
+            return []
+        candidates_list = self.match_clusters(schedule_create_list)
+        return [
+            self.assign(schedule_create, random.choice(candidates))  # noqa: S311
+            for schedule_create, candidates in zip(
+                schedule_create_list, candidates_list
+            )
+        ]
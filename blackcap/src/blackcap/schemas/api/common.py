@@ -1,6 +1,6 @@
 """Blackcap common schemas."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -11,3 +11,5 @@ class ResponseSchema(BaseModel):
     msg: str
     items: Dict[str, List[Any]] = {}
     errors: Dict[str, List[Any]] = {}
+    # Cursor of the next page of items, None on the last page
+    next_cursor: Optional[str] = None
@@ -3,10 +3,11 @@
 from enum import Enum, unique
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import UUID4, BaseModel
+from pydantic import BaseModel, conint, UUID4, validator
 
 from blackcap.schemas.api.common import ResponseSchema
-from blackcap.schemas.job import Job
+from blackcap.schemas.job import JobSummary
+from blackcap.utils.pagination import decode_cursor
 
 
 @unique
@@ -32,9 +33,31 @@ class JobGetQueryParams(BaseModel):
     create_timerange: Optional[str]
     finished_timerange: Optional[str]
     job_status: Optional[str]
+    # Keyset pagination, cursor is the next_cursor of the previous page
+    limit: Optional[conint(ge=1)]
+    cursor: Optional[str]
+    # Stream all the results from the cursor instead of a page
+    stream: bool = False
+    # Return JobSummary items, the script and specifications are not loaded
+    summary: bool = False
+
+    @validator("cursor")
+    def check_cursor(cls: "JobGetQueryParams", cursor: Optional[str]) -> Optional[str]:
+        """Check the cursor can be decoded.
+
+        Args:
+            cursor (Optional[str]): Cursor of the previous page
+
+        Returns:
+            Optional[str]: Cursor of the previous page
+        """
+        if cursor is not None:
+            decode_cursor(cursor)
+        return cursor
 
 
 class JobGetResponse(ResponseSchema):
     """Job GET response schema."""
 
-    items: Dict[str, List[Union[Job, Any]]] = {}
+    # Job extends JobSummary, so both validate without being converted
+    items: Dict[str, List[Union[JobSummary, Any]]] = {}
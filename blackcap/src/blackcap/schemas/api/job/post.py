@@ -17,6 +17,7 @@ class JobCreate(BaseModel):
     specification: Dict = {}
     job_metadata: Dict = {}
     script: Optional[str]
+    cluster_caps_req: Optional[str]
 
 
 class JobPOSTRequest(BaseModel):
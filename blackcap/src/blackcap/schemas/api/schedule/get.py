@@ -3,10 +3,11 @@
 from enum import Enum, unique
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, conint, validator
 
 from blackcap.schemas.api.common import ResponseSchema
 from blackcap.schemas.schedule import Schedule
+from blackcap.utils.pagination import decode_cursor
 
 
 @unique
@@ -24,12 +25,34 @@ class ScheduleQueryType(Enum):
 class ScheduleGetQueryParams(BaseModel):
     """Schedule GET request query params schema."""
 
+    query_type: ScheduleQueryType
     schedule_id: Optional[str]
     job_id: Optional[str]
     protagonist_id: Optional[str]
     cluster_id: Optional[str]
     create_timerange: Optional[str]
     finished_timerange: Optional[str]
+    # Keyset pagination, cursor is the next_cursor of the previous page
+    limit: Optional[conint(ge=1)]
+    cursor: Optional[str]
+    # Stream all the results from the cursor instead of a page
+    stream: bool = False
+
+    @validator("cursor")
+    def check_cursor(
+        cls: "ScheduleGetQueryParams", cursor: Optional[str]
+    ) -> Optional[str]:
+        """Check the cursor can be decoded.
+
+        Args:
+            cursor (Optional[str]): Cursor of the previous page
+
+        Returns:
+            Optional[str]: Cursor of the previous page
+        """
+        if cursor is not None:
+            decode_cursor(cursor)
+        return cursor
 
 
 class ScheduleGetResponse(ResponseSchema):
@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, List, Optional, Union
 
+from blackcap.schemas.api.common import ResponseSchema
 from blackcap.schemas.schedule import Schedule
 
 from pydantic import BaseModel, UUID4
@@ -23,7 +24,7 @@ class SchedulePOSTRequest(BaseModel):
     schedule_list: List[ScheduleCreate]
 
 
-class SchedulePOSTResponse(BaseModel):
+class SchedulePOSTResponse(ResponseSchema):
     """Schedule POST response schema."""
 
     items: Dict[str, List[Union[Schedule, Any]]] = {}
@@ -6,13 +6,19 @@ from pydantic import BaseModel
 from pydantic.types import UUID4
 
 
-class Job(BaseModel):
-    """Job schema."""
+class JobSummary(BaseModel):
+    """Job summary schema, without the script, specification and metadata."""
 
     job_id: UUID4
     name: str
     description: str = ""
     job_type: str = ""
+    cluster_caps_req: Optional[str]
+
+
+class Job(JobSummary):
+    """Job schema."""
+
     specification: Dict = {}
     job_metadata: Dict = {}
     script: Optional[str]
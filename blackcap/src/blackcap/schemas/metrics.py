@@ -1,9 +1,20 @@
 """Metrics schema."""
 
+from datetime import datetime
+from typing import Optional
+
 from pydantic import BaseModel
+from pydantic.types import UUID4
 
 
 class Metrics(BaseModel):
     """Metrics schema."""
 
-    pass
+    cluster_id: UUID4
+    queued_jobs: int = 0
+    running_jobs: int = 0
+    total_cores: int = 0
+    free_cores: int = 0
+    # Jobs finished within the observed time range
+    completed_jobs: int = 0
+    timestamp: Optional[datetime]
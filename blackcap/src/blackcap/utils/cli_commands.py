@@ -1,15 +1,20 @@
 """CLI commnad util functions."""
 
 
-import subprocess  # noqa: S404
-import sys
 from typing import List, Optional, Union
 
 from blackcap.configs import config_registry
 from blackcap.configs.base import BaseConfig
+from blackcap.utils.command_runner import CommandRunner
 
 config = config_registry.get_config()
 
+# Shared by every CLI call of the process
+command_runner = CommandRunner(
+    max_concurrency=config.CLI_MAX_CONCURRENT_COMMANDS,
+    default_timeout=config.CLI_COMMAND_TIMEOUT,
+)
+
 
 def call_cli(
     cmd: List[str],
@@ -22,19 +27,10 @@ def call_cli(
     Args:
         cmd (List[str]): [description]
         input (Optional[str]): [description]. Defaults to None.
-        timeout (Optional[float]): [description]. Defaults to None.
+        timeout (Optional[float]): [description]. Defaults to CLI_COMMAND_TIMEOUT.
         config (BaseConfig): [description]. Defaults to default_config.
 
     Returns:
         Union[str, bytes]: Stdout
     """
-    proc = subprocess.Popen(  # noqa: S603
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        encoding="utf-8",
-        errors="replace",
-    )
-    stdout, stderr = proc.communicate(input=input, timeout=timeout)
-    sys.stderr.write(stderr)
-    return stdout
+    return command_runner.run_sync(cmd, input=input, timeout=timeout).stdout
@@ -0,0 +1,91 @@
+"""Keyset pagination helpers."""
+
+import base64
+from datetime import datetime
+import json
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import Select
+
+
+def encode_cursor(created_at: datetime, record_id: UUID) -> str:
+    """Encode the position of a record into an opaque cursor.
+
+    Args:
+        created_at (datetime): Creation time of the record
+        record_id (UUID): Id of the record
+
+    Returns:
+        str: Cursor
+    """
+    position = json.dumps([created_at.isoformat(), str(record_id)])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor into the position of a record.
+
+    Args:
+        cursor (str): Cursor
+
+    Raises:
+        ValueError: Invalid cursor
+
+    Returns:
+        Tuple[datetime, UUID]: Creation time and id of the record
+    """
+    try:
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(record_id)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+
+def paginate(
+    stmt: Select, model: Any, cursor: Optional[str], limit: Optional[int]
+) -> Select:
+    """Order a query on (created_at, id) and restrict it to a page.
+
+    One more record than the limit is selected to know if a next page exists.
+
+    Args:
+        stmt (Select): Query selecting the records
+        model (Any): DB model of the records
+        cursor (Optional[str]): Cursor of the last record of the previous page
+        limit (Optional[int]): Max number of records, all records if None
+
+    Returns:
+        Select: Query selecting the page
+    """
+    stmt = stmt.order_by(model.created_at, model.id)
+    if cursor is not None:
+        created_at, record_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                model.created_at > created_at,
+                and_(model.created_at == created_at, model.id > record_id),
+            )
+        )
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+
+def split_page(
+    obj_list: List[Any], limit: Optional[int]
+) -> Tuple[List[Any], Optional[str]]:
+    """Split the records selected by paginate into the page and the next cursor.
+
+    Args:
+        obj_list (List[Any]): Records selected by paginate
+        limit (Optional[int]): Max number of records, all records if None
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: Page and cursor of the next page, None if it is the last page # noqa: B950
+    """
+    if limit is None or len(obj_list) <= limit:
+        return obj_list, None
+    page = obj_list[:limit]
+    return page, encode_cursor(page[-1].created_at, page[-1].id)
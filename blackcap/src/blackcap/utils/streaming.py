@@ -0,0 +1,127 @@
+"""Streaming JSON responses."""
+
+from itertools import islice
+import json
+from typing import Iterator, List
+
+from flask import Request, Response
+from logzero import logger
+from pydantic import BaseModel
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+JSON_MIMETYPE = "application/json"
+# Error reported in place of the items that could not be streamed
+STREAM_ERRORS = {"main": ["unknown internal error"]}
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Check if a request prefers NDJSON over JSON.
+
+    Args:
+        request (Request): Flask request
+
+    Returns:
+        bool: True if NDJSON is preferred
+    """
+    best_match = request.accept_mimetypes.best_match([JSON_MIMETYPE, NDJSON_MIMETYPE])
+    return best_match == NDJSON_MIMETYPE
+
+
+def iter_batches(
+    item_iter: Iterator[BaseModel], batch_size: int
+) -> Iterator[List[str]]:
+    """Serialise items and group them in batches.
+
+    Args:
+        item_iter (Iterator[BaseModel]): Items to serialise
+        batch_size (int): Number of items per batch
+
+    Yields:
+        Iterator[List[str]]: Serialised items
+    """
+    while True:
+        batch = [item.json() for item in islice(item_iter, batch_size)]
+        if len(batch) == 0:
+            return
+        yield batch
+
+
+def stream_json(
+    msg: str, list_name: str, item_iter: Iterator[BaseModel], batch_size: int
+) -> Iterator[str]:
+    """Write a response body with the items of a list as they are iterated.
+
+    The body has the same layout as the ResponseSchema body. If iterating the
+    items fails, the list is closed and the failure is reported in errors.
+
+    Args:
+        msg (str): Response message
+        list_name (str): Key of the list in the response items
+        item_iter (Iterator[BaseModel]): Items of the list
+        batch_size (int): Number of items per written chunk
+
+    Yields:
+        Iterator[str]: Chunks of the response body
+    """
+    yield f'{{"msg": {json.dumps(msg)}, "items": {{{json.dumps(list_name)}: ['
+    errors = {}
+    separator = ""
+    try:
+        for batch in iter_batches(item_iter, batch_size):
+            yield separator + ", ".join(batch)
+            separator = ", "
+    except Exception as e:
+        logger.error(f"Unable to stream {list_name} due to {e}")
+        errors = STREAM_ERRORS
+    yield f']}}, "errors": {json.dumps(errors)}, "next_cursor": null}}'
+
+
+def stream_ndjson(
+    list_name: str, item_iter: Iterator[BaseModel], batch_size: int
+) -> Iterator[str]:
+    """Write the items of a list as newline delimited JSON.
+
+    If iterating the items fails, a last line reports the failure in errors.
+
+    Args:
+        list_name (str): Name of the list, for logging
+        item_iter (Iterator[BaseModel]): Items of the list
+        batch_size (int): Number of items per written chunk
+
+    Yields:
+        Iterator[str]: Chunks of the response body
+    """
+    try:
+        for batch in iter_batches(item_iter, batch_size):
+            yield "\n".join(batch) + "\n"
+    except Exception as e:
+        logger.error(f"Unable to stream {list_name} due to {e}")
+        yield json.dumps({"errors": STREAM_ERRORS}) + "\n"
+
+
+def make_stream_response(
+    request: Request,
+    msg: str,
+    list_name: str,
+    item_iter: Iterator[BaseModel],
+    batch_size: int,
+) -> Response:
+    """Make a streaming response, NDJSON if the request prefers it else JSON.
+
+    Args:
+        request (Request): Flask request
+        msg (str): Response message
+        list_name (str): Key of the list in the response items
+        item_iter (Iterator[BaseModel]): Items of the list
+        batch_size (int): Number of items per written chunk
+
+    Returns:
+        Response: Flask response
+    """
+    if wants_ndjson(request):
+        return Response(
+            stream_ndjson(list_name, item_iter, batch_size), mimetype=NDJSON_MIMETYPE
+        )
+    return Response(
+        stream_json(msg, list_name, item_iter, batch_size), mimetype=JSON_MIMETYPE
+    )
@@ -1,15 +1,34 @@
 """Test job BLoCs."""
+
 # flake8: noqa
 
 from typing import Dict
+from uuid import uuid4
+
+from pydantic import ValidationError
+import pytest
 
-from blackcap.blocs.job import create_job, delete_job, get_job, update_job
+from blackcap.blocs.job import (
+    build_job_query,
+    check_job_list_exist,
+    create_job,
+    delete_job,
+    get_job,
+    get_job_page,
+    get_jobs_by_ids,
+    get_missing_job_ids,
+    iter_jobs,
+    update_job,
+)
+from blackcap.blocs.user import create_user
+from blackcap.flow import FlowExecError, Prop
 from blackcap.models.job import JobDB
 from blackcap.schemas.api.job.delete import JobDelete
 from blackcap.schemas.api.job.get import JobGetQueryParams, JobQueryType
 from blackcap.schemas.api.job.post import JobCreate
 from blackcap.schemas.api.job.put import JobUpdate
-from blackcap.schemas.job import Job
+from blackcap.schemas.api.user.post import UserCreate
+from blackcap.schemas.job import Job, JobSummary
 from blackcap.schemas.user import User
 
 from logzero import logger
@@ -33,3 +52,126 @@ def test_get_all_jobs_bloc(job: Job, user: User) -> None:
     query_params = JobGetQueryParams(query_type=JobQueryType.GET_ALL_JOBS)
     returned_jobs = get_job(query_params, user)
     assert job in returned_jobs
+
+
+def test_get_missing_job_ids_bloc(job: Job, user: User) -> None:
+    unknown_id = str(uuid4())
+    missing = get_missing_job_ids(
+        [str(job.job_id), str(job.job_id).upper(), unknown_id, "not-a-uuid"], user
+    )
+    assert missing == {unknown_id, "not-a-uuid"}
+
+
+def test_check_job_list_exist_bloc(job: Job, user: User) -> None:
+    job_id_list = [str(job.job_id)]
+    outputs = check_job_list_exist(
+        [Prop(data=job_id_list, description=""), Prop(data=user, description="")]
+    )
+    assert outputs[0].data == job_id_list
+
+    unknown_id = str(uuid4())
+    with pytest.raises(FlowExecError) as exc_info:
+        check_job_list_exist(
+            [
+                Prop(data=job_id_list + [unknown_id], description=""),
+                Prop(data=user, description=""),
+            ]
+        )
+    assert exc_info.value.is_user_facing
+    assert unknown_id in exc_info.value.user_facing_msg
+
+
+def test_update_and_delete_job_bloc(user: User) -> None:
+    created_job_list = create_job(
+        [
+            JobCreate(name=f"bulk job {index}", description="", script="hostname")
+            for index in range(3)
+        ],
+        user,
+    )
+    job_id_list = [job.job_id for job in created_job_list]
+
+    updated_job_list = update_job(
+        [JobUpdate(job_id=job_id) for job_id in job_id_list], user
+    )
+    assert {job.job_id for job in updated_job_list} == set(job_id_list)
+
+    other_user = User(user_id=uuid4(), name="other", email="o@o.com", organisation="")
+    assert delete_job([JobDelete(job_id=job_id_list[0])], other_user) == []
+
+    deleted_job_list = delete_job(
+        [JobDelete(job_id=job_id) for job_id in job_id_list[:2]], user
+    )
+    assert {job.job_id for job in deleted_job_list} == set(job_id_list[:2])
+    assert get_missing_job_ids([str(job_id) for job_id in job_id_list], user) == {
+        str(job_id) for job_id in job_id_list[:2]
+    }
+
+
+def test_get_job_page_bloc(user: User) -> None:
+    other_user = create_user(
+        [
+            UserCreate(
+                user=User(name="pager", email="pager@pager.com", organisation=""),
+                password="password",
+            )
+        ]
+    )[0]
+    created_job_list = create_job(
+        [
+            JobCreate(name=f"page job {index}", description="", script="hostname")
+            for index in range(5)
+        ],
+        other_user,
+    )
+
+    fetched_job_list, cursor, n_pages = [], None, 0
+    while True:
+        query_params = JobGetQueryParams(
+            query_type=JobQueryType.GET_ALL_JOBS, limit=2, cursor=cursor
+        )
+        job_list, cursor = get_job_page(query_params, other_user)
+        fetched_job_list += job_list
+        n_pages += 1
+        if cursor is None:
+            break
+    assert n_pages == 3
+    fetched_job_ids = [job.job_id for job in fetched_job_list]
+    assert len(fetched_job_ids) == 5
+    assert set(fetched_job_ids) == {job.job_id for job in created_job_list}
+
+
+def test_iter_jobs_bloc(job: Job, user: User) -> None:
+    query_params = JobGetQueryParams(query_type=JobQueryType.GET_ALL_JOBS, limit=1)
+    job_list = list(iter_jobs(query_params, user))
+    assert job in job_list
+    assert job_list == get_job(
+        JobGetQueryParams(query_type=JobQueryType.GET_ALL_JOBS), user
+    )
+
+
+def test_get_job_summary_bloc(job: Job, user: User) -> None:
+    query_params = JobGetQueryParams(
+        query_type=JobQueryType.GET_JOBS_BY_ID, job_id=job.job_id, summary=True
+    )
+    assert "job.script" not in str(build_job_query(query_params, user))
+    job_summary = get_job(query_params, user)[0]
+    assert type(job_summary) == JobSummary
+    assert job_summary == JobSummary(**job.dict())
+
+
+def test_get_jobs_by_ids_bloc(job: Job, user: User) -> None:
+    job_dict = get_jobs_by_ids([job.job_id, job.job_id, uuid4()], user)
+    assert job_dict == {job.job_id: job}
+
+
+@pytest.mark.parametrize(
+    "query_type",
+    [
+        JobQueryType.GET_JOBS_BY_CREATE_TIMERANGE,
+        JobQueryType.GET_JOBS_BY_FINISHED_TIMERANGE,
+    ],
+)
+def test_build_job_query_unsupported_type(user: User, query_type: JobQueryType) -> None:
+    with pytest.raises(ValidationError):
+        build_job_query(JobGetQueryParams(query_type=query_type), user)
@@ -1,11 +1,26 @@
 """Schedule BloCs integration tests."""
+
 # flake8: noqa
 
 from typing import Dict
+from unittest import mock
+from uuid import uuid4
+
+from pydantic import ValidationError
+import pytest
 
-from blackcap.blocs.schedule import create_schedule, generate_create_schedule_flow
+from blackcap.blocs.schedule import (
+    build_schedule_query,
+    create_schedule,
+    delete_schedule,
+    generate_create_schedule_flow,
+    get_schedule,
+    publish_schedule_message,
+    update_schedule,
+)
 from blackcap.configs import config_registry
-from blackcap.flow import Executor, FlowStatus
+from blackcap.flow import Executor, FlowExecError, FlowStatus, Prop
+from blackcap.messenger.base import PublishResult
 from blackcap.scheduler import scheduler_registry
 from blackcap.models.schedule import ScheduleDB
 from blackcap.schemas.api.schedule.delete import ScheduleDelete
@@ -22,6 +37,7 @@ from logzero import logger
 from sqlalchemy import select
 from sqlalchemy.orm.session import Session
 
+from blackcap.db import DBSession
 
 config = config_registry.get_config()
 scheduler = scheduler_registry.get_scheduler(config.SCHEDULER)
@@ -42,3 +58,194 @@ def test_create_schedule_flow(job: Job, cluster: Cluster, user) -> None:
     executor = Executor(create_schedule_flow, {})
     executed_flow = executor.run()
     assert executed_flow.status == FlowStatus.PASSED
+
+
+def test_update_and_delete_schedule_bloc(
+    user: User, job: Job, cluster: Cluster
+) -> None:
+    created_schedule_list = create_schedule(
+        [ScheduleCreate(job_id=job.job_id, assigned_cluster_id=cluster.cluster_id)] * 3,
+        user,
+    )
+    schedule_update_list = [
+        ScheduleUpdate(
+            schedule_id=schedule.schedule_id,
+            protagonist_id=user.user_id,
+            status=status,
+        )
+        for schedule, status in zip(created_schedule_list, ["RUNNING", "FAILED"])
+    ]
+    updated_schedule_list = update_schedule(schedule_update_list, user)
+    assert {(s.schedule_id, s.status) for s in updated_schedule_list} == {
+        (created_schedule_list[0].schedule_id, "RUNNING"),
+        (created_schedule_list[1].schedule_id, "FAILED"),
+    }
+    with DBSession() as session:
+        stmt = select(ScheduleDB.status).where(
+            ScheduleDB.id == created_schedule_list[2].schedule_id
+        )
+        assert session.execute(stmt).scalar_one() == "PENDING"
+
+    deleted_schedule_list = delete_schedule(created_schedule_list, user)
+    assert len(deleted_schedule_list) == 3
+    with DBSession() as session:
+        stmt = select(ScheduleDB.id).where(
+            ScheduleDB.id.in_([s.schedule_id for s in created_schedule_list])
+        )
+        assert session.execute(stmt).all() == []
+
+
+def test_get_schedule_by_id_bloc(user: User, job: Job, cluster: Cluster) -> None:
+    schedule = create_schedule(
+        [ScheduleCreate(job_id=job.job_id, assigned_cluster_id=cluster.cluster_id)],
+        user,
+    )[0]
+    query_params = ScheduleGetQueryParams(
+        query_type=ScheduleQueryType.GET_SCHEDULE_BY_ID,
+        schedule_id=str(schedule.schedule_id),
+    )
+    assert [s.schedule_id for s in get_schedule(query_params, user)] == [
+        schedule.schedule_id
+    ]
+    other_user = User(user_id=uuid4(), name="other", email="o@o.com", organisation="")
+    assert get_schedule(query_params, other_user) == []
+
+
+@pytest.mark.parametrize(
+    "query_type",
+    [
+        ScheduleQueryType.GET_SCHEDULES_BY_CREATE_TIMERANGE,
+        ScheduleQueryType.GET_SCHEDULES_BY_FINISHED_TIMERANGE,
+    ],
+)
+def test_build_schedule_query_unsupported_type(
+    user: User, query_type: ScheduleQueryType
+) -> None:
+    with pytest.raises(ValidationError):
+        build_schedule_query(ScheduleGetQueryParams(query_type=query_type), user)
+
+
+def test_publish_schedule_message_attaches_full_job(
+    user: User, job: Job, cluster: Cluster
+) -> None:
+    created_schedule_list = create_schedule(
+        [ScheduleCreate(job_id=job.job_id, assigned_cluster_id=cluster.cluster_id)] * 3,
+        user,
+    )
+    messenger = mock.Mock()
+    messenger.publish_many.side_effect = lambda msgs, queue: [
+        PublishResult(msg=msg, msg_id="1") for msg in msgs
+    ]
+    with mock.patch(
+        "blackcap.blocs.schedule.messenger_registry.get_messenger",
+        return_value=messenger,
+    ):
+        publish_schedule_message(
+            [
+                Prop(data=created_schedule_list, description=""),
+                Prop(data=user, description=""),
+            ]
+        )
+    msgs = messenger.publish_many.call_args.args[0]
+    assert len(msgs) == 3
+    assert all(msg["data"]["job"]["script"] == job.script for msg in msgs)
+
+
+def test_publish_schedule_message_partial_failure(
+    user: User, job: Job, cluster: Cluster
+) -> None:
+    created_schedule_list = create_schedule(
+        [ScheduleCreate(job_id=job.job_id, assigned_cluster_id=cluster.cluster_id)] * 3,
+        user,
+    )
+    failed_schedule = created_schedule_list[1]
+    messenger = mock.Mock()
+    messenger.publish_many.side_effect = lambda msgs, queue: [
+        PublishResult(msg=msg, error=ValueError("publish failed"))
+        if msg["data"]["schedule_id"] == failed_schedule.schedule_id
+        else PublishResult(msg=msg, msg_id="1")
+        for msg in msgs
+    ]
+    with mock.patch(
+        "blackcap.blocs.schedule.messenger_registry.get_messenger",
+        return_value=messenger,
+    ):
+        outputs = publish_schedule_message(
+            [
+                Prop(data=created_schedule_list, description=""),
+                Prop(data=user, description=""),
+            ]
+        )
+    published_id_list = [schedule.schedule_id for schedule in outputs[0].data]
+    assert published_id_list == [
+        created_schedule_list[0].schedule_id,
+        created_schedule_list[2].schedule_id,
+    ]
+    assert outputs[1].data == [failed_schedule]
+    with DBSession() as session:
+        stmt = select(ScheduleDB.id).where(
+            ScheduleDB.id.in_([s.schedule_id for s in created_schedule_list])
+        )
+        assert set(session.execute(stmt).scalars().all()) == set(published_id_list)
+
+    messenger.publish_many.side_effect = lambda msgs, queue: [
+        PublishResult(msg=msg, error=ValueError("publish failed")) for msg in msgs
+    ]
+    with mock.patch(
+        "blackcap.blocs.schedule.messenger_registry.get_messenger",
+        return_value=messenger,
+    ), pytest.raises(FlowExecError):
+        publish_schedule_message(
+            [
+                Prop(data=outputs[0].data, description=""),
+                Prop(data=user, description=""),
+            ]
+        )
+
+
+def test_publish_schedule_message_failing_queue(
+    user: User, job: Job, cluster: Cluster
+) -> None:
+    created_schedule_list = create_schedule(
+        [
+            ScheduleCreate(
+                job_id=job.job_id,
+                assigned_cluster_id=cluster.cluster_id,
+                messenger="NATS",
+                messenger_queue=queue,
+            )
+            for queue in ["up", "down", "up"]
+        ],
+        user,
+    )
+
+    def publish_many(msgs, queue):
+        if queue == "down":
+            raise ConnectionError("queue is down")
+        return [PublishResult(msg=msg, msg_id="1") for msg in msgs]
+
+    messenger = mock.Mock()
+    messenger.publish_many.side_effect = publish_many
+    with mock.patch(
+        "blackcap.blocs.schedule.messenger_registry.get_messenger",
+        return_value=messenger,
+    ):
+        outputs = publish_schedule_message(
+            [
+                Prop(data=created_schedule_list, description=""),
+                Prop(data=user, description=""),
+            ]
+        )
+
+    assert messenger.publish_many.call_count == 2
+    published_id_list = [schedule.schedule_id for schedule in outputs[0].data]
+    assert published_id_list == [
+        created_schedule_list[0].schedule_id,
+        created_schedule_list[2].schedule_id,
+    ]
+    assert outputs[1].data == [created_schedule_list[1]]
+    with DBSession() as session:
+        stmt = select(ScheduleDB.id).where(
+            ScheduleDB.id.in_([s.schedule_id for s in created_schedule_list])
+        )
+        assert set(session.execute(stmt).scalars().all()) == set(published_id_list)
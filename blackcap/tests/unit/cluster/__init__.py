@@ -0,0 +1 @@
+"""Cluster unit tests."""
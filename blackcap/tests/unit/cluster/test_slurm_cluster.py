@@ -0,0 +1,146 @@
+"""Slurm cluster unit tests."""
+
+# flake8: noqa
+
+import subprocess
+from uuid import uuid4
+
+import pytest
+
+from blackcap.cluster.slurm_cluster import (
+    expand_job_ids,
+    sbatch_directives,
+    SlurmCluster,
+)
+from blackcap.schemas.job import Job
+from blackcap.schemas.schedule import Schedule
+
+
+def make_schedule(script: str) -> Schedule:
+    job_id = uuid4()
+    return Schedule(
+        schedule_id=uuid4(),
+        job_id=job_id,
+        job=Job(job_id=job_id, name="job", script=script),
+        assigned_cluster_id=uuid4(),
+        messenger="NATS",
+        messenger_queue="test",
+    )
+
+
+@pytest.fixture
+def sbatch(mocker, tmp_path):
+    mocker.patch("blackcap.cluster.slurm_cluster.xdg_data_home", return_value=tmp_path)
+    job_ids = iter(range(100, 200))
+    return mocker.patch(
+        "blackcap.cluster.slurm_cluster.call_cli",
+        side_effect=lambda cmd: f"Submitted batch job {next(job_ids)}\n",
+    )
+
+
+def test_sbatch_directives() -> None:
+    script = "#!/bin/bash\n#SBATCH -c 4\n# comment\n#SBATCH --mem=1G\necho hi\n#SBATCH -n 2\n"
+    assert sbatch_directives(script) == ["#SBATCH -c 4", "#SBATCH --mem=1G"]
+
+
+def test_identical_scripts_are_submitted_as_array(sbatch) -> None:
+    schedules = [
+        make_schedule("#!/bin/bash\n#SBATCH -c 4\necho hi\n") for _ in range(3)
+    ]
+    results = SlurmCluster().submit_jobs(schedules)
+
+    assert sbatch.call_count == 1
+    assert "--array=0-2" in sbatch.call_args.args[0]
+    assert [result.job_id for result in results] == ["100_0", "100_1", "100_2"]
+    assert [result.schedule for result in results] == schedules
+
+
+def test_heterogeneous_scripts_are_submitted_individually(sbatch) -> None:
+    schedules = [
+        make_schedule("echo a"),
+        make_schedule("echo b"),
+        make_schedule("echo a"),
+    ]
+    results = SlurmCluster().submit_jobs(schedules)
+
+    assert sbatch.call_count == 2
+    assert [result.job_id for result in results] == ["100_0", "101", "100_1"]
+
+
+def test_failed_array_falls_back_to_individual_jobs(sbatch) -> None:
+    outputs = iter(["", "Submitted batch job 7", "Submitted batch job 8"])
+    sbatch.side_effect = lambda cmd: next(outputs)
+    schedules = [make_schedule("echo a") for _ in range(2)]
+    results = SlurmCluster().submit_jobs(schedules)
+
+    assert all(result.ok for result in results)
+    assert [result.job_id for result in results] == ["7", "8"]
+
+
+@pytest.fixture
+def messenger(mocker):
+    return mocker.patch("blackcap.cluster.base.messenger")
+
+
+def test_submitted_schedule_msg_is_acked(sbatch, messenger) -> None:
+    messenger.parse_messenger_msg.return_value.data = make_schedule("echo a")
+    SlurmCluster().process_schedule_msg("msg")
+
+    assert sbatch.call_count == 1
+    messenger.ack_msg.assert_called_once_with("msg")
+    messenger.nack_msg.assert_not_called()
+
+
+def test_unparsable_schedule_msg_is_acked(sbatch, messenger) -> None:
+    messenger.parse_messenger_msg.side_effect = ValueError("invalid msg")
+    SlurmCluster().process_schedule_msg("msg")
+
+    sbatch.assert_not_called()
+    messenger.ack_msg.assert_called_once_with("msg")
+    messenger.nack_msg.assert_not_called()
+
+
+def test_rejected_schedule_msg_is_acked(sbatch, messenger) -> None:
+    sbatch.side_effect = lambda cmd: ""
+    messenger.parse_messenger_msg.return_value.data = make_schedule("echo a")
+    SlurmCluster().process_schedule_msg("msg")
+
+    messenger.ack_msg.assert_called_once_with("msg")
+    messenger.nack_msg.assert_not_called()
+
+
+def test_timed_out_schedule_msg_is_nacked(sbatch, messenger) -> None:
+    sbatch.side_effect = subprocess.TimeoutExpired(["sbatch"], 30)
+    messenger.parse_messenger_msg.return_value.data = make_schedule("echo a")
+    SlurmCluster().process_schedule_msg("msg")
+
+    messenger.nack_msg.assert_called_once_with("msg")
+    messenger.ack_msg.assert_not_called()
+
+
+def test_expand_job_ids() -> None:
+    assert expand_job_ids("45") == ["45"]
+    assert expand_job_ids("45_3") == ["45_3"]
+    assert expand_job_ids("45_[0-2,7%4]") == ["45_0", "45_1", "45_2", "45_7"]
+
+
+def test_get_jobs_status_uses_single_sacct_call(mocker) -> None:
+    output = "\n".join(
+        [
+            "40|COMPLETED|0:0",
+            "41|CANCELLED by 1000|0:15",
+            "45_0|RUNNING|0:0",
+            "45_[1-2]|PENDING|0:0",
+        ]
+    )
+    sacct = mocker.patch("blackcap.cluster.slurm_cluster.call_cli", return_value=output)
+    statuses = SlurmCluster().get_jobs_status(["40", "41", "45_0", "45_2", "99"])
+
+    assert sacct.call_count == 1
+    assert "40,41,45_0,45_2,99" in sacct.call_args.args[0]
+    assert {job_id: status.status for job_id, status in statuses.items()} == {
+        "40": "COMPLETED",
+        "41": "FAILED",
+        "45_0": "RUNNING",
+        "45_2": "SUBMITTED",
+    }
@@ -0,0 +1,206 @@
+"""Slurm REST cluster unit tests."""
+
+# flake8: noqa
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+import pytest
+from requests import ConnectionError as RequestConnectionError
+
+from blackcap.cluster.base import config
+from blackcap.cluster.slurm_rest_cluster import SlurmRestCluster, SlurmRestError
+from blackcap.schemas.job import Job
+from blackcap.schemas.schedule import Schedule
+
+
+class StubSlurmrestd(BaseHTTPRequestHandler):
+    """Minimal slurmrestd keeping jobs in memory."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def reply(self, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def handle_one_request(self) -> None:
+        self.server.connections.add(self.client_address)
+        super().handle_one_request()
+
+    def do_POST(self) -> None:
+        length = int(self.headers["Content-Length"])
+        body = json.loads(self.rfile.read(length))
+        self.server.submissions.append(body)
+        job_id = len(self.server.jobs) + 100
+        self.server.jobs[str(job_id)] = "PENDING"
+        self.reply(200, {"job_id": job_id, "errors": []})
+
+    def do_GET(self) -> None:
+        self.server.requests.append(self.path)
+        path, _, query = self.path.partition("?")
+        if path.startswith("/slurmdb/"):
+            job_ids = parse_qs(query).get("step", [""])[0].split(",")
+            jobs = [self.server.db_jobs[j] for j in job_ids if j in self.server.db_jobs]
+            return self.reply(200, {"jobs": jobs, "errors": []})
+        job_id = path.rsplit("/", 1)[-1]
+        jobs = []
+        for key, state in self.server.jobs.items():
+            parent_id, _, task_id = key.partition("_")
+            if parent_id != job_id:
+                continue
+            job = {"job_id": int(parent_id), "job_state": state}
+            if task_id:
+                job.update(array_job_id=int(parent_id), array_task_id=int(task_id))
+            jobs.append(job)
+        if len(jobs) == 0:
+            return self.reply(404, {"errors": [{"error": "Invalid job id"}]})
+        self.reply(200, {"jobs": jobs})
+
+    def do_DELETE(self) -> None:
+        self.server.jobs[self.path.rsplit("/", 1)[-1]] = "CANCELLED"
+        self.reply(200, {"errors": []})
+
+
+@pytest.fixture
+def slurmrestd(monkeypatch, mocker, tmp_path):
+    mocker.patch("blackcap.cluster.slurm_cluster.xdg_data_home", return_value=tmp_path)
+    mocker.patch(
+        "blackcap.cluster.slurm_rest_cluster.xdg_data_home", return_value=tmp_path
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSlurmrestd)
+    server.jobs, server.submissions, server.connections = {}, [], set()
+    server.db_jobs, server.requests = {}, []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        config, "SLURM_REST_URL", f"http://127.0.0.1:{server.server_port}"
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_schedule(script: str = "#!/bin/bash\necho hi\n") -> Schedule:
+    job_id = uuid4()
+    return Schedule(
+        schedule_id=uuid4(),
+        job_id=job_id,
+        job=Job(job_id=job_id, name="job", script=script),
+        assigned_cluster_id=uuid4(),
+        messenger="NATS",
+        messenger_queue="test",
+    )
+
+
+def test_submit_status_and_cancel(slurmrestd) -> None:
+    cluster = SlurmRestCluster()
+    job_id = cluster.submit_job(make_schedule())
+
+    assert slurmrestd.submissions[0]["script"] == "#!/bin/bash\necho hi\n"
+    assert cluster.get_job_status(job_id) == ["PENDING"]
+    cluster.cancel_job(job_id)
+    assert cluster.get_jobs_status([job_id, "999"])[job_id].status == "FAILED"
+    with pytest.raises(SlurmRestError):
+        cluster.get_job_status("999")
+    cluster.close()
+
+
+def test_only_unavailable_slurmrestd_errors_are_transient() -> None:
+    cluster = SlurmRestCluster()
+
+    assert cluster.is_transient_error(SlurmRestError("unavailable", 503))
+    assert cluster.is_transient_error(RequestConnectionError("refused"))
+    assert not cluster.is_transient_error(SlurmRestError("rejected", 400))
+    assert not cluster.is_transient_error(KeyError("job_id"))
+    cluster.close()
+
+
+def test_jobs_status_falls_back_to_slurmdbd(slurmrestd) -> None:
+    cluster = SlurmRestCluster()
+    slurmrestd.jobs.update({"100": "RUNNING", "104_0": "RUNNING", "104_1": "PENDING"})
+    # Finished more than MinJobAge ago, only slurmdbd still knows them
+    slurmrestd.db_jobs["101"] = {
+        "job_id": 101,
+        "state": {"current": "COMPLETED"},
+        "exit_code": {"return_code": 0},
+    }
+    slurmrestd.db_jobs["102_1"] = {
+        "job_id": 103,
+        "array": {"job_id": 102, "task_id": 1},
+        "state": {"current": ["FAILED"]},
+        "exit_code": {"return_code": 1},
+    }
+
+    statuses = cluster.get_jobs_status(["100", "101", "102_1", "104_0", "104_1", "999"])
+    assert {job_id: status.state for job_id, status in statuses.items()} == {
+        "100": "RUNNING",
+        "101": "COMPLETED",
+        "102_1": "FAILED",
+        "104_0": "RUNNING",
+        "104_1": "PENDING",
+    }
+    assert statuses["102_1"].exit_code == "1"
+    # One request per job in slurmctld, array tasks share one, then a single
+    # request to slurmdbd for all the missing jobs
+    assert [path.split("?")[0] for path in slurmrestd.requests] == [
+        "/slurm/v0.0.38/job/100",
+        "/slurm/v0.0.38/job/101",
+        "/slurm/v0.0.38/job/102",
+        "/slurm/v0.0.38/job/104",
+        "/slurm/v0.0.38/job/999",
+        "/slurmdb/v0.0.38/jobs",
+    ]
+    assert "step=101%2C102_1%2C999" in slurmrestd.requests[-1]
+    cluster.close()
+
+
+def test_jobs_status_lookups_are_capped(slurmrestd, monkeypatch) -> None:
+    monkeypatch.setattr(config, "SLURM_REST_STATUS_MAX_LOOKUPS", 2)
+    monkeypatch.setattr(config, "SLURM_REST_STATUS_MAX_DB_JOBS", 3)
+    cluster = SlurmRestCluster()
+    job_ids = [str(job_id) for job_id in range(100, 110)]
+    slurmrestd.jobs.update({job_id: "RUNNING" for job_id in job_ids})
+    slurmrestd.db_jobs.update(
+        {
+            job_id: {"job_id": int(job_id), "state": {"current": "RUNNING"}}
+            for job_id in job_ids
+        }
+    )
+
+    statuses = cluster.get_jobs_status(job_ids)
+    assert list(statuses) == job_ids[:5]
+    assert len(slurmrestd.requests) == 3
+    assert "step=102%2C103%2C104" in slurmrestd.requests[-1]
+    cluster.close()
+
+
+def test_requests_reuse_pooled_connections(slurmrestd) -> None:
+    cluster = SlurmRestCluster()
+    results = cluster.submit_jobs(
+        [make_schedule(f"echo {n}") for n in range(20)], max_workers=4
+    )
+
+    assert all(result.ok for result in results)
+    # 20 requests over at most one connection per worker
+    assert len(slurmrestd.connections) <= 4
+    cluster.close()
+
+
+def test_identical_scripts_are_submitted_as_array(slurmrestd) -> None:
+    cluster = SlurmRestCluster()
+    results = cluster.submit_jobs([make_schedule() for _ in range(3)])
+
+    assert len(slurmrestd.submissions) == 1
+    assert slurmrestd.submissions[0]["job"]["array"] == "0-2"
+    assert [result.job_id for result in results] == ["100_0", "100_1", "100_2"]
+    cluster.close()
@@ -0,0 +1,76 @@
+"""Async flow executor tests."""
+
+# flake8: noqa
+
+import asyncio
+import threading
+import time
+from typing import List
+
+from blackcap.flow import AsyncExecutor, DAGFlow, Flow, FlowStatus, FuncProp, Prop, Step
+
+
+async def async_db_write(inputs: List[Prop]) -> List[Prop]:
+    await asyncio.sleep(0.2)
+    return [Prop(data=inputs[0].data + 1, description="db write")]
+
+
+def sync_publish(inputs: List[Prop]) -> List[Prop]:
+    time.sleep(0.2)
+    return [
+        Prop(
+            data=threading.current_thread() is threading.main_thread(),
+            description="publish",
+        )
+    ]
+
+
+async def async_fail(inputs: List[Prop]) -> List[Prop]:
+    raise ValueError("async step failed")
+
+
+def test_sync_and_async_steps_overlap() -> None:
+    flow = DAGFlow()
+    db = flow.add_step(
+        Step(async_db_write, lambda p: p), [Prop(data=1, description="x")]
+    )
+    pub = flow.add_step(Step(sync_publish, lambda p: p), [])
+
+    start = time.perf_counter()
+    executed = AsyncExecutor(flow, {}, hooks=[]).run()
+    duration = time.perf_counter() - start
+
+    assert executed.status == FlowStatus.PASSED
+    assert executed.forward_outputs[db][0].data == 2
+    # Sync steps run off the loop thread
+    assert executed.forward_outputs[pub][0].data is False
+    assert duration < 0.35
+
+
+def test_linear_flow_with_async_func_prop_and_compensation() -> None:
+    reverted = []
+
+    async def revert(inputs: List[Prop]) -> List[Prop]:
+        reverted.append(inputs[-1].data)
+        return []
+
+    async def lookup(index: int) -> List[Prop]:
+        return [Prop(data=index * 100, description="lookup")]
+
+    flow = Flow()
+    flow.add_step(Step(async_db_write, revert), [Prop(data=1, description="x")])
+    flow.add_step(
+        Step(async_db_write, revert),
+        [FuncProp(func=lookup, params={"index": 5}, description="async lookup")],
+    )
+    flow.add_step(Step(async_fail, revert), [])
+
+    async def main():
+        return await AsyncExecutor(flow, {}, hooks=[]).run_async()
+
+    executed = asyncio.run(main())
+
+    assert executed.status == FlowStatus.FAILED
+    assert executed.errors[0].step_index == 2
+    assert [outputs[0].data for outputs in executed.forward_outputs[:2]] == [2, 501]
+    assert reverted == [501, 2]
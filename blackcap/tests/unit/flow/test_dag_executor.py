@@ -0,0 +1,106 @@
+"""DAG flow executor tests."""
+
+# flake8: noqa
+
+import threading
+import time
+from typing import List
+
+import pytest
+
+from blackcap.flow import (
+    DAGExecutor,
+    DAGFlow,
+    FlowStatus,
+    Prop,
+    Step,
+)
+from blackcap.flow.executor import StepGraph
+from blackcap.flow.flow import FlowBuildError
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.forward = []
+        self.backward = []
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def step(
+        self, name: str, sleep: float = 0.0, fail: bool = False, sync: bool = False
+    ):
+        def forward(inputs: List[Prop]) -> List[Prop]:
+            if sync:
+                # Only passes if the other synced step runs at the same time
+                self.barrier.wait()
+            time.sleep(sleep)
+            if fail:
+                raise ValueError(f"{name} failed")
+            with self.lock:
+                self.forward.append(name)
+            total = sum(prop.data for prop in inputs if isinstance(prop.data, int))
+            return [Prop(data=total + 1, description=name)]
+
+        def backward(inputs: List[Prop]) -> List[Prop]:
+            with self.lock:
+                self.backward.append(name)
+            return []
+
+        forward.__name__ = name
+        return Step(forward, backward)
+
+
+def test_independent_steps_run_concurrently() -> None:
+    recorder = Recorder()
+    flow = DAGFlow()
+    a = flow.add_step(recorder.step("a", sync=True), [Prop(data=1, description="x")])
+    b = flow.add_step(recorder.step("b", sync=True), [Prop(data=10, description="y")])
+    c = flow.add_step(
+        recorder.step("c"),
+        [flow.output_of(a, "a output"), flow.output_of(b, "b output")],
+    )
+    assert flow.dependencies == [[], [], [a, b]]
+
+    executed = DAGExecutor(flow, {}, hooks=[]).run()
+
+    assert executed.status == FlowStatus.PASSED
+    assert recorder.forward[-1] == "c"
+    assert executed.forward_outputs[c][0].data == (1 + 1) + (10 + 1) + 1
+
+
+def test_failure_reverts_completed_steps_in_reverse_order() -> None:
+    recorder = Recorder()
+    flow = DAGFlow()
+    a = flow.add_step(recorder.step("a"), [Prop(data=1, description="x")])
+    b = flow.add_step(recorder.step("b"), [flow.output_of(a, "a output")])
+    c = flow.add_step(recorder.step("c", sleep=0.05, fail=True), [], after=[a])
+    d = flow.add_step(recorder.step("d"), [flow.output_of(c, "c output")])
+
+    executed = DAGExecutor(flow, {}, hooks=[]).run()
+
+    assert executed.status == FlowStatus.FAILED
+    assert [error.step_index for error in executed.errors] == [c]
+    assert "d" not in recorder.forward
+    assert recorder.backward == list(reversed(recorder.forward))
+    assert set(recorder.backward) == {"a", "b"}
+
+
+def test_rejects_unknown_dependency() -> None:
+    flow = DAGFlow()
+    with pytest.raises(FlowBuildError):
+        flow.add_step(Recorder().step("a"), [], after=[0])
+
+
+def test_step_graph_ready_steps() -> None:
+    # 0 -> 1, 0 -> 2, (1, 2) -> 3
+    graph = StepGraph([[], [0], [0], [1, 2]])
+    assert graph.roots() == [0]
+    assert graph.mark_passed(0) == [1, 2]
+    assert graph.mark_passed(1) == []
+    assert graph.mark_passed(2) == [3]
+
+    graph = StepGraph([[], [], [0, 1]])
+    graph.mark_failed(1)
+    assert graph.mark_passed(0) == []
+    assert graph.completed == [0]
+    assert graph.failed_index == 1
@@ -0,0 +1,38 @@
+"""Flow object tests."""
+
+# flake8: noqa
+
+from blackcap.flow import FlowExecError, get_outer_function
+
+
+def test_get_outer_function() -> None:
+    def bloc_step() -> str:
+        return get_outer_function()
+
+    assert bloc_step() == "bloc_step"
+
+
+def test_format_traceback_is_lazy() -> None:
+    def bloc_step() -> FlowExecError:
+        try:
+            raise KeyError("missing")
+        except KeyError as e:
+            return FlowExecError(
+                human_description="Parsing inputs failed",
+                error=e,
+                error_type=type(e),
+                error_in_function=get_outer_function(),
+            )
+
+    flow_error = bloc_step()
+    assert flow_error.error_in_function == "bloc_step"
+    rendered = flow_error.format_traceback()
+    assert "KeyError: 'missing'" in rendered
+    assert 'raise KeyError("missing")' in rendered
+
+    assert (
+        FlowExecError(
+            human_description="", error="text", error_type=str, error_in_function=""
+        ).format_traceback()
+        == ""
+    )
@@ -0,0 +1,191 @@
+"""Flow instrumentation tests."""
+
+# flake8: noqa
+
+from typing import List
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode
+
+from blackcap.flow import (
+    AsyncExecutor,
+    DurationCollector,
+    Executor,
+    Flow,
+    FlowHooks,
+    FlowStatus,
+    FuncProp,
+    OTelSpanExporter,
+    Prop,
+    Step,
+)
+
+
+def first(inputs: List[Prop]) -> List[Prop]:
+    return [Prop(data=inputs[0].data + 1, description="first")]
+
+
+def second(inputs: List[Prop]) -> List[Prop]:
+    return [Prop(data=inputs[0].data * 2, description="second")]
+
+
+def broken(inputs: List[Prop]) -> List[Prop]:
+    raise ValueError("broken step")
+
+
+def undo(inputs: List[Prop]) -> List[Prop]:
+    return inputs
+
+
+def build_flow(last_step=second) -> Flow:
+    flow = Flow()
+    flow.add_step(Step(first, undo), [Prop(data=1, description="input")])
+    flow.add_step(
+        Step(last_step, undo),
+        [
+            FuncProp(
+                func=flow.get_froward_output,
+                params={"index": 0},
+                description="first output",
+            )
+        ],
+    )
+    return flow
+
+
+class RecordingHooks(FlowHooks):
+    def __init__(self) -> None:
+        self.events = []
+
+    def on_flow_start(self, flow):
+        self.events.append("flow_start")
+
+    def on_flow_end(self, flow, duration):
+        self.events.append(f"flow_end {flow.status.value}")
+
+    def on_step_start(self, flow, index):
+        self.events.append(f"step_start {index}")
+
+    def on_step_end(self, flow, index, duration, error):
+        self.events.append(f"step_end {index} {type(error).__name__}")
+
+    def on_func_prop_start(self, flow, index, func_prop):
+        self.events.append(f"func_prop_start {index}")
+
+    def on_func_prop_end(self, flow, index, func_prop, duration, error):
+        self.events.append(f"func_prop_end {index}")
+
+    def on_backward_start(self, flow, index):
+        self.events.append(f"backward_start {index}")
+
+    def on_backward_end(self, flow, index, duration, error):
+        self.events.append(f"backward_end {index}")
+
+
+class FailingHooks(FlowHooks):
+    def on_step_start(self, flow, index):
+        raise RuntimeError("broken hook")
+
+
+def test_hooks_called_in_order() -> None:
+    hooks = RecordingHooks()
+    flow = Executor(build_flow(), {}, hooks=[hooks, FailingHooks()]).run()
+    assert flow.status == FlowStatus.PASSED
+    assert flow.forward_outputs[1][0].data == 4
+    assert hooks.events == [
+        "flow_start",
+        "step_start 0",
+        "step_end 0 NoneType",
+        "step_start 1",
+        "func_prop_start 1",
+        "func_prop_end 1",
+        "step_end 1 NoneType",
+        "flow_end PASSED",
+    ]
+
+
+def test_hooks_see_failure_and_backward_calls() -> None:
+    hooks = RecordingHooks()
+    flow = Executor(build_flow(broken), {}, hooks=[hooks]).run()
+    assert flow.status == FlowStatus.FAILED
+    assert hooks.events[-4:] == [
+        "step_end 1 ValueError",
+        "backward_start 0",
+        "backward_end 0",
+        "flow_end FAILED",
+    ]
+
+
+@pytest.mark.parametrize("executor_class", [Executor, AsyncExecutor])
+def test_executors_report_func_prop_and_backward_failures_alike(
+    executor_class,
+) -> None:
+    def lookup() -> List[Prop]:
+        raise KeyError("missing output")
+
+    def failing_undo(inputs: List[Prop]) -> List[Prop]:
+        raise RuntimeError("undo failed")
+
+    flow = Flow()
+    flow.add_step(Step(first, failing_undo), [Prop(data=1, description="input")])
+    flow.add_step(
+        Step(second, undo), [FuncProp(func=lookup, params={}, description="lookup")]
+    )
+    hooks = RecordingHooks()
+    flow = executor_class(flow, {}, hooks=[hooks]).run()
+
+    assert flow.status == FlowStatus.FAILED
+    assert [
+        (error.human_description, error.step_index) for error in flow.errors
+    ] == [("A forward step function failed", 1), ("A backward step function failed", 1)]
+    assert hooks.events[-6:] == [
+        "func_prop_start 1",
+        "func_prop_end 1",
+        "step_end 1 FlowExecError",
+        "backward_start 0",
+        "backward_end 0",
+        "flow_end FAILED",
+    ]
+
+
+def test_duration_collector() -> None:
+    collector = DurationCollector()
+    Executor(build_flow(), {}, hooks=[collector]).run()
+    Executor(build_flow(broken), {}, hooks=[collector]).run()
+    latency = collector.latency.snapshot()
+    assert latency["first"]["count"] == 2
+    assert latency["second"]["count"] == 1
+    assert latency["broken"]["count"] == 1
+    assert latency["first.backward"]["count"] == 1
+
+
+def test_otel_span_exporter() -> None:
+    span_exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    exporter = OTelSpanExporter(provider.get_tracer("test"))
+
+    Executor(build_flow(broken), {}, hooks=[exporter]).run()
+
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    assert set(spans) == {
+        "flow",
+        "step first",
+        "step broken",
+        "func_prop first output",
+        "backward first",
+    }
+    flow_span = spans["flow"]
+    assert flow_span.attributes["flow.status"] == "FAILED"
+    assert spans["step first"].parent.span_id == flow_span.context.span_id
+    assert (
+        spans["func_prop first output"].parent.span_id
+        == spans["step broken"].context.span_id
+    )
+    assert spans["step broken"].status.status_code == StatusCode.ERROR
+    assert spans["backward first"].parent.span_id == flow_span.context.span_id
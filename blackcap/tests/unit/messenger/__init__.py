@@ -0,0 +1 @@
+"""Messenger unit tests."""
@@ -0,0 +1,58 @@
+"""asyncio messenger unit tests."""
+# flake8: noqa
+
+import asyncio
+from typing import Dict
+
+from blackcap.messenger.async_base import AsyncBaseMessenger, bounded_callback
+
+
+class EchoMessenger(AsyncBaseMessenger):
+    CONFIG_KEY_VAL = "ECHO"
+
+    async def publish(self, msg: Dict, topic_id: str) -> str:
+        await asyncio.sleep(0)
+        if msg["fail"]:
+            raise ConnectionError("boom")
+        return str(msg["n"])
+
+    async def subscribe(self, callback, sub_id, timeout=None) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def parse_messenger_msg(self, messenger_msg):
+        pass
+
+
+def test_async_publish_many_reports_partial_failures() -> None:
+    msgs = [{"n": n, "fail": n == 2} for n in range(4)]
+    results = asyncio.run(EchoMessenger().publish_many(msgs, "topic"))
+    assert [result.ok for result in results] == [True, True, False, True]
+    assert results[3].msg_id == "3"
+
+
+def test_bounded_callback_limits_in_flight_msgs() -> None:
+    in_flight = 0
+    peak = 0
+    handled = []
+
+    async def callback(msg: int) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        handled.append(msg)
+
+    async def run() -> None:
+        wrapped = bounded_callback(callback, 3)
+        for msg in range(10):
+            await wrapped(msg)
+        while len(handled) < 10:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert peak == 3
+    assert sorted(handled) == list(range(10))
@@ -0,0 +1,34 @@
+"""Base messenger unit tests."""
+# flake8: noqa
+
+from typing import Callable, Dict, Optional
+
+from blackcap.messenger.base import BaseMessenger
+
+
+class FlakyMessenger(BaseMessenger):
+    CONFIG_KEY_VAL = "FLAKY"
+
+    def publish(self, msg: Dict, topic_id: str) -> str:
+        if msg["fail"]:
+            raise ConnectionError("boom")
+        return f"{topic_id}-{msg['n']}"
+
+    def subscribe(
+        self, callback: Callable, sub_id: str, timeout: Optional[float] = None
+    ) -> None:
+        pass
+
+    def parse_messenger_msg(self, messenger_msg):
+        pass
+
+
+def test_publish_many_reports_partial_failures() -> None:
+    msgs = [{"n": n, "fail": n == 1} for n in range(3)]
+    results = FlakyMessenger().publish_many(msgs, "topic")
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].msg_id == "topic-0"
+    assert results[2].msg_id == "topic-2"
+    assert isinstance(results[1].error, ConnectionError)
+    assert results[1].msg is msgs[1]
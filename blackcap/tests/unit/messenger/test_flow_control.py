@@ -0,0 +1,61 @@
+"""Subscription flow control unit tests."""
+
+# flake8: noqa
+
+import threading
+import time
+
+from blackcap.messenger.flow_control import BoundedDispatcher, FlowControl
+
+
+def test_dispatcher_caps_outstanding_msgs() -> None:
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def callback(msg) -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    dispatcher = BoundedDispatcher(
+        callback, FlowControl(max_messages=3, max_bytes=1024, workers=8)
+    )
+    futures = [dispatcher.dispatch(n, size=10) for n in range(20)]
+    dispatcher.shutdown(wait=True)
+
+    assert all(future.done() for future in futures)
+    assert peak <= 3
+
+
+def test_dispatcher_caps_outstanding_bytes() -> None:
+    release = threading.Event()
+    dispatcher = BoundedDispatcher(
+        lambda msg: release.wait(), FlowControl(max_messages=10, max_bytes=100)
+    )
+    dispatcher.dispatch("a", size=60)
+
+    blocked = threading.Thread(target=dispatcher.dispatch, args=("b", 60))
+    blocked.start()
+    blocked.join(0.05)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(1)
+    assert not blocked.is_alive()
+    dispatcher.shutdown(wait=True)
+
+
+def test_dispatcher_survives_callback_errors() -> None:
+    def callback(msg) -> None:
+        raise ValueError(msg)
+
+    dispatcher = BoundedDispatcher(callback, FlowControl(max_messages=1))
+    futures = [dispatcher.dispatch(n) for n in range(3)]
+    dispatcher.shutdown(wait=True)
+
+    assert all(isinstance(future.exception(), ValueError) for future in futures)
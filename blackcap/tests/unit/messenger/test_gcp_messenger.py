@@ -0,0 +1,66 @@
+"""GCP messenger unit tests."""
+
+# flake8: noqa
+
+import os
+
+from blackcap.configs import config_registry
+from blackcap.messenger.flow_control import FlowControl
+from blackcap.messenger.gcp_messenger import GCPMessenger
+
+config = config_registry.get_config()
+
+
+def test_publisher_client_is_cached(mocker) -> None:
+    mocker.patch.object(GCPMessenger, "service_account_info", {})
+    from_info = mocker.patch(
+        "blackcap.messenger.gcp_messenger.jwt.Credentials.from_service_account_info"
+    )
+    from_info.return_value.expiry = None
+    client_cls = mocker.patch(
+        "blackcap.messenger.gcp_messenger.pubsub_v1.PublisherClient"
+    )
+    messenger = GCPMessenger(config)
+
+    assert messenger.publisher is messenger.publisher
+    assert client_cls.call_count == 1
+    assert from_info.call_count == 1
+
+
+def test_clients_are_dropped_in_forked_child(mocker) -> None:
+    mocker.patch.object(GCPMessenger, "service_account_info", {})
+    from_info = mocker.patch(
+        "blackcap.messenger.gcp_messenger.jwt.Credentials.from_service_account_info"
+    )
+    from_info.return_value.expiry = None
+    client_cls = mocker.patch(
+        "blackcap.messenger.gcp_messenger.pubsub_v1.PublisherClient"
+    )
+    messenger = GCPMessenger(config)
+    messenger.publisher
+    messenger._pid = os.getpid() + 1
+    messenger.publisher
+
+    assert client_cls.call_count == 2
+
+
+def test_subscribe_applies_flow_control(mocker) -> None:
+    mocker.patch.object(GCPMessenger, "service_account_info", {})
+    from_info = mocker.patch(
+        "blackcap.messenger.gcp_messenger.jwt.Credentials.from_service_account_info"
+    )
+    from_info.return_value.expiry = None
+    client_cls = mocker.patch(
+        "blackcap.messenger.gcp_messenger.pubsub_v1.SubscriberClient"
+    )
+    messenger = GCPMessenger(config)
+    messenger.subscribe(
+        callback=print,
+        sub_id="sub",
+        flow_control=FlowControl(max_messages=7, max_bytes=1024, workers=2),
+    )
+
+    kwargs = client_cls.return_value.subscribe.call_args.kwargs
+    assert kwargs["flow_control"].max_messages == 7
+    assert kwargs["flow_control"].max_bytes == 1024
+    assert kwargs["scheduler"]._executor._max_workers == 2
@@ -0,0 +1,91 @@
+"""NATS messenger unit tests."""
+# flake8: noqa
+
+import socket
+import threading
+from typing import List
+
+import pytest
+
+from blackcap.configs import config_registry
+from blackcap.messenger.nats_messenger import NATSMessenger
+
+
+class FakeNATSServer:
+    """Just enough of the NATS protocol to accept publishes and pings."""
+
+    def __init__(self) -> None:
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.port = self.sock.getsockname()[1]
+        self.connections: List[socket.socket] = []
+        self.published: List[bytes] = []
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections.append(conn)
+            threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+
+    def handle(self, conn: socket.socket) -> None:
+        conn.sendall(b'INFO {"server_id":"fake"}\r\n')
+        stream = conn.makefile("rb")
+        try:
+            for line in stream:
+                if line.startswith(b"PING"):
+                    conn.sendall(b"PONG\r\n")
+                elif line.startswith(b"PUB"):
+                    self.published.append(stream.readline().strip())
+        except OSError:
+            pass
+
+    def drop_connections(self) -> None:
+        for conn in self.connections:
+            conn.shutdown(socket.SHUT_RDWR)
+            conn.close()
+
+
+@pytest.fixture
+def server() -> FakeNATSServer:
+    server = FakeNATSServer()
+    yield server
+    server.sock.close()
+
+
+@pytest.fixture
+def messenger(server: FakeNATSServer) -> NATSMessenger:
+    config = config_registry.get_config().copy()
+    config.NATS_ENDPOINT = f"nats://127.0.0.1:{server.port}"
+    config.NATS_RECONNECT_MAX_TIME = 2
+    messenger = NATSMessenger(config)
+    yield messenger
+    messenger.close()
+
+
+def test_publish_reuses_connection(
+    server: FakeNATSServer, messenger: NATSMessenger
+) -> None:
+    for n in range(5):
+        messenger.publish({"n": n}, "topic")
+    assert messenger.is_healthy()
+    assert len(server.connections) == 1
+    assert server.published == [b'{"n": %d}' % n for n in range(5)]
+
+
+def test_unhealthy_connection_is_replaced(
+    server: FakeNATSServer, messenger: NATSMessenger
+) -> None:
+    messenger.publish({"n": 0}, "topic")
+    server.drop_connections()
+    assert not messenger.is_healthy()
+
+    messenger.config.NATS_PING_INTERVAL = 0
+    messenger.publish({"n": 1}, "topic")
+    assert messenger.is_healthy()
+    assert len(server.connections) == 2
+    assert server.published[-1] == b'{"n": 1}'
@@ -0,0 +1,85 @@
+"""CRUD mixin tests."""
+
+# flake8: noqa
+
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from blackcap.models.meta import mixins
+from blackcap.models.meta.mixins import DBModel
+from blackcap.models.schedule import ScheduleDB
+
+
+@pytest.fixture
+def DBSession() -> sessionmaker:
+    engine = create_engine("sqlite://")
+    DBModel.metadata.create_all(engine)
+    yield sessionmaker(engine)
+    engine.dispose()
+
+
+def create_schedules(DBSession: sessionmaker, protagonist_id_list: list) -> list:
+    schedule_db_list = [
+        ScheduleDB(
+            id=uuid4(),
+            job_id=uuid4(),
+            assigned_cluster_id=uuid4(),
+            protagonist_id=protagonist_id,
+        )
+        for protagonist_id in protagonist_id_list
+    ]
+    with DBSession() as session:
+        ScheduleDB.bulk_create(schedule_db_list, session)
+        return [(s.id, s.protagonist_id) for s in schedule_db_list]
+
+
+def get_status(DBSession: sessionmaker) -> dict:
+    with DBSession() as session:
+        stmt = select(ScheduleDB.id, ScheduleDB.status)
+        return dict(session.execute(stmt).all())
+
+
+@mock.patch.object(mixins, "QUERY_CHUNK_SIZE", 2)
+def test_bulk_update_applies_criteria_to_every_chunk(DBSession) -> None:
+    alice, bob = uuid4(), uuid4()
+    schedule_list = create_schedules(DBSession, [alice, bob, bob, alice, bob, alice])
+    values_list = [
+        {"id": schedule_id, "status": f"DONE {index}"}
+        for index, (schedule_id, _) in enumerate(schedule_list)
+    ]
+
+    with DBSession() as session:
+        updated_row_list = ScheduleDB.bulk_update(
+            values_list, session, ScheduleDB.protagonist_id == alice
+        )
+
+    alice_ids = {schedule_id for schedule_id, owner in schedule_list if owner == alice}
+    assert {row["id"] for row in updated_row_list} == alice_ids
+    status_dict = get_status(DBSession)
+    for index, (schedule_id, owner) in enumerate(schedule_list):
+        expected = f"DONE {index}" if owner == alice else "PENDING"
+        assert status_dict[schedule_id] == expected
+
+
+@mock.patch.object(mixins, "QUERY_CHUNK_SIZE", 2)
+def test_bulk_delete_applies_criteria_to_every_chunk(DBSession) -> None:
+    alice, bob = uuid4(), uuid4()
+    schedule_list = create_schedules(DBSession, [alice, bob, bob, alice, bob, alice])
+
+    with DBSession() as session:
+        deleted_row_list = ScheduleDB.bulk_delete(
+            [schedule_id for schedule_id, _ in schedule_list],
+            session,
+            ScheduleDB.protagonist_id == alice,
+        )
+
+    assert {row["id"] for row in deleted_row_list} == {
+        schedule_id for schedule_id, owner in schedule_list if owner == alice
+    }
+    assert set(get_status(DBSession)) == {
+        schedule_id for schedule_id, owner in schedule_list if owner == bob
+    }
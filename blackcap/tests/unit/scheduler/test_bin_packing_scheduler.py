@@ -0,0 +1,89 @@
+"""Bin packing scheduler tests."""
+
+# flake8: noqa
+
+from collections import Counter
+from typing import List
+from uuid import uuid4
+
+from blackcap.observer.base import BaseObserver
+from blackcap.scheduler import scheduler_registry
+from blackcap.scheduler.base import BaseScheduler
+from blackcap.scheduler.bin_packing_scheduler import BinPackingScheduler
+from blackcap.scheduler.capabilities import CapabilityIndex
+from blackcap.scheduler.inventory import cluster_inventory
+from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
+from blackcap.schemas.metrics import Metrics
+
+
+class StaticObserver(BaseObserver):
+    def __init__(self, metrics_list: List[Metrics]) -> None:
+        self.metrics_list = metrics_list
+
+    def get_metrics(self, range: str) -> List[Metrics]:
+        return self.metrics_list
+
+
+def make_cluster(name: str, cluster_caps: str = None) -> Cluster:
+    return Cluster(
+        cluster_id=uuid4(),
+        name=name,
+        cluster_type="SLURM",
+        cluster_caps=cluster_caps,
+        messenger="NATS",
+        messenger_queue=f"{name}-topic",
+    )
+
+
+def test_registered() -> None:
+    assert isinstance(
+        scheduler_registry.get_scheduler("BIN_PACKING"), BinPackingScheduler
+    )
+
+
+def test_fills_clusters_in_proportion_to_capacity(monkeypatch) -> None:
+    big, small, full = make_cluster("big"), make_cluster("small"), make_cluster("full")
+    monkeypatch.setattr(
+        cluster_inventory, "get_index", lambda: CapabilityIndex([big, small, full])
+    )
+    observer = StaticObserver(
+        [
+            Metrics(cluster_id=big.cluster_id, free_cores=300),
+            Metrics(cluster_id=small.cluster_id, free_cores=100),
+            Metrics(cluster_id=full.cluster_id, free_cores=0, queued_jobs=1000),
+        ]
+    )
+    schedule_create_list = [ScheduleCreate(job_id=uuid4()) for _ in range(400)]
+    scheduled = BinPackingScheduler(observer).schedule_batch(schedule_create_list)
+    assert scheduled == schedule_create_list
+    counts = Counter(s.assigned_cluster_id for s in scheduled)
+    assert counts[big.cluster_id] == 300
+    assert counts[small.cluster_id] == 100
+    assert counts[full.cluster_id] == 0
+
+
+def test_constrained_requests_placed_first(monkeypatch) -> None:
+    cpu, gpu = make_cluster("cpu", "CPU"), make_cluster("gpu", "CPU,GPU")
+    monkeypatch.setattr(
+        cluster_inventory, "get_index", lambda: CapabilityIndex([cpu, gpu])
+    )
+    gpu_job_ids = {uuid4() for _ in range(10)}
+    monkeypatch.setattr(
+        BaseScheduler,
+        "get_cluster_caps_reqs",
+        lambda self, job_ids: {job_id: "GPU" for job_id in gpu_job_ids},
+    )
+    schedule_create_list = [ScheduleCreate(job_id=uuid4()) for _ in range(20)] + [
+        ScheduleCreate(job_id=job_id) for job_id in gpu_job_ids
+    ]
+    scheduled = BinPackingScheduler(StaticObserver([])).schedule_batch(
+        schedule_create_list
+    )
+    counts = Counter(s.assigned_cluster_id for s in scheduled)
+    assert all(
+        s.assigned_cluster_id == gpu.cluster_id
+        for s in scheduled
+        if s.job_id in gpu_job_ids
+    )
+    assert counts[cpu.cluster_id] == counts[gpu.cluster_id] == 15
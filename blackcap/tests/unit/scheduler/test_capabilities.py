@@ -0,0 +1,103 @@
+"""Cluster capabilities tests."""
+
+# flake8: noqa
+
+from uuid import uuid4
+
+import pytest
+
+from blackcap.blocs.job import create_job
+from blackcap.scheduler.capabilities import (
+    Capabilities,
+    CapabilityIndex,
+    UnsatisfiableJobError,
+)
+from blackcap.scheduler.inventory import cluster_inventory
+from blackcap.scheduler.random_scheduler import RandomScheduler
+from blackcap.schemas.api.job.post import JobCreate
+from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
+from blackcap.schemas.user import User
+
+
+def make_cluster(name: str, cluster_caps: str) -> Cluster:
+    return Cluster(
+        cluster_id=uuid4(),
+        name=name,
+        cluster_type="SLURM",
+        cluster_caps=cluster_caps,
+        messenger="NATS",
+        messenger_queue=f"{name}-topic",
+    )
+
+
+CPU = make_cluster("cpu", "CPU,cores=128,mem_gb=512")
+GPU = make_cluster("gpu", "cpu,gpu,cores=32,gpus=4")
+BARE = make_cluster("bare", None)
+INDEX = CapabilityIndex([CPU, GPU, BARE])
+
+
+def test_parse() -> None:
+    caps = Capabilities.parse(" CPU, gpu ,cores=64, mem_gb>=12.5,")
+    assert caps.tags == {"CPU", "GPU"}
+    assert caps.resources == {"CORES": 64.0, "MEM_GB": 12.5}
+    assert Capabilities.parse(None).is_empty
+    with pytest.raises(ValueError):
+        Capabilities.parse("cores=many")
+
+
+@pytest.mark.parametrize(
+    "cluster_caps_req,expected",
+    [
+        (None, {"cpu", "gpu", "bare"}),
+        ("CPU", {"cpu", "gpu"}),
+        ("GPU", {"gpu"}),
+        ("cores=64", {"cpu"}),
+        ("cores=32", {"cpu", "gpu"}),
+        ("GPU,cores=64", set()),
+        ("FPGA", set()),
+        ("tpus=1", set()),
+    ],
+)
+def test_index_matches_like_satisfies(cluster_caps_req, expected) -> None:
+    requirements = Capabilities.parse(cluster_caps_req)
+    matched = {cluster.name for cluster in INDEX.match(requirements)}
+    assert matched == expected
+    assert matched == {
+        cluster.name
+        for cluster in (CPU, GPU, BARE)
+        if Capabilities.parse(cluster.cluster_caps).satisfies(requirements)
+    }
+
+
+def test_scheduler_respects_requirements(monkeypatch, user: User) -> None:
+    monkeypatch.setattr(cluster_inventory, "get_index", lambda: INDEX)
+    gpu_job, fpga_job = create_job(
+        [
+            JobCreate(
+                name="gpu job",
+                description="",
+                script="hostname",
+                cluster_caps_req="GPU",
+            ),
+            JobCreate(
+                name="fpga job",
+                description="",
+                script="hostname",
+                cluster_caps_req="FPGA",
+            ),
+        ],
+        user,
+    )
+    scheduled = RandomScheduler().schedule_batch(
+        [ScheduleCreate(job_id=gpu_job.job_id) for _ in range(20)]
+    )
+    assert all(s.assigned_cluster_id == GPU.cluster_id for s in scheduled)
+
+    with pytest.raises(UnsatisfiableJobError):
+        RandomScheduler().schedule_batch(
+            [
+                ScheduleCreate(job_id=gpu_job.job_id),
+                ScheduleCreate(job_id=fpga_job.job_id),
+            ]
+        )
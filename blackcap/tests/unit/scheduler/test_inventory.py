@@ -0,0 +1,74 @@
+"""Cluster inventory tests."""
+
+# flake8: noqa
+
+from blackcap.blocs.cluster import create_cluster
+from blackcap.scheduler.capabilities import CapabilityIndex
+from blackcap.scheduler.inventory import ClusterInventory, cluster_inventory
+from blackcap.scheduler.random_scheduler import RandomScheduler
+from blackcap.schemas.api.cluster.post import ClusterCreate
+from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
+from blackcap.schemas.job import Job
+from blackcap.schemas.user import User
+
+
+class CountingInventory(ClusterInventory):
+    def __init__(self, ttl: float) -> None:
+        super().__init__(ttl)
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return super().load()
+
+
+def test_inventory_caches_clusters(cluster: Cluster) -> None:
+    inventory = CountingInventory(ttl=60.0)
+    for _ in range(10):
+        clusters = inventory.get_clusters()
+    assert inventory.loads == 1
+    assert cluster.cluster_id in [c.cluster_id for c in clusters]
+
+
+def test_inventory_expires_after_ttl(cluster: Cluster) -> None:
+    inventory = CountingInventory(ttl=0.0)
+    inventory.get_clusters()
+    inventory.get_clusters()
+    assert inventory.loads == 2
+
+
+def test_inventory_invalidated_by_cluster_blocs(user: User, cluster: Cluster) -> None:
+    cluster_inventory.get_clusters()
+    created = create_cluster(
+        [
+            ClusterCreate(
+                name="EBI_Embassy_02",
+                cluster_type="SLURM",
+                status="ACTIVE",
+                messenger="NATS",
+                messenger_queue="test-topic",
+            )
+        ],
+        user,
+    )[0]
+    assert created.cluster_id in [
+        c.cluster_id for c in cluster_inventory.get_clusters()
+    ]
+
+
+def test_schedule_batch_reads_inventory_once(
+    monkeypatch, job: Job, cluster: Cluster
+) -> None:
+    calls = []
+    monkeypatch.setattr(
+        cluster_inventory,
+        "get_index",
+        lambda: calls.append(1) or CapabilityIndex([cluster]),
+    )
+    scheduled = RandomScheduler().schedule_batch(
+        [ScheduleCreate(job_id=job.job_id) for _ in range(100)]
+    )
+    assert len(calls) == 1
+    assert all(s.assigned_cluster_id == cluster.cluster_id for s in scheduled)
+    assert all(s.messenger_queue == cluster.messenger_queue for s in scheduled)
@@ -0,0 +1,125 @@
+"""Least loaded scheduler tests."""
+
+# flake8: noqa
+
+from collections import Counter
+from typing import List
+from uuid import uuid4
+
+from blackcap.observer.base import BaseObserver
+from blackcap.observer.elastic_observer import ElasticObserver
+from blackcap.scheduler import scheduler_registry
+from blackcap.scheduler.capabilities import CapabilityIndex
+from blackcap.scheduler.inventory import cluster_inventory
+from blackcap.scheduler.least_loaded_scheduler import LeastLoadedScheduler
+from blackcap.schemas.api.schedule.post import ScheduleCreate
+from blackcap.schemas.cluster import Cluster
+from blackcap.schemas.metrics import Metrics
+
+
+class StaticObserver(BaseObserver):
+    def __init__(self, metrics_list: List[Metrics]) -> None:
+        self.metrics_list = metrics_list
+        self.calls = 0
+
+    def get_metrics(self, range: str) -> List[Metrics]:
+        self.calls += 1
+        return self.metrics_list
+
+
+def make_cluster(name: str) -> Cluster:
+    return Cluster(
+        cluster_id=uuid4(),
+        name=name,
+        cluster_type="SLURM",
+        cluster_caps=None,
+        messenger="NATS",
+        messenger_queue=f"{name}-topic",
+    )
+
+
+def test_registered() -> None:
+    assert isinstance(
+        scheduler_registry.get_scheduler("LEAST_LOADED"), LeastLoadedScheduler
+    )
+
+
+def test_avoids_saturated_cluster(monkeypatch) -> None:
+    busy, idle = make_cluster("busy"), make_cluster("idle")
+    monkeypatch.setattr(
+        cluster_inventory, "get_index", lambda: CapabilityIndex([busy, idle])
+    )
+    observer = StaticObserver(
+        [
+            Metrics(
+                cluster_id=busy.cluster_id,
+                queued_jobs=500,
+                total_cores=100,
+                free_cores=0,
+                completed_jobs=10,
+            ),
+            Metrics(
+                cluster_id=idle.cluster_id,
+                queued_jobs=0,
+                total_cores=100,
+                free_cores=100,
+                completed_jobs=10,
+            ),
+        ]
+    )
+    scheduler = LeastLoadedScheduler(observer)
+    scheduled = scheduler.schedule_batch(
+        [ScheduleCreate(job_id=uuid4()) for _ in range(50)]
+    )
+    assert all(s.assigned_cluster_id == idle.cluster_id for s in scheduled)
+    assert scheduled[0].messenger_queue == "idle-topic"
+    assert observer.calls == 1
+
+
+def test_batch_spreads_over_equal_clusters(monkeypatch) -> None:
+    clusters = [make_cluster(f"c{i}") for i in range(4)]
+    monkeypatch.setattr(
+        cluster_inventory, "get_index", lambda: CapabilityIndex(clusters)
+    )
+    scheduler = LeastLoadedScheduler(StaticObserver([]))
+    scheduled = scheduler.schedule_batch(
+        [ScheduleCreate(job_id=uuid4()) for _ in range(40)]
+    )
+    counts = Counter(s.assigned_cluster_id for s in scheduled)
+    assert sorted(counts.values()) == [10, 10, 10, 10]
+
+
+def test_elastic_observer_parses_aggregations() -> None:
+    cluster_id = uuid4()
+    body = {
+        "aggregations": {
+            "clusters": {
+                "buckets": [
+                    {
+                        "key": str(cluster_id),
+                        "latest": {
+                            "hits": {
+                                "hits": [
+                                    {
+                                        "_source": {
+                                            "queued_jobs": 3,
+                                            "running_jobs": 7,
+                                            "total_cores": 64,
+                                            "free_cores": 8,
+                                            "@timestamp": "2021-06-01T10:00:00Z",
+                                        }
+                                    }
+                                ]
+                            }
+                        },
+                        "completed_jobs": {"value": 42.0},
+                    }
+                ]
+            }
+        }
+    }
+    metrics = ElasticObserver().parse_response(body)
+    assert len(metrics) == 1
+    assert metrics[0].cluster_id == cluster_id
+    assert metrics[0].free_cores == 8
+    assert metrics[0].completed_jobs == 42
@@ -0,0 +1,56 @@
+"""Command runner unit tests."""
+
+# flake8: noqa
+
+import asyncio
+import subprocess
+import time
+
+import pytest
+
+from blackcap.utils.cli_commands import call_cli
+from blackcap.utils.command_runner import CommandRunner
+
+
+def test_call_cli_returns_stdout() -> None:
+    assert call_cli(["echo", "hello"]) == "hello\n"
+    assert call_cli(["cat"], input="piped") == "piped"
+
+
+def test_timeout_kills_command() -> None:
+    runner = CommandRunner(default_timeout=0.2)
+    start = time.perf_counter()
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run_sync(["sleep", "10"])
+    assert time.perf_counter() - start < 5
+
+
+def test_concurrency_is_bounded() -> None:
+    runner = CommandRunner(max_concurrency=2)
+    start = time.perf_counter()
+    results = runner.run_many_sync([["sleep", "0.2"]] * 4)
+    elapsed = time.perf_counter() - start
+
+    assert all(result.returncode == 0 for result in results)
+    assert 0.4 <= elapsed < 2
+
+
+def test_async_run_many_reports_failures() -> None:
+    runner = CommandRunner()
+    results = asyncio.run(
+        runner.run_many([["sh", "-c", "echo oops >&2; exit 3"], ["no-such-command"]])
+    )
+
+    assert results[0].returncode == 3
+    assert results[0].stderr == "oops\n"
+    assert isinstance(results[1], FileNotFoundError)
+
+
+def test_latency_histogram() -> None:
+    runner = CommandRunner()
+    runner.run_many_sync([["true"], ["true"], ["echo"]])
+    snapshot = runner.latency.snapshot()
+
+    assert snapshot["true"]["count"] == 2
+    assert snapshot["echo"]["count"] == 1
+    assert sum(snapshot["true"]["buckets"].values()) == 2
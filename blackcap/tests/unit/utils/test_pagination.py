@@ -0,0 +1,37 @@
+"""Keyset pagination unit tests."""
+
+# flake8: noqa
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from blackcap.schemas.api.job.get import JobGetQueryParams, JobQueryType
+from blackcap.utils.pagination import decode_cursor, encode_cursor, split_page
+
+
+def test_cursor_round_trip() -> None:
+    created_at, record_id = datetime(2022, 3, 4, 5, 6, 7, 89), uuid4()
+    assert decode_cursor(encode_cursor(created_at, record_id)) == (
+        created_at,
+        record_id,
+    )
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_invalid_cursor_fails_query_validation() -> None:
+    with pytest.raises(ValueError):
+        JobGetQueryParams(query_type=JobQueryType.GET_ALL_JOBS, cursor="bad")
+
+
+def test_split_page() -> None:
+    records = [SimpleNamespace(created_at=datetime.now(), id=uuid4()) for _ in range(3)]
+    assert split_page(records, None) == (records, None)
+    assert split_page(records, 3) == (records, None)
+
+    page, next_cursor = split_page(records, 2)
+    assert page == records[:2]
+    assert decode_cursor(next_cursor) == (records[1].created_at, records[1].id)
@@ -0,0 +1,57 @@
+"""Streaming JSON responses unit tests."""
+
+# flake8: noqa
+
+import json
+from typing import Iterator
+from uuid import uuid4
+
+from flask import Flask
+
+from blackcap.schemas.api.job.get import JobGetResponse
+from blackcap.schemas.job import Job
+from blackcap.utils.streaming import stream_json, stream_ndjson, wants_ndjson
+
+
+def make_jobs(n_jobs: int) -> Iterator[Job]:
+    return (Job(job_id=uuid4(), name=f"job {index}") for index in range(n_jobs))
+
+
+def failing_jobs() -> Iterator[Job]:
+    yield from make_jobs(3)
+    raise RuntimeError("connection lost")
+
+
+def test_stream_json_matches_response_schema() -> None:
+    job_list = list(make_jobs(5))
+    for n_jobs in [0, 5]:
+        body = "".join(stream_json("retrieved", "job_list", iter(job_list[:n_jobs]), 2))
+        expected = JobGetResponse(
+            msg="retrieved", items={"job_list": job_list[:n_jobs]}
+        )
+        assert json.loads(body) == json.loads(expected.json())
+
+
+def test_stream_reports_errors() -> None:
+    body = json.loads("".join(stream_json("retrieved", "job_list", failing_jobs(), 2)))
+    assert len(body["items"]["job_list"]) == 2
+    assert body["errors"] == {"main": ["unknown internal error"]}
+
+    lines = "".join(stream_ndjson("job_list", failing_jobs(), 2)).splitlines()
+    assert json.loads(lines[-1]) == {"errors": {"main": ["unknown internal error"]}}
+
+
+def test_stream_ndjson() -> None:
+    job_list = list(make_jobs(5))
+    lines = "".join(stream_ndjson("job_list", iter(job_list), 2)).splitlines()
+    assert [Job.parse_raw(line) for line in lines] == job_list
+
+
+def test_wants_ndjson() -> None:
+    app = Flask(__name__)
+    with app.test_request_context(headers={"Accept": "application/x-ndjson"}):
+        from flask import request
+
+        assert wants_ndjson(request)
+    with app.test_request_context(headers={"Accept": "*/*"}):
+        assert not wants_ndjson(request)
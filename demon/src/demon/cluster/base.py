@@ -1,12 +1,28 @@
 """Base cluster inteface."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
 
 from demon.schemas.job import Job
 from demon.schemas.schedule import Schedule
 
 
+@dataclass
+class SubmitResult:
+    """Outcome of submitting a single schedule."""
+
+    schedule: Schedule
+    job_id: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self: "SubmitResult") -> bool:
+        """Whether the schedule was submitted."""
+        return self.error is None
+
+
 class BaseCluster(ABC):
     """Base cluster interface."""
 
@@ -30,6 +46,36 @@ class BaseCluster(ABC):
         """
         pass
 
+    def submit_jobs(
+        self: "BaseCluster", schedules: List[Schedule], max_workers: int = 1
+    ) -> List[SubmitResult]:
+        """Submit many jobs to the cluster.
+
+        Clusters with a native batch submission should override this. The
+        default implementation calls submit_job for each schedule. A failed
+        submission does not stop the rest of the batch.
+
+        Args:
+            schedules (List[Schedule]): Schedule Objects
+            max_workers (int): Number of concurrent submissions. Defaults to 1. # noqa: E501
+
+        Returns:
+            List[SubmitResult]: Result of each schedule, in order
+        """
+
+        def submit(schedule: Schedule) -> SubmitResult:
+            try:
+                return SubmitResult(
+                    schedule=schedule, job_id=self.submit_job(schedule)
+                )
+            except Exception as e:
+                return SubmitResult(schedule=schedule, error=e)
+
+        if max_workers <= 1 or len(schedules) <= 1:
+            return [submit(schedule) for schedule in schedules]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(submit, schedules))
+
     @abstractmethod
     def get_job_status(self: "BaseCluster", job_id: str) -> List[str]:
         """Get status of a job by Job.
@@ -1,15 +1,121 @@
 """Slurm interface."""
 
-from os import makedirs
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from os import chmod, makedirs
 from pathlib import Path
-from typing import List
+import re
+from typing import Dict, List, Tuple
 
-from demon.cluster.base import BaseCluster
+from demon import global_config
+from demon.cluster.base import BaseCluster, SubmitResult
 from demon.schemas.schedule import Schedule
 from demon.utils.command import call_cli
 
+from logzero import logger
+
 from xdg import xdg_data_home
 
+# Slurm job states mapped to schedule statuses, any other state is a failure
+SLURM_STATES = {
+    "PENDING": "SUBMITTED",
+    "CONFIGURING": "SUBMITTED",
+    "REQUEUED": "SUBMITTED",
+    "RESIZING": "SUBMITTED",
+    "SUSPENDED": "SUBMITTED",
+    "RUNNING": "RUNNING",
+    "COMPLETING": "RUNNING",
+    "COMPLETED": "COMPLETED",
+}
+
+
+@dataclass
+class SlurmJobStatus:
+    """State of a Slurm job as reported by sacct."""
+
+    job_id: str
+    state: str
+    exit_code: str = ""
+
+    @property
+    def status(self: "SlurmJobStatus") -> str:
+        """Schedule status matching the Slurm state."""
+        return SLURM_STATES.get(self.state, "FAILED")
+
+
+def expand_job_ids(job_id: str) -> List[str]:
+    """Expand a pending job array like 45_[0-2,7%4] to its task IDs.
+
+    Args:
+        job_id (str): Job ID as printed by sacct
+
+    Returns:
+        List[str]: Job IDs of the array tasks, or the job ID itself
+    """
+    match = re.fullmatch(r"(\d+)_\[([^\]]+)\]", job_id)
+    if match is None:
+        return [job_id]
+    array_job_id, task_ranges = match.groups()
+    # Drop the max running tasks limit
+    task_ranges = task_ranges.split("%")[0]
+    job_ids = []
+    for task_range in task_ranges.split(","):
+        start, _, end = task_range.partition("-")
+        for task_id in range(int(start), int(end or start) + 1):
+            job_ids.append(f"{array_job_id}_{task_id}")
+    return job_ids
+
+
+def parse_sacct(output: str) -> Dict[str, SlurmJobStatus]:
+    """Parse `sacct --parsable2 --noheader --format JobID,State,ExitCode`.
+
+    Args:
+        output (str): Output of sacct
+
+    Returns:
+        Dict[str, SlurmJobStatus]: Status of each job by job ID
+    """
+    statuses = {}
+    for line in output.strip().splitlines():
+        fields = line.split("|")
+        if len(fields) < 3:
+            continue
+        job_id, state, exit_code = fields[:3]
+        # example: CANCELLED by 1000
+        state = state.split(" ")[0]
+        # Later records of a requeued job override the earlier ones
+        for task_job_id in expand_job_ids(job_id):
+            statuses[task_job_id] = SlurmJobStatus(
+                task_job_id, state, exit_code
+            )
+    return statuses
+
+
+def sbatch_directives(script: str) -> List[str]:
+    """Extract the #SBATCH directives from the header of a job script.
+
+    Args:
+        script (str): Job script
+
+    Returns:
+        List[str]: #SBATCH lines in the order they appear
+    """
+    lines = script.splitlines()
+    if len(lines) > 0 and lines[0].startswith("#!"):
+        lines = lines[1:]
+    directives = []
+    for line in lines:
+        line = line.strip()
+        if line == "":
+            continue
+        # sbatch stops reading directives at the first command
+        if not line.startswith("#"):
+            break
+        if line.startswith("#SBATCH"):
+            directives.append(line)
+    return directives
+
 
 class SlurmCluster(BaseCluster):
     """Slurm interface."""
@@ -84,7 +190,7 @@ class SlurmCluster(BaseCluster):
         output = call_cli(main_job_cmd_args_list)
 
         # example: Submitted batch job 45
-        main_job_id = output.split(" ")[-1]
+        main_job_id = output.strip().split(" ")[-1]
         # TODO: Fix notify scripts
         # Add notify jobs
         # notify_start_job_cmd_args_list = [
@@ -115,6 +221,123 @@ class SlurmCluster(BaseCluster):
         # call_cli(notify_not_ok_job_cmd_args_list)
         return main_job_id
 
+    def submit_job_array(
+        self: "SlurmCluster", schedules: List[Schedule]
+    ) -> List[SubmitResult]:
+        """Submit schedules sharing the same script as a single job array.
+
+        Each array task changes into the data dir of its own job and runs
+        the job script from there. Task i runs schedules[i], so its Slurm
+        job ID is <array job id>_<i>.
+
+        Args:
+            schedules (List[Schedule]): Schedule Objects with identical scripts
+
+        Raises:
+            ValueError: sbatch did not report a job ID
+
+        Returns:
+            List[SubmitResult]: Result of each schedule, in order
+        """
+        jobs_path: Path = xdg_data_home() / "orchestra" / "demon" / "jobs"
+        job_data_paths = []
+        for schedule in schedules:
+            self.prepare_job(schedule)
+            job_data_path = jobs_path / str(schedule.job.job_id)
+            chmod(job_data_path / "start.sh", 0o755)  # noqa: S103
+            job_data_paths.append(job_data_path.absolute())
+
+        array_data_path: Path = (
+            xdg_data_home()
+            / "orchestra"
+            / "demon"
+            / "arrays"
+            / str(schedules[0].schedule_id)
+        )
+        makedirs((array_data_path / "out"), exist_ok=True)
+        array_script_path: Path = array_data_path / "start.sh"
+        with open(array_script_path, "w+") as f:
+            f.write("#! /bin/bash\n")
+            # Options of the shared script apply to every task of the array
+            for directive in sbatch_directives(schedules[0].job.script):
+                f.write(f"{directive}\n")
+            f.write("JOB_DIRS=(\n")
+            for job_data_path in job_data_paths:
+                f.write(f'    "{job_data_path}"\n')
+            f.write(")\n")
+            f.write(
+                'cd "${JOB_DIRS[$SLURM_ARRAY_TASK_ID]}" && exec ./start.sh\n'
+            )
+
+        array_job_cmd_args_list = [
+            "sbatch",
+            f"--array=0-{len(schedules) - 1}",
+            "-o",
+            (array_data_path / "out" / "%A_%a.out").absolute(),
+            array_script_path.absolute(),
+        ]
+        output = call_cli(array_job_cmd_args_list)
+
+        # example: Submitted batch job 45
+        array_job_id = output.strip().split(" ")[-1]
+        if not array_job_id.isdigit():
+            raise ValueError(f"sbatch did not return a job id: {output}")
+        return [
+            SubmitResult(schedule=schedule, job_id=f"{array_job_id}_{index}")
+            for index, schedule in enumerate(schedules)
+        ]
+
+    def submit_jobs(
+        self: "SlurmCluster", schedules: List[Schedule], max_workers: int = 1
+    ) -> List[SubmitResult]:
+        """Submit many jobs to the cluster.
+
+        Schedules whose jobs have identical scripts are submitted together
+        as job arrays of up to SLURM_MAX_ARRAY_SIZE tasks. The remaining
+        schedules, and the ones of arrays that failed to submit, are
+        submitted one by one.
+
+        Args:
+            schedules (List[Schedule]): Schedule Objects
+            max_workers (int): Number of concurrent individual submissions. Defaults to 1. # noqa: E501
+
+        Returns:
+            List[SubmitResult]: Result of each schedule, in order
+        """
+        groups: Dict[str, List[Tuple[int, Schedule]]] = defaultdict(list)
+        for index, schedule in enumerate(schedules):
+            groups[schedule.job.script].append((index, schedule))
+
+        results: Dict[int, SubmitResult] = {}
+        singles: List[Tuple[int, Schedule]] = []
+        array_size = global_config.SLURM_MAX_ARRAY_SIZE
+        for group in groups.values():
+            for start in range(0, len(group), array_size):
+                chunk = group[start : start + array_size]  # noqa: E203
+                if len(chunk) < 2:
+                    singles.extend(chunk)
+                    continue
+                try:
+                    array_results = self.submit_job_array(
+                        [schedule for _, schedule in chunk]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Job array submission failed, "
+                        f"submitting jobs one by one: {e}"
+                    )
+                    singles.extend(chunk)
+                    continue
+                for (index, _), result in zip(chunk, array_results):
+                    results[index] = result
+
+        single_results = super().submit_jobs(
+            [schedule for _, schedule in singles], max_workers
+        )
+        for (index, _), result in zip(singles, single_results):
+            results[index] = result
+        return [results[index] for index in range(len(schedules))]
+
     def get_job_status(self: "SlurmCluster", job_id: str) -> List[str]:
         """Get status of a job by Job.
 
@@ -136,3 +359,41 @@ class SlurmCluster(BaseCluster):
         output = call_cli(cmd_args_list)
         job_status_list = [status for status in output.strip().split("\n")[2:]]
         return job_status_list
+
+    def get_jobs_status(
+        self: "SlurmCluster", job_ids: List[str]
+    ) -> Dict[str, SlurmJobStatus]:
+        """Get status of many jobs with a single sacct call.
+
+        Only jobs started within the last SLURM_SACCT_WINDOW_DAYS days are
+        looked up, jobs missing from the accounting are left out.
+
+        Args:
+            job_ids (List[str]): IDs of the jobs
+
+        Returns:
+            Dict[str, SlurmJobStatus]: Status of each job by job ID
+        """
+        if len(job_ids) == 0:
+            return {}
+        start_time = datetime.now() - timedelta(
+            days=global_config.SLURM_SACCT_WINDOW_DAYS
+        )
+        cmd_args_list = [
+            "sacct",
+            "--parsable2",
+            "--noheader",
+            "--allocations",
+            "--starttime",
+            start_time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "--format",
+            "JobID,State,ExitCode",
+            "--jobs",
+            ",".join(job_ids),
+        ]
+        statuses = parse_sacct(call_cli(cmd_args_list))
+        return {
+            job_id: statuses[job_id]
+            for job_id in job_ids
+            if job_id in statuses
+        }
@@ -21,10 +21,25 @@ class BaseConfig(ABC, BaseSettings):
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     MESSENGER = "GCP"
     CLUSTER = "SLURM"
+    SLURM_MAX_ARRAY_SIZE = 1000
+    SLURM_SACCT_WINDOW_DAYS = 7
+    SLURM_STATUS_POLL_INTERVAL = 30.0
+    SLURM_STATUS_POLL_BATCH_SIZE = 500
+    CLI_COMMAND_TIMEOUT = 120.0
+    CLI_MAX_CONCURRENT_COMMANDS = 16
     GOOGLE_APPLICATION_CREDENTIALS = "./keys.json"
     GCP_PROJECT_ID = "YOUR_GCP_PROJECT_ID"
     GCP_PUBSUB_TOPIC = "test-topic"
     GCP_PUBSUB_SUB_ID = "test-sub"
+    GCP_PUBSUB_MAX_OUTSTANDING_MSGS = 100
+    GCP_PUBSUB_MAX_OUTSTANDING_BYTES = 100 * 1024 * 1024
+    GCP_PUBSUB_CALLBACK_WORKERS = 10
+    GCP_PUBSUB_INGEST_BATCH_SIZE = 100
+    GCP_PUBSUB_INGEST_MAX_LATENCY = 0.05
+    SUBMIT_BATCH_SIZE = 50
+    SUBMIT_CONCURRENCY = 8
+    SUBMIT_ON_INGEST = True
+    SUBMIT_SWEEP_INTERVAL = 300.0
     CELERY_BROKER_URL = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND = "redis://localhost:6379/0"
 
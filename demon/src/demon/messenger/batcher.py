@@ -0,0 +1,89 @@
+"""Micro-batching of received msgs."""
+
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from logzero import logger
+
+
+class MsgBatcher:
+    """Buffer msgs and hand them to a flush function in batches.
+
+    A batch is flushed as soon as it holds max_batch_size msgs or its oldest
+    msg has waited max_latency seconds, whichever comes first. Flushes run on
+    a single background thread, one batch at a time.
+    """
+
+    def __init__(
+        self: "MsgBatcher",
+        flush: Callable[[List[Any]], None],
+        max_batch_size: int = 500,
+        max_latency: float = 0.05,
+    ) -> None:
+        """Initialize batcher.
+
+        Args:
+            flush (Callable[[List[Any]], None]): Function to call with each batch # noqa: E501
+            max_batch_size (int): Max msgs per batch. Defaults to 500.
+            max_latency (float): Max seconds a msg waits in the buffer. Defaults to 0.05. # noqa: E501
+        """
+        self.flush = flush
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._condition = threading.Condition()
+        self._buffer: List[Any] = []
+        self._oldest: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self: "MsgBatcher", msg: Any) -> None:
+        """Add a msg to the current batch.
+
+        Args:
+            msg (Any): Msg to buffer
+        """
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="msg-batcher", daemon=True
+                )
+                self._thread.start()
+            if not self._buffer:
+                self._oldest = time.monotonic()
+            self._buffer.append(msg)
+            self._condition.notify()
+
+    def _next_batch(self: "MsgBatcher") -> List[Any]:
+        """Wait for a full or expired batch and take it from the buffer.
+
+        Returns:
+            List[Any]: Msgs of the batch
+        """
+        with self._condition:
+            while True:
+                if self._buffer:
+                    if len(self._buffer) >= self.max_batch_size:
+                        break
+                    remaining = (
+                        self._oldest + self.max_latency - time.monotonic()
+                    )
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                else:
+                    self._condition.wait()
+            batch = self._buffer[: self.max_batch_size]
+            self._buffer = self._buffer[self.max_batch_size :]  # noqa: E203
+            self._oldest = time.monotonic() if self._buffer else None
+            return batch
+
+    def _run(self: "MsgBatcher") -> None:
+        """Flush batches forever."""
+        while True:
+            batch = self._next_batch()
+            try:
+                self.flush(batch)
+            except Exception as e:
+                logger.error(
+                    f"Failed to flush batch of {len(batch)} msgs: {e}"
+                )
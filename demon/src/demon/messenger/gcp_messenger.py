@@ -1,11 +1,13 @@
 """GCP implementation of messenger."""
 
+from concurrent.futures import ThreadPoolExecutor
 import json
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from demon import DBSession
+from demon import celery_app, DBSession
 from demon.configs.base import BaseConfig
 from demon.messenger.base import BaseMessenger
+from demon.messenger.batcher import MsgBatcher
 from demon.models.job import JobDB
 from demon.models.schedule import ScheduleDB
 from demon.schemas.message import Message, MessageType
@@ -16,11 +18,10 @@ from demon.utils.json_encoders import UUIDEncoder
 from google.auth import jwt
 from google.cloud import pubsub_v1
 from google.cloud.pubsub_v1.subscriber.message import Message as GCPMessage
+from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
 
 from logzero import logger
 
-from sqlalchemy.sql.expression import select
-
 
 class GCPMessenger(BaseMessenger):
     """GCP(Pub/Sub) implementation of Messenger."""
@@ -57,6 +58,26 @@ class GCPMessenger(BaseMessenger):
         )  # noqa: E501
         self.project_id = config.GCP_PROJECT_ID
 
+        # Bound the msgs leased at once and the threads running callbacks so
+        # a burst of schedules can't exhaust the DB connection pool
+        self.flow_control = pubsub_v1.types.FlowControl(
+            max_messages=config.GCP_PUBSUB_MAX_OUTSTANDING_MSGS,
+            max_bytes=config.GCP_PUBSUB_MAX_OUTSTANDING_BYTES,
+        )
+        self.callback_workers = config.GCP_PUBSUB_CALLBACK_WORKERS
+
+        # Saved schedules are submitted right away instead of waiting for
+        # the periodic sweep
+        self.submit_on_ingest = config.SUBMIT_ON_INGEST
+        self.submit_batch_size = config.SUBMIT_BATCH_SIZE
+
+        # Schedule msgs are saved in batches, see process_schedule_msg
+        self.schedule_batcher = MsgBatcher(
+            self.save_schedule_msgs,
+            max_batch_size=config.GCP_PUBSUB_INGEST_BATCH_SIZE,
+            max_latency=config.GCP_PUBSUB_INGEST_MAX_LATENCY,
+        )
+
     def publish(self: "GCPMessenger", msg: Message, topic_id: str) -> str:
         """Publish msg on the GCP Pub/Sub queue.
 
@@ -93,9 +114,12 @@ class GCPMessenger(BaseMessenger):
             self.project_id, sub_id
         )  # noqa: E501
 
+        executor = ThreadPoolExecutor(max_workers=self.callback_workers)
         streaming_pull_future = self.subscriber.subscribe(
             subscription_path,
             callback=callback,
+            flow_control=self.flow_control,
+            scheduler=ThreadScheduler(executor=executor),
             await_callbacks_on_shutdown=True,  # noqa: E501
         )
 
@@ -108,34 +132,133 @@ class GCPMessenger(BaseMessenger):
     def process_schedule_msg(self: "GCPMessenger", msg: GCPMessage) -> None:
         """Process Schedule Pub/Sub msgs.
 
+        Msgs are buffered for a few milliseconds and saved in batches by
+        save_schedule_msgs.
+
         Args:
             msg (GCPMessage): Pub/Sub Msg
         """
-        parsed_msg = Message.parse_raw(msg.data)
-        if parsed_msg.msg_type == MessageType.TO_DEMON_SCHEDULE_MSG.value:
-            logger.info(f"Recieved msg: {parsed_msg.dict()}")
-            schedule = Schedule(**parsed_msg.data)
-            # Check if job already exists
-            stmt = select(JobDB).where(JobDB.id == schedule.job_id)
-            with DBSession() as session:
-                fetched_jobs = session.execute(stmt).scalars().all()
-                if len(fetched_jobs) == 0:
-                    # Create the job
-                    jobdb = JobDB(
-                        id=schedule.job_id,
-                        protagonist_id=schedule.user_id,
-                        **schedule.job.dict(exclude={"job_id"}),  # noqa: E501
+        self.schedule_batcher.add(msg)
+
+    def parse_schedule_msgs(
+        self: "GCPMessenger", msgs: List[GCPMessage]
+    ) -> Tuple[List[Schedule], List[GCPMessage]]:
+        """Parse Pub/Sub msgs into schedules with their job.
+
+        Msgs that can't be parsed or whose schedule has no job are nacked.
+        Msgs that are not schedule msgs are skipped.
+
+        Args:
+            msgs (List[GCPMessage]): Pub/Sub Msgs
+
+        Returns:
+            Tuple[List[Schedule], List[GCPMessage]]: Schedules and their msgs
+        """
+        schedules: List[Schedule] = []
+        schedule_msgs: List[GCPMessage] = []
+        for msg in msgs:
+            try:
+                parsed_msg = Message.parse_raw(msg.data)
+                msg_type = parsed_msg.msg_type
+                if msg_type != MessageType.TO_DEMON_SCHEDULE_MSG.value:
+                    continue
+                logger.info(f"Recieved msg: {parsed_msg.dict()}")
+                schedule = Schedule(**parsed_msg.data)
+                if schedule.job is None:
+                    raise ValueError(
+                        f"Schedule {schedule.schedule_id} has no job"
                     )
-                    jobdb.save(session)
-                # Create schedule
-                scheduledb = ScheduleDB(
-                    id=schedule.schedule_id,
-                    job_id=schedule.job_id,
-                    protagonist_id=schedule.user_id,
-                )
-                scheduledb.save(session)
+            except Exception as e:
+                logger.error(f"Failed to parse schedule msg. Error: {e}")
+                msg.nack()
+                continue
+            schedules.append(schedule)
+            schedule_msgs.append(msg)
+        return schedules, schedule_msgs
+
+    def save_schedules(
+        self: "GCPMessenger", schedules: List[Schedule]
+    ) -> None:
+        """Save jobs and schedules in one transaction.
+
+        Jobs and schedules that already exist are skipped so redelivered msgs
+        are harmless.
+
+        Args:
+            schedules (List[Schedule]): Schedules with their job
+        """
+        jobs: Dict[str, Dict] = {
+            str(schedule.job_id): dict(
+                id=schedule.job_id,
+                protagonist_id=schedule.user_id,
+                **schedule.job.dict(exclude={"job_id"}),  # noqa: E501
+            )
+            for schedule in schedules
+        }
+        schedule_rows = [
+            dict(
+                id=schedule.schedule_id,
+                job_id=schedule.job_id,
+                protagonist_id=schedule.user_id,
+            )
+            for schedule in schedules
+        ]
+        with DBSession() as session:
+            JobDB.bulk_insert_ignore(
+                list(jobs.values()), session, commit=False
+            )
+            ScheduleDB.bulk_insert_ignore(schedule_rows, session, commit=False)
+            session.commit()
+
+    def save_schedule_msgs(
+        self: "GCPMessenger", msgs: List[GCPMessage]
+    ) -> None:
+        """Save jobs and schedules from a batch of Pub/Sub msgs.
+
+        Msgs that can't be parsed are nacked on their own. The others are
+        acked only once their transaction is committed and nacked if it fails.
+
+        Args:
+            msgs (List[GCPMessage]): Pub/Sub Msgs
+        """
+        schedules, to_ack = self.parse_schedule_msgs(msgs)
+        if len(to_ack) == 0:
+            return
+        try:
+            self.save_schedules(schedules)
+        except Exception as e:
+            logger.error(
+                f"Failed to save {len(to_ack)} schedule msgs. Error: {e}"
+            )
+            for msg in to_ack:
+                msg.nack()
+            return
+        for msg in to_ack:
             msg.ack()
 
+        if self.submit_on_ingest:
+            self.enqueue_submission(len(schedules))
+
+    def enqueue_submission(self: "GCPMessenger", n_schedules: int) -> None:
+        """Enqueue tasks submitting newly saved schedules to the cluster.
+
+        One task is enqueued per SUBMIT_BATCH_SIZE schedules. The tasks claim
+        pending schedules with SKIP LOCKED so they split the work between
+        them. If enqueueing fails the periodic sweep submits the schedules.
+
+        Args:
+            n_schedules (int): Number of saved schedules
+        """
+        n_tasks = -(-n_schedules // self.submit_batch_size)
+        try:
+            for _ in range(n_tasks):
+                # Sent by name as the task module imports this messenger
+                celery_app.send_task(
+                    "demon.tasks.pub_cluster.publish_slurm_job_from_db"
+                )
+        except Exception as e:
+            logger.error(f"Failed to enqueue submission task. Error: {e}")
+
     def echo_msg(self: "GCPMessenger", msg: Message) -> None:
         """Echo msgs to stdout.
 
@@ -2,11 +2,12 @@
 
 import uuid
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from conductor.models.meta.helpers import GUID
 
 from sqlalchemy import Column, DateTime, Integer
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm.session import Session
 
@@ -58,6 +59,27 @@ class CRUDMixin(object):
         DBSession.commit()
         return True
 
+    @classmethod
+    def bulk_insert_ignore(
+        cls: Any, rows: List[Dict], DBSession: Session, commit: bool = True
+    ) -> None:
+        """Insert rows in one statement, skipping rows whose key already exists.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING.
+
+        Args:
+            rows (List[Dict]): Column values of the rows to insert
+            DBSession: (Session): database session to use
+            commit (bool): Flag to control commit behaviour. Defaults to True. # noqa: E501
+        """
+        if len(rows) == 0:
+            return
+        dialect = DBSession.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        DBSession.execute(insert(cls).values(rows).on_conflict_do_nothing())
+        if commit:
+            DBSession.commit()
+
     def update(
         self: "CRUDMixin",
         DBSession: Session,
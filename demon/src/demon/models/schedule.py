@@ -24,3 +24,5 @@ class ScheduleDB(DBModel, TimestampMixin, SurrogatePKUUID):
     started_at = Column(DateTime(timezone=True), nullable=True)
     finished_at = Column(DateTime(timezone=True), nullable=True)
     protagonist_id = Column(String(), nullable=False)
+    # ID of the job on the cluster, set once the schedule is submitted
+    cluster_job_id = Column(String(), nullable=True)
@@ -1,5 +1,6 @@
 """Demon tasks."""
 
 from demon.tasks.periodic_db import setup_periodic_tasks  # noqa: F401
+from demon.tasks.poll_cluster import poll_slurm_job_status  # noqa: F401
 from demon.tasks.pub_cluster import publish_slurm_job_from_db  # noqa: F401
 from demon.tasks.pub_messenger import publish_messenger  # noqa: F401
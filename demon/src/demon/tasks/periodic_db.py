@@ -2,7 +2,8 @@
 
 from typing import Any
 
-from demon import celery_app
+from demon import celery_app, global_config
+from demon.tasks.poll_cluster import poll_slurm_job_status
 from demon.tasks.pub_cluster import publish_slurm_job_from_db
 
 
@@ -14,7 +15,20 @@ def setup_periodic_tasks(sender: Any, **kwargs: Any) -> None:
         sender (Any): Sender
         **kwargs (Any): Kwargs
     """
-    # Calls publish_slurm_job_from_db() every 10 seconds.
+    if global_config.SUBMIT_ON_INGEST:
+        # Schedules are submitted as soon as they are saved, the sweep only
+        # picks up the ones whose submission task was lost.
+        interval = global_config.SUBMIT_SWEEP_INTERVAL
+    else:
+        interval = 10.0
     sender.add_periodic_task(
-        10.0, publish_slurm_job_from_db.s(), name="Submit jobs every 10s"
+        interval,
+        publish_slurm_job_from_db.s(),
+        name=f"Submit jobs every {interval:g}s",
+    )
+    # Polls the status of all submitted jobs with a single sacct call
+    sender.add_periodic_task(
+        global_config.SLURM_STATUS_POLL_INTERVAL,
+        poll_slurm_job_status.s(),
+        name="Poll job status",
     )
@@ -0,0 +1,84 @@
+"""Cluster status polling tasks."""
+
+from datetime import datetime
+from typing import Dict, List
+
+from demon import celery_app, DBSession, global_config
+from demon.extentions import cluster
+from demon.models.schedule import ScheduleDB
+from demon.schemas.message import Message, MessageType
+from demon.schemas.schedule import Schedule
+from demon.tasks.pub_messenger import publish_messenger
+
+from logzero import logger
+
+from sqlalchemy import select
+
+
+@celery_app.task
+def poll_slurm_job_status() -> Dict[str, str]:
+    """Poll the status of submitted schedules and notify conductor of changes.
+
+    The status of every submitted or running schedule is fetched with one
+    sacct call per SLURM_STATUS_POLL_BATCH_SIZE schedules. Only schedules
+    whose status changed are updated and published to conductor.
+
+    Returns:
+        Dict[str, str]: New status of each changed schedule by schedule id
+    """
+    stmt = select(ScheduleDB).where(
+        ScheduleDB.status.in_(["SUBMITTED", "RUNNING"]),
+        ScheduleDB.cluster_job_id.is_not(None),
+    )
+    changed: Dict[str, str] = {}
+    with DBSession() as session:
+        active_schedules: List[ScheduleDB] = (
+            session.execute(stmt).scalars().all()
+        )
+        logger.info(f"Active schedules: {len(active_schedules)}")
+        batch_size = global_config.SLURM_STATUS_POLL_BATCH_SIZE
+        for start in range(0, len(active_schedules), batch_size):
+            batch = active_schedules[start : start + batch_size]  # noqa: E203
+            try:
+                job_statuses = cluster.get_jobs_status(
+                    [scheduledb.cluster_job_id for scheduledb in batch]
+                )
+            except Exception as e:
+                logger.error(f"Failed to poll job status. Error: {e}")
+                continue
+            for scheduledb in batch:
+                job_status = job_statuses.get(scheduledb.cluster_job_id)
+                if (
+                    job_status is None
+                    or job_status.status == scheduledb.status
+                ):
+                    continue
+                now = datetime.utcnow()
+                if job_status.status == "RUNNING":
+                    scheduledb.started_at = now
+                elif job_status.status in ("COMPLETED", "FAILED"):
+                    scheduledb.finished_at = now
+                scheduledb.update(
+                    session, commit=False, status=job_status.status
+                )
+                changed[str(scheduledb.id)] = job_status.status
+        session.commit()
+
+        for scheduledb in active_schedules:
+            if str(scheduledb.id) not in changed:
+                continue
+            # Notify conductor about the new status
+            publish_messenger(
+                Message(
+                    msg_type=MessageType.TO_CONDUCTOR_JOB_STATUS_UPDATE,
+                    data=Schedule(
+                        schedule_id=scheduledb.id,
+                        **scheduledb.to_dict(),
+                    ),
+                    timestamp=str(datetime.now()),
+                ).dict(),
+                topic_id=global_config.GCP_PUBSUB_TOPIC,
+            )
+
+    logger.info(f"Changed schedules: {changed}")
+    return changed
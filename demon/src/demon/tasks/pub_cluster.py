@@ -1,7 +1,7 @@
 """Publish tasks."""
 
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
 from demon import DBSession, celery_app, global_config
 from demon.extentions import cluster
@@ -18,49 +18,111 @@ from sqlalchemy import select
 
 
 @celery_app.task
-def publish_slurm_job_from_db() -> None:
-    """Check for pending tasks in db and publish to slurm."""
-    pending_schedules = []
-    stmt = select(ScheduleDB).where(ScheduleDB.status == "PENDING")
+def publish_slurm_job_from_db(
+    batch_size: Optional[int] = None,
+) -> Dict[str, str]:
+    """Check for pending tasks in db and publish to slurm.
+
+    Claims up to batch_size pending schedules with SELECT ... FOR UPDATE
+    SKIP LOCKED, so concurrent workers never pick the same schedules, and
+    submits them with cluster.submit_jobs. The row locks are held until
+    the new statuses are committed, so schedules of a crashed worker
+    simply become pending again. A full batch enqueues the task again to drain
+    the rest of the backlog.
+
+    Args:
+        batch_size (Optional[int]): Max schedules to submit. Defaults to SUBMIT_BATCH_SIZE. # noqa: E501
+
+    Returns:
+        Dict[str, str]: New status of each claimed schedule by schedule id
+    """
+    if batch_size is None:
+        batch_size = global_config.SUBMIT_BATCH_SIZE
+    stmt = (
+        select(ScheduleDB)
+        .where(ScheduleDB.status == "PENDING")
+        .order_by(ScheduleDB.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
     with DBSession() as session:
         pending_schedules: List[ScheduleDB] = (
             session.execute(stmt).scalars().all()
         )  # noqa: E501
-        logger.info(f"Pending schedules: {len(pending_schedules)}")
-        if len(pending_schedules) != 0:
-            # fetch job
-            stmt = select(JobDB).where(JobDB.id == pending_schedules[0].job_id)
-            fetched_jobs = session.execute(stmt).scalars().all()
-            if len(fetched_jobs) != 0:
-                cluster.submit_job(
-                    Schedule(
-                        schedule_id=pending_schedules[0].id,
-                        job_id=pending_schedules[0].job_id,
-                        job=Job(
-                            job_id=pending_schedules[0].job_id,
-                            **fetched_jobs[0].to_dict(),
-                        ),
-                    )
-                )
-                pending_schedules[0].update(session, status="SUBMITTED")
-
-                # Notify conductor that job is submitted
-                publish_messenger(
-                    Message(
-                        msg_type=MessageType.TO_CONDUCTOR_JOB_STATUS_UPDATE,
-                        data=Schedule(
-                            schedule_id=pending_schedules[0].id,
-                            **pending_schedules[0].to_dict(),
-                        ),
-                        timestamp=str(datetime.now()),
-                    ).dict(),
-                    topic_id=global_config.GCP_PUBSUB_TOPIC,
-                )
-            else:
+        logger.info(f"Claimed pending schedules: {len(pending_schedules)}")
+        if len(pending_schedules) == 0:
+            session.commit()
+            return {}
+
+        # fetch jobs
+        job_ids = {scheduledb.job_id for scheduledb in pending_schedules}
+        stmt = select(JobDB).where(JobDB.id.in_(job_ids))
+        jobs = {jobdb.id: jobdb for jobdb in session.execute(stmt).scalars()}
+
+        statuses: Dict[str, str] = {}
+        cluster_job_ids: Dict[str, str] = {}
+        schedules: List[Schedule] = []
+        for scheduledb in pending_schedules:
+            jobdb = jobs.get(scheduledb.job_id)
+            if jobdb is None:
                 logger.error(
                     f"""
                     Unable to find job from schedule!!!
-                    Schedule ID: {pending_schedules[0].id},
-                    Job ID: {pending_schedules[0].job_id}
+                    Schedule ID: {scheduledb.id},
+                    Job ID: {scheduledb.job_id}
                     """
                 )
+                statuses[str(scheduledb.id)] = "FAILED"
+                continue
+            schedules.append(
+                Schedule(
+                    schedule_id=scheduledb.id,
+                    job_id=scheduledb.job_id,
+                    job=Job(job_id=scheduledb.job_id, **jobdb.to_dict()),
+                )
+            )
+
+        # Schedules of identical scripts are submitted as job arrays
+        for result in cluster.submit_jobs(
+            schedules, max_workers=global_config.SUBMIT_CONCURRENCY
+        ):
+            schedule_id = str(result.schedule.schedule_id)
+            if result.ok:
+                statuses[schedule_id] = "SUBMITTED"
+                cluster_job_ids[schedule_id] = result.job_id
+            else:
+                logger.error(
+                    f"Failed to submit schedule {schedule_id}. "
+                    f"Error: {result.error}"
+                )
+                statuses[schedule_id] = "FAILED"
+
+        for scheduledb in pending_schedules:
+            scheduledb.update(
+                session,
+                commit=False,
+                status=statuses[str(scheduledb.id)],
+                cluster_job_id=cluster_job_ids.get(str(scheduledb.id)),
+            )
+        session.commit()
+
+        for scheduledb in pending_schedules:
+            # Notify conductor about the submission
+            publish_messenger(
+                Message(
+                    msg_type=MessageType.TO_CONDUCTOR_JOB_STATUS_UPDATE,
+                    data=Schedule(
+                        schedule_id=scheduledb.id,
+                        **scheduledb.to_dict(),
+                    ),
+                    timestamp=str(datetime.now()),
+                ).dict(),
+                topic_id=global_config.GCP_PUBSUB_TOPIC,
+            )
+
+    logger.info(f"Submission results: {statuses}")
+
+    if len(pending_schedules) == batch_size:
+        # There may be more pending schedules, keep draining them
+        publish_slurm_job_from_db.delay(batch_size)
+    return statuses
@@ -1,15 +1,20 @@
 """CLI commnad util functions."""
 
 
-import subprocess  # noqa: S404
-import sys
 from typing import List, Optional, Union
 
 from demon.configs import get_config
 from demon.configs.base import BaseConfig
+from demon.utils.command_runner import CommandRunner
 
 default_config = get_config()
 
+# Shared by every CLI call of the process
+command_runner = CommandRunner(
+    max_concurrency=default_config.CLI_MAX_CONCURRENT_COMMANDS,
+    default_timeout=default_config.CLI_COMMAND_TIMEOUT,
+)
+
 
 def call_cli(
     cmd: List[str],
@@ -22,19 +27,10 @@ def call_cli(
     Args:
         cmd (List[str]): [description]
         input (Optional[str]): [description]. Defaults to None.
-        timeout (Optional[float]): [description]. Defaults to None.
+        timeout (Optional[float]): [description]. Defaults to CLI_COMMAND_TIMEOUT. # noqa: E501
         config (BaseConfig): [description]. Defaults to default_config.
 
     Returns:
         Union[str, bytes]: Stdout
     """
-    proc = subprocess.Popen(  # noqa: S603
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        encoding="utf-8",
-        errors="replace",
-    )
-    stdout, stderr = proc.communicate(input=input, timeout=timeout)
-    sys.stderr.write(stderr)
-    return stdout
+    return command_runner.run_sync(cmd, input=input, timeout=timeout).stdout
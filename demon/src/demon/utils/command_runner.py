@@ -0,0 +1,280 @@
+"""Concurrent runner for CLI commands."""
+
+import asyncio
+from bisect import bisect_left
+from concurrent.futures import Future
+from dataclasses import dataclass
+from math import inf
+import os
+from pathlib import Path
+import subprocess  # noqa: S404
+import threading
+import time
+from typing import Any, Coroutine, Dict, List, Optional, Sequence, Union
+
+from logzero import logger
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, inf)
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a CLI command."""
+
+    cmd: List[str]
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float
+
+
+class LatencyHistogram:
+    """Thread safe histogram of command latencies, per command name."""
+
+    def __init__(
+        self: "LatencyHistogram", buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> None:
+        """Initialize histogram.
+
+        Args:
+            buckets (Sequence[float]): Sorted bucket upper bounds in seconds.
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+
+    def observe(self: "LatencyHistogram", name: str, seconds: float) -> None:
+        """Record a latency.
+
+        Args:
+            name (str): Command name
+            seconds (float): Latency in seconds
+        """
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            counts = self._counts.setdefault(name, [0] * len(self.buckets))
+            counts[index] += 1
+            self._sums[name] = self._sums.get(name, 0.0) + seconds
+
+    def snapshot(self: "LatencyHistogram") -> Dict[str, Dict[str, Any]]:
+        """Get the recorded latencies.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Count, sum and per bucket counts by command name # noqa: E501
+        """
+        with self._lock:
+            return {
+                name: {
+                    "count": sum(counts),
+                    "sum": self._sums[name],
+                    "buckets": dict(zip(self.buckets, counts)),
+                }
+                for name, counts in self._counts.items()
+            }
+
+
+class CommandRunner:
+    """Run CLI commands on a background asyncio loop.
+
+    At most max_concurrency commands run at once across all threads of the
+    process. Commands exceeding their timeout are killed. Both coroutine and
+    blocking APIs are provided, the blocking ones can be called from any
+    thread.
+    """
+
+    def __init__(
+        self: "CommandRunner",
+        max_concurrency: int = 16,
+        default_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize runner.
+
+        Args:
+            max_concurrency (int): Max commands running at once. Defaults to 16.
+            default_timeout (Optional[float]): Timeout of commands in seconds. Defaults to None. # noqa: E501
+        """
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.latency = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pid = os.getpid()
+
+    @property
+    def loop(self: "CommandRunner") -> asyncio.AbstractEventLoop:
+        """Background event loop running the commands."""
+        with self._lock:
+            # The loop thread does not survive a fork
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="command-runner", daemon=True
+                ).start()
+                self._loop = loop
+                self._semaphore = None
+                self._pid = os.getpid()
+            return self._loop
+
+    def _submit(self: "CommandRunner", coro: Coroutine) -> Future:
+        """Schedule a coroutine on the background loop.
+
+        Args:
+            coro (Coroutine): Coroutine to run
+
+        Returns:
+            Future: Future of the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def _run(
+        self: "CommandRunner",
+        cmd: List[str],
+        input: Optional[str],
+        timeout: Optional[float],
+    ) -> CommandResult:
+        """Run a command on the background loop.
+
+        Args:
+            cmd (List[str]): Command and its arguments
+            input (Optional[str]): Data sent to stdin
+            timeout (Optional[float]): Timeout in seconds
+
+        Raises:
+            TimeoutExpired: Command did not finish within timeout
+
+        Returns:
+            CommandResult: Outcome of the command
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        name = Path(str(cmd[0])).name
+        async with self._semaphore:
+            start = time.perf_counter()
+            proc = await asyncio.create_subprocess_exec(
+                *[str(arg) for arg in cmd],
+                stdin=(
+                    subprocess.PIPE
+                    if input is not None
+                    else subprocess.DEVNULL
+                ),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(
+                        input.encode("utf-8") if input is not None else None
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                duration = time.perf_counter() - start
+                self.latency.observe(name, duration)
+                logger.error(
+                    f"Command killed after timeout: cmd={name} timeout={timeout}"
+                )
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            duration = time.perf_counter() - start
+
+        self.latency.observe(name, duration)
+        result = CommandResult(
+            cmd=cmd,
+            returncode=proc.returncode,
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace"),
+            duration=duration,
+        )
+        if result.returncode != 0 or result.stderr != "":
+            logger.warning(
+                f"Command stderr: cmd={name} returncode={result.returncode} "
+                f"duration={duration:.3f}s stderr={result.stderr.strip()!r}"
+            )
+        return result
+
+    async def run(
+        self: "CommandRunner",
+        cmd: List[str],
+        input: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> CommandResult:
+        """Run a command.
+
+        Args:
+            cmd (List[str]): Command and its arguments
+            input (Optional[str]): Data sent to stdin. Defaults to None.
+            timeout (Optional[float]): Timeout in seconds. Defaults to default_timeout. # noqa: E501
+
+        Returns:
+            CommandResult: Outcome of the command
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        return await asyncio.wrap_future(
+            self._submit(self._run(cmd, input, timeout))
+        )
+
+    async def run_many(
+        self: "CommandRunner",
+        cmds: List[List[str]],
+        timeout: Optional[float] = None,
+    ) -> List[Union[CommandResult, Exception]]:
+        """Run commands concurrently.
+
+        Args:
+            cmds (List[List[str]]): Commands and their arguments
+            timeout (Optional[float]): Timeout of each command in seconds. Defaults to default_timeout. # noqa: E501
+
+        Returns:
+            List[Union[CommandResult, Exception]]: Outcome of each command # noqa: E501
+        """
+        return await asyncio.gather(
+            *[self.run(cmd, timeout=timeout) for cmd in cmds],
+            return_exceptions=True,
+        )
+
+    def run_sync(
+        self: "CommandRunner",
+        cmd: List[str],
+        input: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> CommandResult:
+        """Run a command, blocking until it is done.
+
+        Args:
+            cmd (List[str]): Command and its arguments
+            input (Optional[str]): Data sent to stdin. Defaults to None.
+            timeout (Optional[float]): Timeout in seconds. Defaults to default_timeout. # noqa: E501
+
+        Returns:
+            CommandResult: Outcome of the command
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        return self._submit(self._run(cmd, input, timeout)).result()
+
+    def run_many_sync(
+        self: "CommandRunner",
+        cmds: List[List[str]],
+        timeout: Optional[float] = None,
+    ) -> List[Union[CommandResult, Exception]]:
+        """Run commands concurrently, blocking until all are done.
+
+        Args:
+            cmds (List[List[str]]): Commands and their arguments
+            timeout (Optional[float]): Timeout of each command in seconds. Defaults to default_timeout. # noqa: E501
+
+        Returns:
+            List[Union[CommandResult, Exception]]: Outcome of each command # noqa: E501
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        futures = [self._submit(self._run(cmd, None, timeout)) for cmd in cmds]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results